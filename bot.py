@@ -11,17 +11,25 @@ from config import Config
 from dms.steam_link import SteamLinkView
 from dms.recruit_channels import ensure_recruit_channels
 from dms.recruit_moderation import send_recruit_moderation_embed
+from dms.recruit_moderation import PERSISTENT_ITEMS as MODERATION_ITEMS
+from dms.onboarding_flow import PERSISTENT_ITEMS as ONBOARDING_ITEMS
 from commands.help import EmbedHelpCommand
 from database.db import Base, engine
 from database import models
+from database.profile_sync import profile_refresher
+from database.uow import UnitOfWork, interaction_scope
 from dms.steam_link import SteamLinkView
 from database.service import (
     get_or_create_user_from_member,
-    update_discord_profile,
-    set_recruit_status,
+    warm_language_cache,
+    warm_user_caches,
 )
 from dms.localization import t
 from utils.lang import get_lang_for_member, get_lang_for_user
+from utils.channels import channel_index
+from utils.members import member_resolver
+from utils.rest_metrics import rest_metrics
+from utils.shard_metrics import shard_metrics
 
 
 # Configure bot intents
@@ -30,34 +38,62 @@ intents.message_content = True
 intents.members = True
 intents.presences = False
 
-# Initialize bot
-bot = commands.Bot(
+# Initialize bot; with SHARDING one process runs several gateway connections
+bot_options = dict(
     command_prefix=Config.PREFIX,
     intents=intents,
     help_command=EmbedHelpCommand(),
     description=t(getattr(Config, "DEFAULT_LANG", "en"), "bot_description"),
+    http_trace=rest_metrics.trace_config(),
 )
+if Config.SHARDING:
+    bot = commands.AutoShardedBot(
+        shard_count=Config.SHARD_COUNT,
+        shard_ids=Config.SHARD_IDS,
+        **bot_options,
+    )
+else:
+    bot = commands.Bot(**bot_options)
+# Count REST calls, latency and 429s per route for !ratelimits
+rest_metrics.install(bot.http)
+# Count gateway events per shard for !shards
+shard_metrics.install(bot)
 
 
-def _get_lang_from_ctx(ctx: commands.Context) -> str:
+async def _get_lang_from_ctx(ctx: commands.Context) -> str:
     """Return preferred language for the author or default language."""
     author = getattr(ctx, "author", None)
     if isinstance(author, discord.Member):
-        return get_lang_for_member(author)
+        return await get_lang_for_member(author)
     if isinstance(author, discord.abc.User):
-        return get_lang_for_user(author)
+        return await get_lang_for_user(author)
     return getattr(Config, "DEFAULT_LANG", "en")
 
 
-def _get_lang_from_member(member: discord.Member) -> str:
+async def _get_lang_from_member(member: discord.Member) -> str:
     """Return preferred language for a member or default language."""
     if isinstance(member, discord.Member):
-        return get_lang_for_member(member)
+        return await get_lang_for_member(member)
     if isinstance(member, discord.abc.User):
-        return get_lang_for_user(member)
+        return await get_lang_for_user(member)
     return getattr(Config, "DEFAULT_LANG", "en")
 
 
+_warmup_task: asyncio.Task | None = None
+
+
+async def _warm_caches(member_ids: set[int]) -> None:
+    """Background warm-up of the user and language caches; never blocks readiness."""
+    try:
+        result = await warm_user_caches(member_ids)
+        print(
+            f"[warmup] {result['rows']} user row(s) read, {result['cached']} cached "
+            f"for {result['members']} member(s) in {result['elapsed']:.2f}s"
+        )
+    except Exception as e:
+        print(f"[warmup ERROR] {type(e).__name__}: {e}", file=sys.stderr)
+
+
 @bot.event
 async def on_ready():
     """Event handler when bot is ready."""
@@ -65,10 +101,17 @@ async def on_ready():
     print(f"Logged in as: {bot.user.name} (ID: {bot.user.id})")
     print(f"discord.py version: {discord.__version__}")
     print(f"Connected to {len(bot.guilds)} guild(s)")
+    if isinstance(bot, commands.AutoShardedBot):
+        print(f"Shards: {sorted(bot.shards)} of {bot.shard_count}")
+    else:
+        shard_metrics.ready(bot.shard_id)
     print("------")
 
-    # Register UI View globally (persistent across restarts)
-    #bot.add_view(RoleSelectionView(bot_client=bot))
+    # on_ready fires again after reconnects; warm up only once
+    global _warmup_task
+    if Config.CACHE_WARMUP and _warmup_task is None:
+        member_ids = {m.id for guild in bot.guilds for m in guild.members if not m.bot}
+        _warmup_task = asyncio.create_task(_warm_caches(member_ids))
 
     default_lang = getattr(Config, "DEFAULT_LANG", "en")
     await bot.change_presence(
@@ -78,19 +121,64 @@ async def on_ready():
     )
 
 
+# A plain Bot only dispatches the unsharded events; record them as shard 0
+@bot.event
+async def on_connect():
+    if not isinstance(bot, commands.AutoShardedBot):
+        shard_metrics.connected(bot.shard_id)
+
+
+@bot.event
+async def on_disconnect():
+    if not isinstance(bot, commands.AutoShardedBot):
+        shard_metrics.disconnected(bot.shard_id)
+
+
+@bot.event
+async def on_resumed():
+    if not isinstance(bot, commands.AutoShardedBot):
+        shard_metrics.resumed(bot.shard_id)
+
+
+@bot.event
+async def on_shard_connect(shard_id: int):
+    shard_metrics.connected(shard_id)
+    print(f"[shard {shard_id}] connected")
+
+
+@bot.event
+async def on_shard_disconnect(shard_id: int):
+    shard_metrics.disconnected(shard_id)
+    print(f"[shard {shard_id}] disconnected", file=sys.stderr)
+
+
+@bot.event
+async def on_shard_resumed(shard_id: int):
+    shard_metrics.resumed(shard_id)
+    print(f"[shard {shard_id}] resumed")
+
+
+@bot.event
+async def on_shard_ready(shard_id: int):
+    shard_metrics.ready(shard_id)
+    guilds = sum(1 for guild in bot.guilds if guild.shard_id == shard_id)
+    print(f"[shard {shard_id}] ready with {guilds} guild(s)")
+
+
 @bot.event
 async def on_member_remove(member: discord.Member):
     """Notify when someone leaves the server."""
-    channel = discord.utils.get(member.guild.text_channels, name="general")
+    member_resolver.forget(member.guild.id, member.id)
+    channel = channel_index.get(member.guild, "general")
     if channel:
-        lang = _get_lang_from_member(member)
+        lang = await _get_lang_from_member(member)
         await channel.send(t(lang, "member_left_server").format(name=member.name))
 
 
 @bot.event
 async def on_command_error(ctx, error):
     """Global command error handler."""
-    lang = _get_lang_from_ctx(ctx)
+    lang = await _get_lang_from_ctx(ctx)
     if isinstance(error, commands.CommandNotFound):
         await ctx.send(t(lang, "command_not_found").format(prefix=ctx.clean_prefix))
     elif isinstance(error, commands.MissingPermissions):
@@ -124,37 +212,42 @@ async def on_member_update(before: discord.Member, after: discord.Member):
     if had_recruit or not has_recruit:
         return
 
-    user = get_or_create_user_from_member(after)
-    update_discord_profile(after)
-    lang = user.language or "en"
-
-    try:
-        text_ch, voice_ch, is_new = await ensure_recruit_channels(guild, after)
-    except Exception as e:
-        print(
-            f"[Recruit auto ERROR] Cannot create channels for {after}: {type(e).__name__}: {e}",
-            file=sys.stderr,
-        )
-        return
+    await _handle_recruit_granted(guild, after)
 
-    user = get_or_create_user_from_member(after)
 
-    if is_new:
-    
-        user = get_or_create_user_from_member(after)
+async def _handle_recruit_granted(guild: discord.Guild, member: discord.Member):
+    """Create recruit channels, DM the recruit and post the moderation embed."""
+    async with interaction_scope("recruit_auto"):
+        async with UnitOfWork("recruit_auto_read") as uow:
+            user = await get_or_create_user_from_member(member, uow=uow)
+        lang = user.language or "en"
 
+        # A recruit moved on by a moderator keeps their status
         status = (user.recruit_status or "").lower()
-        if status not in ("done", "rejected"):
-            set_recruit_status(after.id, "ready")
+        new_status = None if status in ("ready", "done", "rejected") else "ready"
+
+        try:
+            text_ch, voice_ch, is_new = await ensure_recruit_channels(
+                guild, member, status=new_status
+            )
+        except Exception as e:
+            print(
+                f"[Recruit auto ERROR] Cannot create channels for {member}: {type(e).__name__}: {e}",
+                file=sys.stderr,
+            )
+            return
+
+        if not is_new:
+            return
 
         if not getattr(user, "steam_id", None):
             text = t(lang, "recruit_auto_granted")
 
             try:
-                await after.send(text, view=SteamLinkView(lang))
+                await member.send(text, view=SteamLinkView(lang))
             except discord.Forbidden:
                 print(
-                    f"[Recruit auto] Cannot DM {after} about SteamID (DM closed).",
+                    f"[Recruit auto] Cannot DM {member} about SteamID (DM closed).",
                     file=sys.stderr,
                 )
             except Exception as e:
@@ -166,9 +259,10 @@ async def on_member_update(before: discord.Member, after: discord.Member):
         try:
             await send_recruit_moderation_embed(
                 guild=guild,
-                member=after,
+                member=member,
                 text_ch=text_ch,
                 voice_ch=voice_ch,
+                user=user,
             )
         except Exception as e:
             print(
@@ -176,9 +270,6 @@ async def on_member_update(before: discord.Member, after: discord.Member):
                 file=sys.stderr,
             )
 
-    else:
-        return
-
 
 async def load_extensions():
     """Load all COG modules."""
@@ -188,7 +279,9 @@ async def load_extensions():
         "commands.onboarding",
         "commands.recruits",
         "commands.roles_panel",
-        "events.onboarding_events"
+        "commands.diagnostics",
+        "events.onboarding_events",
+        "events.channel_events",
 
     ]
     for ext in extensions:
@@ -206,6 +299,21 @@ async def main():
         
         # Validate configuration
         Config.validate()
+
+        # Preload stored languages so language lookups stay read-only and in memory.
+        # With CACHE_WARMUP the background warm-up after on_ready loads them instead.
+        if not Config.CACHE_WARMUP:
+            try:
+                count = await warm_language_cache()
+                print(f"Language cache warmed: {count} user(s)")
+            except Exception as e:
+                print(f"Failed to warm language cache: {e}", file=sys.stderr)
+
+        profile_refresher.start()
+
+        # Buttons that encode their state in custom_id; registered once so they
+        # keep working after a restart without views held in memory
+        bot.add_dynamic_items(*ONBOARDING_ITEMS, *MODERATION_ITEMS)
         
         # Load extensions
         await load_extensions()
@@ -218,10 +326,21 @@ async def main():
     except Exception as e:
         print(f"Error starting bot: {e}", file=sys.stderr)
         sys.exit(1)
+    finally:
+        try:
+            await profile_refresher.stop()
+        except Exception as e:
+            print(f"Failed to flush pending profile updates: {e}", file=sys.stderr)
+        await engine.dispose()
 
 
 
 if __name__ == "__main__":
+    # python bot.py --import-report: show which modules dominate startup imports
+    if "--import-report" in sys.argv:
+        from utils.import_report import run_import_report
+        sys.exit(run_import_report())
+
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
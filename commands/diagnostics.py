@@ -0,0 +1,199 @@
+"""Diagnostics cog.
+Admin-only commands that expose runtime metrics of the bot and reload its locale files.
+"""
+
+import discord
+from discord.ext import commands
+
+from database.cache import user_cache
+from database.db import get_pool_stats
+from database.profile_sync import profile_refresher
+from dms.localization import reload_locales, t
+from dms.recruit_channels import recruit_channel_locks
+from dms.recruit_moderation import recruit_decision_locks
+from utils.lang import get_lang_for_user
+from utils.members import member_resolver
+from utils.rest_metrics import rest_metrics
+from utils.shard_metrics import shard_metrics
+
+
+class Diagnostics(commands.Cog):
+    """Runtime metrics for administrators."""
+
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+
+    @commands.command(name="dbpool", extras={"admin_only": True})
+    @commands.has_permissions(administrator=True)
+    async def dbpool(self, ctx: commands.Context) -> None:
+        """
+        Show database connection pool gauges and cache counters.
+
+        Usage: !dbpool
+        """
+        lang = await get_lang_for_user(ctx.author)
+        pool = get_pool_stats()
+
+        embed = discord.Embed(
+            title=t(lang, "dbpool_title"),
+            color=discord.Color.dark_teal(),
+        )
+        embed.add_field(
+            name=t(lang, "dbpool_field_connections"),
+            value=t(lang, "dbpool_connections_value").format(**pool),
+            inline=True,
+        )
+        embed.add_field(
+            name=t(lang, "dbpool_field_wait"),
+            value=t(lang, "dbpool_wait_value").format(**pool),
+            inline=True,
+        )
+        embed.add_field(
+            name=t(lang, "dbpool_field_cache"),
+            value=t(lang, "dbpool_cache_value").format(**user_cache.stats()),
+            inline=False,
+        )
+        embed.add_field(
+            name=t(lang, "dbpool_field_profiles"),
+            value=t(lang, "dbpool_profiles_value").format(**profile_refresher.stats()),
+            inline=False,
+        )
+        embed.add_field(
+            name=t(lang, "dbpool_field_members"),
+            value=t(lang, "dbpool_members_value").format(**member_resolver.stats()),
+            inline=False,
+        )
+
+        await ctx.send(embed=embed)
+
+    @commands.command(name="locks", extras={"admin_only": True})
+    @commands.has_permissions(administrator=True)
+    async def locks(self, ctx: commands.Context) -> None:
+        """
+        Show live and contended recruit channel and decision locks.
+
+        Usage: !locks
+        """
+        lang = await get_lang_for_user(ctx.author)
+
+        embed = discord.Embed(title=t(lang, "locks_title"), color=discord.Color.dark_teal())
+        for manager in (recruit_channel_locks, recruit_decision_locks):
+            stats = manager.stats()
+            embed.add_field(
+                name=manager.name,
+                value=t(lang, "locks_value").format(
+                    **stats,
+                    mode=t(lang, "locks_mode_advisory" if stats["advisory"] else "locks_mode_local"),
+                ),
+                inline=True,
+            )
+        await ctx.send(embed=embed)
+
+    @commands.command(name="dmqueue", extras={"admin_only": True})
+    @commands.has_permissions(administrator=True)
+    async def dmqueue(self, ctx: commands.Context) -> None:
+        """
+        Show the onboarding DM queue depth, age and delivery counters.
+
+        Usage: !dmqueue
+        """
+        lang = await get_lang_for_user(ctx.author)
+        events = self.bot.get_cog("OnboardingEvents")
+        if events is None:
+            await ctx.send(t(lang, "dmqueue_unavailable"))
+            return
+
+        embed = discord.Embed(
+            title=t(lang, "dmqueue_title"),
+            description=t(lang, "dmqueue_value").format(**events.dispatcher.stats()),
+            color=discord.Color.dark_teal(),
+        )
+        await ctx.send(embed=embed)
+
+    @commands.command(name="ratelimits", extras={"admin_only": True})
+    @commands.has_permissions(administrator=True)
+    async def ratelimits(self, ctx: commands.Context, limit: int = 15) -> None:
+        """
+        Show Discord REST calls per route: count, latency, 429s and rate-limit wait.
+
+        Usage: !ratelimits [limit]
+        """
+        lang = await get_lang_for_user(ctx.author)
+        routes = rest_metrics.top_routes(max(1, min(limit, 25)))
+
+        if routes:
+            description = "\n".join(
+                t(lang, "ratelimits_line").format(route=route, **stats)
+                for route, stats in routes
+            )
+        else:
+            description = t(lang, "ratelimits_empty")
+
+        embed = discord.Embed(
+            title=t(lang, "ratelimits_title"),
+            description=description,
+            color=discord.Color.dark_teal(),
+        )
+        embed.set_footer(text=t(lang, "ratelimits_footer").format(**rest_metrics.totals()))
+        await ctx.send(embed=embed)
+
+    @commands.command(name="shards", extras={"admin_only": True})
+    @commands.has_permissions(administrator=True)
+    async def shards(self, ctx: commands.Context) -> None:
+        """
+        Show latency, guild count, event rate and reconnects per gateway shard.
+
+        Usage: !shards
+        """
+        lang = await get_lang_for_user(ctx.author)
+        rows = shard_metrics.snapshot(self.bot)
+
+        lines = []
+        for row in rows[:25]:
+            if row["latency_ms"] >= 0:
+                latency = t(lang, "shards_latency_value").format(**row)
+            else:
+                latency = t(lang, "shards_latency_pending")
+            lines.append(t(lang, "shards_line").format(latency=latency, **row))
+
+        embed = discord.Embed(
+            title=t(lang, "shards_title"),
+            description="\n".join(lines) if lines else t(lang, "shards_empty"),
+            color=discord.Color.dark_teal(),
+        )
+        if isinstance(self.bot, commands.AutoShardedBot):
+            footer = t(lang, "shards_footer_sharded").format(
+                shard_ids=", ".join(str(i) for i in sorted(self.bot.shards)),
+                shard_count=self.bot.shard_count,
+            )
+        else:
+            footer = t(lang, "shards_footer_single")
+        embed.set_footer(text=footer)
+        await ctx.send(embed=embed)
+
+    @commands.command(name="reload_locales", extras={"admin_only": True})
+    @commands.has_permissions(administrator=True)
+    async def reload_locales_cmd(self, ctx: commands.Context) -> None:
+        """
+        Re-read dms/locales/*.json so wording changes apply without a restart.
+
+        Usage: !reload_locales
+        """
+        lang = await get_lang_for_user(ctx.author)
+        try:
+            languages, problems = reload_locales()
+        except (OSError, ValueError) as e:
+            await ctx.send(t(lang, "locales_reload_failed").format(error=e))
+            return
+
+        # Strings may have changed, so look them up again after the reload
+        text = t(lang, "locales_reloaded").format(langs=", ".join(languages))
+        if problems:
+            shown = "\n".join(problems[:10])
+            text += "\n" + t(lang, "locales_reload_problems").format(count=len(problems), problems=shown)
+        await ctx.send(text[:2000])
+
+
+async def setup(bot: commands.Bot) -> None:
+    """Setup function to add the cog to the bot."""
+    await bot.add_cog(Diagnostics(bot))
@@ -18,12 +18,12 @@ class General(commands.Cog):
         self.bot = bot
         self.start_time = time.time()
 
-    def _get_lang(self, ctx: commands.Context) -> str:
+    async def _get_lang(self, ctx: commands.Context) -> str:
         """Return the preferred language for the author or default to English."""
         if isinstance(ctx.author, discord.Member):
-            return get_lang_for_member(ctx.author)
+            return await get_lang_for_member(ctx.author)
         if isinstance(ctx.author, discord.abc.User):
-            return get_lang_for_user(ctx.author)
+            return await get_lang_for_user(ctx.author)
         return "en"
 
     @commands.command(name="ping")
@@ -33,7 +33,7 @@ class General(commands.Cog):
 
         Usage: !ping
         """
-        lang = self._get_lang(ctx)
+        lang = await self._get_lang(ctx)
         latency = round(self.bot.latency * 1000)
 
         embed = discord.Embed(
@@ -50,7 +50,7 @@ class General(commands.Cog):
 
         Usage: !info
         """
-        lang = self._get_lang(ctx)
+        lang = await self._get_lang(ctx)
         uptime = time.time() - self.start_time
         hours, remainder = divmod(int(uptime), 3600)
         minutes, seconds = divmod(remainder, 60)
@@ -114,7 +114,7 @@ class General(commands.Cog):
 
         Usage: !serverinfo
         """
-        lang = self._get_lang(ctx)
+        lang = await self._get_lang(ctx)
         guild = ctx.guild
 
         embed = discord.Embed(
@@ -185,7 +185,7 @@ class General(commands.Cog):
 
         If no member is specified, shows info about yourself.
         """
-        lang = self._get_lang(ctx)
+        lang = await self._get_lang(ctx)
         member = member or ctx.author
 
         color = (
@@ -272,7 +272,7 @@ class General(commands.Cog):
 
         If no member is specified, shows your avatar.
         """
-        lang = self._get_lang(ctx)
+        lang = await self._get_lang(ctx)
         member = member or ctx.author
 
         embed = discord.Embed(
@@ -323,7 +323,7 @@ class General(commands.Cog):
         !say #channel Title | Body --embed
             Sends an embed using title and description split by "|".
         """
-        lang = self._get_lang(ctx)
+        lang = await self._get_lang(ctx)
         use_embed = False
         flag = "--embed"
 
@@ -25,6 +25,12 @@ class EmbedHelpCommand(commands.MinimalHelpCommand):
         "clear": "help_desc_clear",
         "mute": "help_desc_mute",
         "unmute": "help_desc_unmute",
+        "dbpool": "help_desc_dbpool",
+        "locks": "help_desc_locks",
+        "dmqueue": "help_desc_dmqueue",
+        "ratelimits": "help_desc_ratelimits",
+        "shards": "help_desc_shards",
+        "reload_locales": "help_desc_reload_locales",
     }
     """
     Custom help command that:
@@ -66,9 +72,9 @@ class EmbedHelpCommand(commands.MinimalHelpCommand):
         prefix = self._get_prefix()
         author = getattr(self.context, "author", None)
         if isinstance(author, discord.Member):
-            lang = get_lang_for_member(author)
+            lang = await get_lang_for_member(author)
         elif isinstance(author, discord.abc.User):
-            lang = get_lang_for_user(author)
+            lang = await get_lang_for_user(author)
         else:
             lang = "en"
 
@@ -146,9 +152,9 @@ class EmbedHelpCommand(commands.MinimalHelpCommand):
         sig = self.get_command_signature(command)
         author = getattr(self.context, "author", None)
         if isinstance(author, discord.Member):
-            lang = get_lang_for_member(author)
+            lang = await get_lang_for_member(author)
         elif isinstance(author, discord.abc.User):
-            lang = get_lang_for_user(author)
+            lang = await get_lang_for_user(author)
         else:
             lang = "en"
         embed = discord.Embed(
@@ -167,9 +173,9 @@ class EmbedHelpCommand(commands.MinimalHelpCommand):
 
         author = getattr(self.context, "author", None)
         if isinstance(author, discord.Member):
-            lang = get_lang_for_member(author)
+            lang = await get_lang_for_member(author)
         elif isinstance(author, discord.abc.User):
-            lang = get_lang_for_user(author)
+            lang = await get_lang_for_user(author)
         else:
             lang = "en"
         embed = discord.Embed(
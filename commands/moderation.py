@@ -11,12 +11,12 @@ class Moderation(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
 
-    def _lang_from_author(self, ctx) -> str:
+    async def _lang_from_author(self, ctx) -> str:
         """Return author's stored language or default config language."""
         if isinstance(ctx.author, discord.Member):
-            return get_lang_for_member(ctx.author)
+            return await get_lang_for_member(ctx.author)
         if isinstance(ctx.author, discord.abc.User):
-            return get_lang_for_user(ctx.author)
+            return await get_lang_for_user(ctx.author)
         return "en"
     
     @commands.command(name='kick')
@@ -31,7 +31,7 @@ class Moderation(commands.Cog):
         
         Requires: Kick Members permission
         """
-        lang = self._lang_from_author(ctx)
+        lang = await self._lang_from_author(ctx)
         if member == ctx.author:
             await ctx.send(t(lang, "mod_cannot_target_self_kick"))
             return
@@ -74,7 +74,7 @@ class Moderation(commands.Cog):
         
         Requires: Ban Members permission
         """
-        lang = self._lang_from_author(ctx)
+        lang = await self._lang_from_author(ctx)
         if member == ctx.author:
             await ctx.send(t(lang, "mod_cannot_target_self_ban"))
             return
@@ -117,7 +117,7 @@ class Moderation(commands.Cog):
         
         Requires: Ban Members permission
         """
-        lang = self._lang_from_author(ctx)
+        lang = await self._lang_from_author(ctx)
         try:
             user = await self.bot.fetch_user(user_id)
             await ctx.guild.unban(user, reason=reason)
@@ -153,7 +153,7 @@ class Moderation(commands.Cog):
         Maximum: 100 messages
         Requires: Manage Messages permission
         """
-        lang = self._lang_from_author(ctx)
+        lang = await self._lang_from_author(ctx)
         if amount < 1:
             await ctx.send(t(lang, "mod_clear_amount_min"))
             return
@@ -187,7 +187,7 @@ class Moderation(commands.Cog):
         Default duration: 60 minutes
         Requires: Moderate Members permission
         """
-        lang = self._lang_from_author(ctx)
+        lang = await self._lang_from_author(ctx)
         if member == ctx.author:
             await ctx.send(t(lang, "mod_cannot_target_self_mute"))
             return
@@ -237,7 +237,7 @@ class Moderation(commands.Cog):
         
         Requires: Moderate Members permission
         """
-        lang = self._lang_from_author(ctx)
+        lang = await self._lang_from_author(ctx)
         try:
             await member.timeout(None, reason=reason)
             
@@ -11,12 +11,12 @@ class Onboarding(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
 
-    def _get_lang(self, member: discord.Member | discord.User) -> str:
+    async def _get_lang(self, member: discord.Member | discord.User) -> str:
         """Return the preferred language for the member or default to English."""
         if isinstance(member, discord.Member):
-            return get_lang_for_member(member)
+            return await get_lang_for_member(member)
         if isinstance(member, discord.abc.User):
-            return get_lang_for_user(member)
+            return await get_lang_for_user(member)
         return "en"
 
     @commands.command(
@@ -29,7 +29,7 @@ class Onboarding(commands.Cog):
         Resend onboarding DM to the command author.
         Use in a server text channel.
         """
-        lang = self._get_lang(ctx.author)
+        lang = await self._get_lang(ctx.author)
         if ctx.guild is None:
             await ctx.reply(
                 t(lang, "onboarding_guild_only"),
@@ -63,7 +63,7 @@ class Onboarding(commands.Cog):
         Send onboarding DM to a specific member.
         Example: !onboarding_for @Nickname
         """
-        lang = self._get_lang(ctx.author)
+        lang = await self._get_lang(ctx.author)
         if ctx.guild is None:
             await ctx.reply(
                 t(lang, "onboarding_guild_only"),
@@ -1,28 +1,148 @@
+import sys
+
 import discord
 from discord.ext import commands
 
 from config import Config
 from database.service import (
-    get_recruits_all,
-    get_recruits_by_status,
+    bulk_sync_members,
+    get_recruit_overview,
+    get_recruits_page,
     get_user_by_discord_id,
     get_user_by_username,
     get_or_create_user_from_member,
     get_recruit_code,
 )
 from database.models import User
+from database.profile_sync import profile_refresher
+from dms.embed_templates import embed_templates, fill_field, member_profile_value, steam_profile_url
 from dms.localization import t
 from utils.lang import get_lang_for_member, get_lang_for_user
+from utils.members import resolve_member
 
 STATUSES = ["pending", "ready", "done", "rejected"]
+RECRUITS_PAGE_SIZE = 20
 
 
-def _lang_from_member(member: discord.Member | None) -> str:
+async def _lang_from_member(member: discord.Member | None) -> str:
     """Return stored language for a member or fallback to default config language."""
     default_lang = getattr(Config, "DEFAULT_LANG", "en")
     if member is None:
         return default_lang
-    return get_lang_for_member(member)
+    return await get_lang_for_member(member)
+
+
+# Field positions in the !recruit embed template
+_INFO_CODE, _INFO_DISCORD, _INFO_STATUS, _INFO_LANGUAGE, _INFO_STEAM, _INFO_TEXT, _INFO_VOICE = range(7)
+
+
+@embed_templates.template("recruit_info")
+def _recruit_info_template(lang: str) -> discord.Embed:
+    unknown = t(lang, "value_unknown")
+    embed = discord.Embed(
+        title=t(lang, "recruit_info_title"),
+        color=discord.Color.gold(),
+    )
+    embed.add_field(name=t(lang, "recruit_embed_field_code"), value="-", inline=False)
+    embed.add_field(name=t(lang, "recruit_embed_field_discord"), value="-", inline=False)
+    embed.add_field(name=t(lang, "recruit_embed_field_status"), value="-", inline=True)
+    embed.add_field(name=t(lang, "recruit_embed_field_language"), value="-", inline=True)
+    embed.add_field(
+        name=t(lang, "recruit_embed_field_steam"),
+        value=t(lang, "recruit_embed_steam_not_linked_bilingual"),
+        inline=False,
+    )
+    embed.add_field(name=t(lang, "recruit_field_text_channel"), value=unknown, inline=True)
+    embed.add_field(name=t(lang, "recruit_field_voice_channel"), value=unknown, inline=True)
+    return embed
+
+
+class RecruitsPaginatorView(discord.ui.View):
+    """
+    Page through recruits with a given status, one keyset query per click.
+    Keeps only the cursor (last users.id) of every visited page.
+    """
+
+    def __init__(self, author_id: int, status: str, lang: str, page_size: int = RECRUITS_PAGE_SIZE):
+        super().__init__(timeout=300)
+        self.author_id = author_id
+        self.status = status
+        self.lang = lang
+        self.page_size = page_size
+
+        # after_id used to load each visited page; the last one is the current page
+        self._cursors: list[int] = [0]
+        self._next_cursor: int | None = None
+
+        self.prev_page.label = t(lang, "btn_prev")
+        self.next_page.label = t(lang, "btn_next")
+
+    async def load_page(self) -> discord.Embed | None:
+        """Fetch the current page and return its embed, or None if it is empty."""
+        # Fetch one extra row to know whether a next page exists
+        users = await get_recruits_page(
+            status=self.status,
+            after_id=self._cursors[-1],
+            limit=self.page_size + 1,
+        )
+        has_next = len(users) > self.page_size
+        users = users[: self.page_size]
+        if not users:
+            return None
+
+        self._next_cursor = users[-1].id if has_next else None
+        self.prev_page.disabled = len(self._cursors) == 1
+        self.next_page.disabled = not has_next
+
+        lines: list[str] = []
+        for u in users:
+            line = f"- <@{u.discord_id}> (ID `{u.discord_id}`)"
+            if u.steam_id:
+                line += f" | Steam `{u.steam_id}`"
+            lines.append(line)
+
+        embed = discord.Embed(
+            title=t(self.lang, "recruits_with_status_title").format(
+                status=self.status.upper()
+            ),
+            description="\n".join(lines),
+            color=discord.Color.blurple(),
+        )
+        embed.set_footer(
+            text=t(self.lang, "recruits_page_footer").format(page=len(self._cursors))
+        )
+        return embed
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        if interaction.user.id != self.author_id:
+            await interaction.response.send_message(
+                t(self.lang, "recruits_paginator_not_owner"),
+                ephemeral=True,
+            )
+            return False
+        return True
+
+    async def _show(self, interaction: discord.Interaction) -> None:
+        embed = await self.load_page()
+        if embed is None:
+            embed = discord.Embed(
+                description=t(self.lang, "recruits_none_with_status").format(status=self.status),
+                color=discord.Color.blurple(),
+            )
+            self.next_page.disabled = True
+        await interaction.response.edit_message(embed=embed, view=self)
+
+    @discord.ui.button(label="Previous", style=discord.ButtonStyle.secondary)
+    async def prev_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        if len(self._cursors) > 1:
+            self._cursors.pop()
+        await self._show(interaction)
+
+    @discord.ui.button(label="Next", style=discord.ButtonStyle.primary)
+    async def next_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        if self._next_cursor is not None:
+            self._cursors.append(self._next_cursor)
+        await self._show(interaction)
 
 
 class RecruitCommands(commands.Cog):
@@ -43,103 +163,39 @@ class RecruitCommands(commands.Cog):
           !recruit @User
         """
         target = member or ctx.author
-        lang = _lang_from_member(ctx.author if isinstance(ctx.author, discord.Member) else None)
+        lang = await _lang_from_member(ctx.author if isinstance(ctx.author, discord.Member) else None)
 
         # Ensure target is a Member object if a partial user was provided
         if not isinstance(target, discord.Member):
             guild = ctx.guild
             if guild is not None:
-                try:
-                    target = await guild.fetch_member(target.id)  # type: ignore
-                except discord.DiscordException:
+                target = await resolve_member(guild, target.id)
+                if target is None:
                     await ctx.send(t(lang, "user_not_in_guild"))
                     return
 
-        user = get_or_create_user_from_member(target)
+        user = await get_or_create_user_from_member(target)
         lang = user.language or lang
         status = (user.recruit_status or "pending").lower()
 
-        if user.steam_url:
-            steam_url = user.steam_url
-        elif user.steam_id:
-            steam_url = f"https://steamcommunity.com/profiles/{user.steam_id}"
-        else:
-            steam_url = None
-
-        text_mention = (
-            f"<#{user.recruit_text_channel_id}>"
-            if user.recruit_text_channel_id
-            else t(lang, "value_unknown")
-        )
-        voice_mention = (
-            f"<#{user.recruit_voice_channel_id}>"
-            if user.recruit_voice_channel_id
-            else t(lang, "value_unknown")
-        )
-
-        recruit_code = get_recruit_code(user)
-
-        embed = discord.Embed(
-            title=t(lang, "recruit_info_title"),
-            color=discord.Color.gold(),
-        )
-
-        embed.add_field(
-            name=t(lang, "recruit_embed_field_code"),
-            value=recruit_code,
-            inline=False,
-        )
-
-        embed.add_field(
-            name=t(lang, "recruit_embed_field_discord"),
-            value=(
-                f"{target.mention}\n"
-                f"Display name: **{target.display_name}**\n"
-                f"Username: `{target.name}`\n"
-                f"ID: `{target.id}`"
-            ),
-            inline=False,
-        )
-
-        lang_name = {
-            "ru": t(lang, "language_name_ru"),
-            "en": t(lang, "language_name_en"),
-        }.get(user.language, t(lang, "language_name_en"))
-
-        embed.add_field(
-            name=t(lang, "recruit_embed_field_status"),
-            value=status.upper(),
-            inline=True,
-        )
-        embed.add_field(
-            name=t(lang, "recruit_embed_field_language"),
-            value=lang_name,
-            inline=True,
+        embed = embed_templates.get("recruit_info", lang)
+        fill_field(embed, _INFO_CODE, get_recruit_code(user))
+        fill_field(embed, _INFO_DISCORD, member_profile_value(target))
+        fill_field(embed, _INFO_STATUS, status.upper())
+        fill_field(
+            embed,
+            _INFO_LANGUAGE,
+            t(lang, "language_name_ru" if user.language == "ru" else "language_name_en"),
         )
 
+        steam_url = steam_profile_url(user)
         if steam_url:
-            embed.add_field(
-                name=t(lang, "recruit_embed_field_steam"),
-                value=f"ID: `{user.steam_id}`\n[Open profile]({steam_url})",
-                inline=False,
-            )
-        else:
-            embed.add_field(
-                name=t(lang, "recruit_embed_field_steam"),
-                value=t(lang, "recruit_embed_steam_not_linked_bilingual"),
-                inline=False,
-            )
+            fill_field(embed, _INFO_STEAM, f"ID: `{user.steam_id}`\n[Open profile]({steam_url})")
 
-        embed.add_field(
-            name=t(lang, "recruit_field_text_channel"),
-            value=text_mention,
-            inline=True,
-        )
-        embed.add_field(
-            name=t(lang, "recruit_field_voice_channel"),
-            value=voice_mention,
-            inline=True,
-        )
+        if user.recruit_text_channel_id:
+            fill_field(embed, _INFO_TEXT, f"<#{user.recruit_text_channel_id}>")
+        if user.recruit_voice_channel_id:
+            fill_field(embed, _INFO_VOICE, f"<#{user.recruit_voice_channel_id}>")
 
         await ctx.send(embed=embed)
 
@@ -158,35 +214,26 @@ class RecruitCommands(commands.Cog):
           !recruits
           !recruits ready
         """
-        default_lang = _lang_from_member(ctx.author if isinstance(ctx.author, discord.Member) else None)
+        default_lang = await _lang_from_member(ctx.author if isinstance(ctx.author, discord.Member) else None)
         if status:
             status = status.lower()
             if status not in STATUSES:
                 await ctx.send(t(default_lang, "recruits_unknown_status"))
                 return
 
-            users = get_recruits_by_status(status)
-            if not users:
+            view = RecruitsPaginatorView(
+                author_id=ctx.author.id,
+                status=status,
+                lang=default_lang,
+            )
+            embed = await view.load_page()
+            if embed is None:
                 await ctx.send(
                     t(default_lang, "recruits_none_with_status").format(status=status)
                 )
                 return
 
-            lines: list[str] = []
-            for u in users:
-                line = f"- <@{u.discord_id}> (ID `{u.discord_id}`)"
-                if u.steam_id:
-                    line += f" | Steam `{u.steam_id}`"
-                lines.append(line)
-
-            embed = discord.Embed(
-                title=t(default_lang, "recruits_with_status_title").format(
-                    status=status.upper()
-                ),
-                description="\n".join(lines),
-                color=discord.Color.blurple(),
-            )
-            await ctx.send(embed=embed)
+            await ctx.send(embed=embed, view=view)
             return
 
         embed = discord.Embed(
@@ -194,16 +241,22 @@ class RecruitCommands(commands.Cog):
             color=discord.Color.blurple(),
         )
 
+        overview = await get_recruit_overview(STATUSES)
         for st in STATUSES:
-            users = get_recruits_by_status(st)
-            if not users:
+            bucket = overview[st]
+            if not bucket["count"]:
                 value = t(default_lang, "recruits_overview_none")
             else:
-                value_lines = [f"<@{u.discord_id}>" for u in users]
+                value_lines = [f"<@{discord_id}>" for discord_id in bucket["discord_ids"]]
+                hidden = bucket["count"] - len(bucket["discord_ids"])
+                if hidden > 0:
+                    value_lines.append(
+                        t(default_lang, "recruits_overview_more").format(count=hidden)
+                    )
                 value = "\n".join(value_lines)
 
             embed.add_field(
-                name=st.upper(),
+                name=f"{st.upper()} ({bucket['count']})",
                 value=value,
                 inline=False,
             )
@@ -223,18 +276,18 @@ class RecruitCommands(commands.Cog):
           !user_update @User
         """
         target = member or ctx.author
-        lang = _lang_from_member(ctx.author if isinstance(ctx.author, discord.Member) else None)
+        lang = await _lang_from_member(ctx.author if isinstance(ctx.author, discord.Member) else None)
 
         if not isinstance(target, discord.Member):
             guild = ctx.guild
             if guild is not None:
-                try:
-                    target = await guild.fetch_member(target.id)  # type: ignore
-                except discord.DiscordException:
+                target = await resolve_member(guild, target.id)
+                if target is None:
                     await ctx.send(t(lang, "user_not_in_guild"))
                     return
 
-        user = get_or_create_user_from_member(target)
+        user = await get_or_create_user_from_member(target)
+        await profile_refresher.flush()
 
         await ctx.send(
             t(lang, "user_synced").format(
@@ -254,23 +307,47 @@ class RecruitCommands(commands.Cog):
         """
         Bulk refresh user profiles for the current guild.
 
-        Updates every non-bot member so stored data matches Discord state.
+        Upserts every non-bot member in chunks so stored data matches Discord state;
+        progress is reported by editing a single status message.
         """
+        lang = await _lang_from_member(ctx.author if isinstance(ctx.author, discord.Member) else None)
         guild = ctx.guild
         if guild is None:
-            lang = _lang_from_member(ctx.author if isinstance(ctx.author, discord.Member) else None)
             await ctx.send(t(lang, "command_guild_only"))
             return
 
-        updated = 0
-        for member in guild.members:
-            if member.bot:
-                continue
-            get_or_create_user_from_member(member)
-            updated += 1
+        # Write anything queued first so the bulk upsert sees the latest values
+        await profile_refresher.flush()
+
+        status_msg = await ctx.send(
+            t(lang, "user_updates_progress").format(guild=guild.name, done=0, total="?")
+        )
+
+        async def report(done: int, total: int) -> None:
+            try:
+                await status_msg.edit(
+                    content=t(lang, "user_updates_progress").format(
+                        guild=guild.name, done=done, total=total
+                    )
+                )
+            except discord.HTTPException:
+                pass
+
+        result = await bulk_sync_members(guild.members, progress=report)
+        print(
+            f"[user_updates] {guild.name}: {result['total']} members, "
+            f"{result['changed']} changed, {result['elapsed']:.2f}s in the database",
+            file=sys.stderr,
+        )
 
-        lang = _lang_from_member(ctx.author if isinstance(ctx.author, discord.Member) else None)
-        await ctx.send(t(lang, "user_updates_done").format(updated=updated, guild=guild.name))
+        await status_msg.edit(
+            content=t(lang, "user_updates_done").format(
+                total=result["total"],
+                updated=result["changed"],
+                guild=guild.name,
+                elapsed=result["elapsed"],
+            )
+        )
 
 
 async def setup(bot: commands.Bot):
@@ -2,16 +2,18 @@ import discord
 from discord.ext import commands
 
 from config import Config
-from dms.localization import LANGS, t
+from dms.localization import available_languages, t
 from dms.onboarding_flow import (
     GameRolesView,
     ArmaRolesView,
     _build_game_roles_embed,
     _build_arma_roles_embed,
+    has_role_options,
     RegisterRecruitButton,
 )
 from database.service import get_or_create_user_from_member
 from utils.lang import get_lang_for_member, get_lang_for_user
+from utils.members import resolve_member
 
 
 def _render_roles(defs: list[dict], lang: str, empty_text: str) -> str:
@@ -75,7 +77,15 @@ class PanelGamesButton(discord.ui.Button):
             )
             return
 
-        if not getattr(Config, "GAME_ROLE_DEFINITIONS", []):
+        member = await resolve_member(guild, interaction.user.id)
+        if member is None:
+            await interaction.response.send_message(
+                t(lang, "not_in_guild"),
+                ephemeral=True,
+            )
+            return
+
+        if not has_role_options("game", lang):
             await interaction.response.send_message(
                 t(lang, "no_game_roles"),
                 ephemeral=True,
@@ -87,6 +97,7 @@ class PanelGamesButton(discord.ui.Button):
             bot=view.bot,
             guild_id=guild.id,
             lang=lang,
+            member=member,
         )
 
         await interaction.response.send_message(
@@ -118,25 +129,22 @@ class PanelArmaButton(discord.ui.Button):
             )
             return
 
-        member = guild.get_member(interaction.user.id)
+        member = await resolve_member(guild, interaction.user.id)
         if member is None:
-            try:
-                member = await guild.fetch_member(interaction.user.id)
-            except discord.DiscordException:
-                await interaction.response.send_message(
-                    t(lang, "not_in_guild"),
-                    ephemeral=True,
-                )
-                return
+            await interaction.response.send_message(
+                t(lang, "not_in_guild"),
+                ephemeral=True,
+            )
+            return
 
-        if not getattr(Config, "ARMA_ROLE_DEFINITIONS", []):
+        if not has_role_options("arma", lang):
             await interaction.response.send_message(
                 t(lang, "no_arma_roles"),
                 ephemeral=True,
             )
             return
 
-        user = get_or_create_user_from_member(member)
+        user = await get_or_create_user_from_member(member)
         status = (user.recruit_status or "pending").lower()
 
         if status != "done":
@@ -151,6 +159,7 @@ class PanelArmaButton(discord.ui.Button):
             bot=view.bot,
             guild_id=guild.id,
             lang=lang,
+            member=member,
         )
 
         await interaction.response.send_message(
@@ -177,10 +186,8 @@ class ServerRolesPanelView(discord.ui.View):
         self.add_item(PanelGamesButton(self.lang))
         self.add_item(PanelArmaButton(self.lang))
 
-        # Clone register button so it can display in the server panel as well
-        recruit_btn = RegisterRecruitButton()
-        recruit_btn.label = t(lang, "btn_recruit")
-        self.add_item(recruit_btn)
+        # Same dynamic register button as in DMs; the guild comes from the interaction
+        self.add_item(RegisterRecruitButton(lang))
 
 
 class RolesPanel(commands.Cog):
@@ -209,14 +216,15 @@ class RolesPanel(commands.Cog):
 
         # Resolve language: explicit param > member preference > default
         if lang:
-            if lang not in LANGS:
-                await ctx.send(f"Unknown language. Use: {', '.join(LANGS.keys())}")
+            languages = available_languages()
+            if lang not in languages:
+                await ctx.send(f"Unknown language. Use: {', '.join(languages)}")
                 return
         else:
             if isinstance(ctx.author, discord.Member):
-                lang = get_lang_for_member(ctx.author)
+                lang = await get_lang_for_member(ctx.author)
             elif isinstance(ctx.author, discord.abc.User):
-                lang = get_lang_for_user(ctx.author)
+                lang = await get_lang_for_user(ctx.author)
             else:
                 lang = getattr(Config, "DEFAULT_LANG", "en")
 
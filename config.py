@@ -1,223 +1,311 @@
-﻿import os
+﻿"""
+Bot configuration.
+
+Settings are parsed from the environment (and .env) once, on first access of any
+Config attribute. Every numeric id is validated up front. Localized defaults such
+as role labels are built on first use, so importing this module (e.g. from
+database/db.py or Alembic) never loads the localization catalog.
+"""
+
+import os
+from functools import cached_property
+from typing import Optional
+
 from dotenv import load_dotenv
-from dms.localization import t
-
-load_dotenv()
-
-
-class Config:
-    """Bot configuration class."""
-
-    _raw_db_url = os.getenv("DATABASE_URL")
-
-    # Heroku provides postgres://, SQLAlchemy expects postgresql+psycopg2://
-    if _raw_db_url and _raw_db_url.startswith("postgres://"):
-        _raw_db_url = _raw_db_url.replace("postgres://", "postgresql+psycopg2://", 1)
-
-    # Fallback URL for local development
-    DATABASE_URL = _raw_db_url or "sqlite:///bot.db"
-
-    # Discord bot token (required)
-    TOKEN: str | None = os.getenv("DISCORD_TOKEN")
-
-    # Command prefix
-    PREFIX: str = os.getenv("COMMAND_PREFIX", "!")
-
-    # Bot owner ID (optional)
-    OWNER_ID: int | None = int(os.getenv("OWNER_ID")) if os.getenv("OWNER_ID") else None
-
-    # Welcome/onboarding text used in DM greeting
-    WELCOME_MESSAGE_ENG: str = os.getenv(
-        "WELCOME_MESSAGE",
-        t("en", "welcome_message_default"),
-    )
-
-    WELCOME_MESSAGE_RUS: str = os.getenv(
-        "WELCOME_MESSAGE_RUS",
-        t("ru", "welcome_message_default"),
-    )
-
-    # Discord channel ID used as fallback when a DM cannot be delivered
-    FALLBACK_CHANNEL_ID: int = int(os.getenv("FALLBACK_CHANNEL_ID", "0"))
-
-    # Default language for UI text shown outside user-specific context (e.g., role_panel)
-    DEFAULT_LANG: str = os.getenv("DEFAULT_LANG", "ru")
-
-    # Game role definitions shown in role selection panels; structure: id, label_en/label_ru, emoji
-    GAME_ROLE_DEFINITIONS: list[dict] = [
-        {
-            "id": int(os.getenv("GAME_ROLE_ARMA3_ID", "0")),
-            "label_en": t("en", "config_game_role_arma3_label"),
-            "label_ru": t("ru", "config_game_role_arma3_label"),
-            "description_en": t("en", "config_game_role_arma3_description"),
-            "description_ru": t("ru", "config_game_role_arma3_description"),
-            "emoji": "<:ARMA3:1444025332586905711>",
-        },
-        {
-            "id": int(os.getenv("GAME_ROLE_SQUAD_ID", "0")),
-            "label_en": t("en", "config_game_role_squad_label"),
-            "label_ru": t("ru", "config_game_role_squad_label"),
-            "description_en": t("en", "config_game_role_squad_description"),
-            "description_ru": t("ru", "config_game_role_squad_description"),
-            "emoji": "<:SQUAD:1444025248323207330>",
-        },
-        {
-            "id": int(os.getenv("GAME_ROLE_CSGO_ID", "0")),
-            "label_en": t("en", "config_game_role_csgo_label"),
-            "label_ru": t("ru", "config_game_role_csgo_label"),
-            "description_en": t("en", "config_game_role_csgo_description"),
-            "description_ru": t("ru", "config_game_role_csgo_description"),
-            "emoji": "<:CSGO:1444025289708666981>",
-        },
-        {
-            "id": int(os.getenv("GAME_ROLE_MINECRAFT_ID", "0")),
-            "label_en": t("en", "config_game_role_minecraft_label"),
-            "label_ru": t("ru", "config_game_role_minecraft_label"),
-            "description_en": t("en", "config_game_role_minecraft_description"),
-            "description_ru": t("ru", "config_game_role_minecraft_description"),
-            "emoji": "<:MINECRAFT:1444025385754034377>",
-        },
-        {
-            "id": int(os.getenv("GAME_ROLE_RUST_ID", "0")),
-            "label_en": t("en", "config_game_role_rust_label"),
-            "label_ru": t("ru", "config_game_role_rust_label"),
-            "description_en": t("en", "config_game_role_rust_description"),
-            "description_ru": t("ru", "config_game_role_rust_description"),
-            "emoji": "<:RUST:1444025421225267230>",
-        },
-        # Add/edit items above as needed: id, label_en/label_ru, emoji
-    ]
-
-    ARMA_ROLE_DEFINITIONS = [
-        {
-            "id": int(os.getenv("ARMA_ROLE_SQUAD_LEADER_ID", "0")),
-            "label_en": t("en", "config_arma_role_squad_leader_label"),
-            "label_ru": t("ru", "config_arma_role_squad_leader_label"),
-            "description_en": t("en", "config_arma_role_squad_leader_description"),
-            "description_ru": t("ru", "config_arma_role_squad_leader_description"),
-            "emoji": "🗺️",
-        },
-        {
-            "id": int(os.getenv("ARMA_ROLE_TEAM_LEADER_ID", "0")),
-            "label_en": t("en", "config_arma_role_team_leader_label"),
-            "label_ru": t("ru", "config_arma_role_team_leader_label"),
-            "description_en": t("en", "config_arma_role_team_leader_description"),
-            "description_ru": t("ru", "config_arma_role_team_leader_description"),
-            "emoji": "📡",
-        },
-        {
-            "id": int(os.getenv("ARMA_ROLE_RIFLEMAN_ID", "0")),
-            "label_en": t("en", "config_arma_role_rifleman_label"),
-            "label_ru": t("ru", "config_arma_role_rifleman_label"),
-            "description_en": t("en", "config_arma_role_rifleman_description"),
-            "description_ru": t("ru", "config_arma_role_rifleman_description"),
-            "emoji": "🎯",
-        },
-        {
-            "id": int(os.getenv("ARMA_ROLE_MEDIC_ID", "0")),
-            "label_en": t("en", "config_arma_role_medic_label"),
-            "label_ru": t("ru", "config_arma_role_medic_label"),
-            "description_en": t("en", "config_arma_role_medic_description"),
-            "description_ru": t("ru", "config_arma_role_medic_description"),
-            "emoji": "🩺",
-        },
-        {
-            "id": int(os.getenv("ARMA_ROLE_AUTORIFLEMAN_ID", "0")),
-            "label_en": t("en", "config_arma_role_autorifleman_label"),
-            "label_ru": t("ru", "config_arma_role_autorifleman_label"),
-            "description_en": t("en", "config_arma_role_autorifleman_description"),
-            "description_ru": t("ru", "config_arma_role_autorifleman_description"),
-            "emoji": "💥",
-        },
-        {
-            "id": int(os.getenv("ARMA_ROLE_AT_SPECIALIST_ID", "0")),
-            "label_en": t("en", "config_arma_role_at_specialist_label"),
-            "label_ru": t("ru", "config_arma_role_at_specialist_label"),
-            "description_en": t("en", "config_arma_role_at_specialist_description"),
-            "description_ru": t("ru", "config_arma_role_at_specialist_description"),
-            "emoji": "🚀",
-        },
-        {
-            "id": int(os.getenv("ARMA_ROLE_MARKSMAN_ID", "0")),
-            "label_en": t("en", "config_arma_role_marksman_label"),
-            "label_ru": t("ru", "config_arma_role_marksman_label"),
-            "description_en": t("en", "config_arma_role_marksman_description"),
-            "description_ru": t("ru", "config_arma_role_marksman_description"),
-            "emoji": "🎯",
-        },
-        {
-            "id": int(os.getenv("ARMA_ROLE_ENGINEER_ID", "0")),
-            "label_en": t("en", "config_arma_role_engineer_label"),
-            "label_ru": t("ru", "config_arma_role_engineer_label"),
-            "description_en": t("en", "config_arma_role_engineer_description"),
-            "description_ru": t("ru", "config_arma_role_engineer_description"),
-            "emoji": "🔧",
-        },
-    ]
-
-    # Recruit role ID (button "Register as Recruit")
-    RECRUIT_ROLE_ID: int = int(os.getenv("RECRUIT_ROLE_ID", "0"))
-
-    # Static list of roles that can be self-assigned via onboarding DM
-    ROLE_DEFINITIONS_ENG: list[dict] = [
-        {
-            "label": t("en", "role_def_assault_label"),
-            "description": t("en", "role_def_assault_description"),
-            "id": int(os.getenv("ROLE_ASSAULT_ID", "0")),
-        },
-        {
-            "label": t("en", "role_def_medic_label"),
-            "description": t("en", "role_def_medic_description"),
-            "id": int(os.getenv("ROLE_MEDIC_ID", "0")),
-        },
-        {
-            "label": t("en", "role_def_pilot_label"),
-            "description": t("en", "role_def_pilot_description"),
-            "id": int(os.getenv("ROLE_PILOT_ID", "0")),
-        },
-        {
-            "label": t("en", "role_def_support_label"),
-            "description": t("en", "role_def_support_description"),
-            "id": int(os.getenv("ROLE_SUPPORT_ID", "0")),
-        },
-    ]
-
-    ROLE_DEFINITIONS_RUS: list[dict] = [
-        {
-            "label": t("ru", "role_def_assault_label"),
-            "description": t("ru", "role_def_assault_description"),
-            "id": int(os.getenv("ROLE_ASSAULT_ID", "0")),
-        },
-        {
-            "label": t("ru", "role_def_medic_label"),
-            "description": t("ru", "role_def_medic_description"),
-            "id": int(os.getenv("ROLE_MEDIC_ID", "0")),
-        },
-        {
-            "label": t("ru", "role_def_pilot_label"),
-            "description": t("ru", "role_def_pilot_description"),
-            "id": int(os.getenv("ROLE_PILOT_ID", "0")),
-        },
-        {
-            "label": t("ru", "role_def_support_label"),
-            "description": t("ru", "role_def_support_description"),
-            "id": int(os.getenv("ROLE_SUPPORT_ID", "0")),
-        },
-    ]
-
-    RECRUITER_ROLE_ID: int = int(os.getenv("RECRUITER_ROLE_ID") or "0")
-    RECRUIT_CATEGORY_ID: int = int(os.getenv("RECRUIT_CATEGORY_ID") or "0")
-
-    # Member role that is granted after recruit approval
-    MEMBER_ROLE_ID: int = int(os.getenv("MEMBER_ROLE_ID", "0"))
-
-    # Category used to store archived recruit channels (0 disables archiving)
-    RECRUIT_ARCHIVE_CATEGORY_ID: int = int(os.getenv("RECRUIT_ARCHIVE_CATEGORY_ID", "0"))
-
-    @staticmethod
-    def validate() -> bool:
+
+# (env var, localization key stem, emoji) of the game roles shown in role panels
+_GAME_ROLES = (
+    ("GAME_ROLE_ARMA3_ID", "arma3", "<:ARMA3:1444025332586905711>"),
+    ("GAME_ROLE_SQUAD_ID", "squad", "<:SQUAD:1444025248323207330>"),
+    ("GAME_ROLE_CSGO_ID", "csgo", "<:CSGO:1444025289708666981>"),
+    ("GAME_ROLE_MINECRAFT_ID", "minecraft", "<:MINECRAFT:1444025385754034377>"),
+    ("GAME_ROLE_RUST_ID", "rust", "<:RUST:1444025421225267230>"),
+    # Add/edit items above as needed: env var, key stem, emoji
+)
+
+# ARMA operation roles, available to recruits with status 'done'
+_ARMA_ROLES = (
+    ("ARMA_ROLE_SQUAD_LEADER_ID", "squad_leader", "🗺️"),
+    ("ARMA_ROLE_TEAM_LEADER_ID", "team_leader", "📡"),
+    ("ARMA_ROLE_RIFLEMAN_ID", "rifleman", "🎯"),
+    ("ARMA_ROLE_MEDIC_ID", "medic", "🩺"),
+    ("ARMA_ROLE_AUTORIFLEMAN_ID", "autorifleman", "💥"),
+    ("ARMA_ROLE_AT_SPECIALIST_ID", "at_specialist", "🚀"),
+    ("ARMA_ROLE_MARKSMAN_ID", "marksman", "🎯"),
+    ("ARMA_ROLE_ENGINEER_ID", "engineer", "🔧"),
+)
+
+# Self-assignable roles from the legacy onboarding DM
+_LEGACY_ROLES = (
+    ("ROLE_ASSAULT_ID", "assault"),
+    ("ROLE_MEDIC_ID", "medic"),
+    ("ROLE_PILOT_ID", "pilot"),
+    ("ROLE_SUPPORT_ID", "support"),
+)
+
+# Role / channel / category ids that must be Discord snowflakes (0 = not configured)
+_ID_VARS = (
+    "FALLBACK_CHANNEL_ID",
+    "RECRUIT_ROLE_ID",
+    "RECRUITER_ROLE_ID",
+    "RECRUIT_CATEGORY_ID",
+    "MEMBER_ROLE_ID",
+    "RECRUIT_ARCHIVE_CATEGORY_ID",
+    *(env for env, _, _ in _GAME_ROLES),
+    *(env for env, _, _ in _ARMA_ROLES),
+    *(env for env, _ in _LEGACY_ROLES),
+)
+
+
+class Settings:
+    """Typed bot settings parsed from the environment."""
+
+    DATABASE_URL: str
+    DB_POOL_SIZE: int
+    DB_MAX_OVERFLOW: int
+    DB_POOL_TIMEOUT: int
+    DB_POOL_RECYCLE: int
+    DB_STATEMENT_TIMEOUT_MS: int
+    TOKEN: str | None
+    PREFIX: str
+    OWNER_ID: int | None
+    FALLBACK_CHANNEL_ID: int
+    ONBOARDING_DM_WORKERS: int
+    ONBOARDING_DM_RATE: float
+    ONBOARDING_DM_BURST: int
+    ONBOARDING_DM_MAX_ATTEMPTS: int
+    DEFAULT_LANG: str
+    RECRUIT_ROLE_ID: int
+    RECRUITER_ROLE_ID: int
+    RECRUIT_CATEGORY_ID: int
+    RECRUIT_ADVISORY_LOCKS: bool
+    MEMBER_ROLE_ID: int
+    RECRUIT_ARCHIVE_CATEGORY_ID: int
+    USER_CACHE_SIZE: int
+    USER_CACHE_TTL: int
+    LANGUAGE_CACHE_TTL: int
+    MEMBER_CACHE_SIZE: int
+    MEMBER_CACHE_TTL: int
+    MEMBER_MISSING_TTL: int
+    PROFILE_FLUSH_INTERVAL: int
+    CACHE_WARMUP: bool
+    SHARDING: bool
+    SHARD_COUNT: Optional[int]
+    SHARD_IDS: Optional[list[int]]
+
+    def __init__(self, env: dict[str, str]):
+        self._env = env
+        self._errors: list[str] = []
+
+        raw_db_url = env.get("DATABASE_URL")
+        # Heroku provides postgres://, SQLAlchemy expects postgresql+psycopg2://
+        if raw_db_url and raw_db_url.startswith("postgres://"):
+            raw_db_url = raw_db_url.replace("postgres://", "postgresql+psycopg2://", 1)
+        # Fallback URL for local development
+        self.DATABASE_URL = raw_db_url or "sqlite:///bot.db"
+
+        # Connection pool sizing and policies for the bot's database engine
+        self.DB_POOL_SIZE = self._int("DB_POOL_SIZE", 5)
+        self.DB_MAX_OVERFLOW = self._int("DB_MAX_OVERFLOW", 5)
+        self.DB_POOL_TIMEOUT = self._int("DB_POOL_TIMEOUT", 30)
+        # Recycle connections before Heroku Postgres drops them as idle (seconds)
+        self.DB_POOL_RECYCLE = self._int("DB_POOL_RECYCLE", 1800)
+        # Server-side per-statement timeout in milliseconds (PostgreSQL only, 0 disables)
+        self.DB_STATEMENT_TIMEOUT_MS = self._int("DB_STATEMENT_TIMEOUT_MS", 15000)
+
+        # Discord bot token (required) and command prefix
+        self.TOKEN = env.get("DISCORD_TOKEN")
+        self.PREFIX = env.get("COMMAND_PREFIX", "!")
+
+        # Bot owner ID (optional)
+        self.OWNER_ID = self._snowflake("OWNER_ID") or None
+
+        # Onboarding DM dispatch queue: worker count, pacing (DMs per second, burst) and retries
+        self.ONBOARDING_DM_WORKERS = self._int("ONBOARDING_DM_WORKERS", 2)
+        self.ONBOARDING_DM_RATE = self._float("ONBOARDING_DM_RATE", 1.0)
+        self.ONBOARDING_DM_BURST = self._int("ONBOARDING_DM_BURST", 5)
+        self.ONBOARDING_DM_MAX_ATTEMPTS = self._int("ONBOARDING_DM_MAX_ATTEMPTS", 4)
+
+        # Default language for UI text shown outside user-specific context (e.g., role_panel)
+        self.DEFAULT_LANG = env.get("DEFAULT_LANG", "ru")
+
+        # Every role / channel id is parsed here so a typo fails at startup, not on first click
+        self._ids = {name: self._snowflake(name) for name in _ID_VARS}
+        self.FALLBACK_CHANNEL_ID = self._ids["FALLBACK_CHANNEL_ID"]
+        # Recruit role ID (button "Register as Recruit")
+        self.RECRUIT_ROLE_ID = self._ids["RECRUIT_ROLE_ID"]
+        self.RECRUITER_ROLE_ID = self._ids["RECRUITER_ROLE_ID"]
+        self.RECRUIT_CATEGORY_ID = self._ids["RECRUIT_CATEGORY_ID"]
+        # Member role that is granted after recruit approval
+        self.MEMBER_ROLE_ID = self._ids["MEMBER_ROLE_ID"]
+        # Category used to store archived recruit channels (0 disables archiving)
+        self.RECRUIT_ARCHIVE_CATEGORY_ID = self._ids["RECRUIT_ARCHIVE_CATEGORY_ID"]
+
+        # Also take a PostgreSQL advisory lock per recruit so several bot processes
+        # never create channels for the same recruit at once
+        self.RECRUIT_ADVISORY_LOCKS = self._bool("RECRUIT_ADVISORY_LOCKS", False)
+
+        # In-process cache of users rows keyed by discord_id (0 disables caching)
+        self.USER_CACHE_SIZE = self._int("USER_CACHE_SIZE", 2048)
+        self.USER_CACHE_TTL = self._int("USER_CACHE_TTL", 600)
+
+        # Seconds a cached language stays valid (0 disables the language cache)
+        self.LANGUAGE_CACHE_TTL = self._int("LANGUAGE_CACHE_TTL", 600)
+
+        # Members fetched over REST are kept for MEMBER_CACHE_TTL seconds and
+        # "not in guild" answers for MEMBER_MISSING_TTL seconds
+        self.MEMBER_CACHE_SIZE = self._int("MEMBER_CACHE_SIZE", 1024)
+        self.MEMBER_CACHE_TTL = self._int("MEMBER_CACHE_TTL", 300)
+        self.MEMBER_MISSING_TTL = self._int("MEMBER_MISSING_TTL", 60)
+
+        # Seconds between batched write-behind flushes of changed member profiles
+        self.PROFILE_FLUSH_INTERVAL = self._int("PROFILE_FLUSH_INTERVAL", 30)
+
+        # After on_ready, load users of connected guilds into the user and language
+        # caches with one streaming query in the background
+        self.CACHE_WARMUP = self._bool("CACHE_WARMUP", False)
+
+        # Run as AutoShardedBot. SHARD_COUNT unset lets Discord choose the count;
+        # SHARD_IDS (e.g. "0,1") limits this process to a range of shards so the
+        # rest can run in other processes with the same SHARD_COUNT. The user,
+        # language and member caches are per process: a change made through one
+        # process is seen by the others only once their entries expire
+        self.SHARDING = self._bool("SHARDING", False)
+        self.SHARD_COUNT = self._int("SHARD_COUNT", 0) or None
+        self.SHARD_IDS = self._int_list("SHARD_IDS") or None
+        if self.SHARD_IDS is not None:
+            if self.SHARD_COUNT is None:
+                self._errors.append("SHARD_IDS requires SHARD_COUNT")
+            elif any(i >= self.SHARD_COUNT for i in self.SHARD_IDS):
+                self._errors.append(f"SHARD_IDS must be below SHARD_COUNT={self.SHARD_COUNT}")
+
+        if self._errors:
+            raise ValueError("Invalid configuration: " + "; ".join(self._errors))
+
+    # --------- Parsing helpers ---------
+
+    def _int(self, name: str, default: int) -> int:
+        raw = self._env.get(name) or str(default)
+        try:
+            return int(raw)
+        except ValueError:
+            self._errors.append(f"{name}={raw!r} is not an integer")
+            return default
+
+    def _float(self, name: str, default: float) -> float:
+        raw = self._env.get(name) or str(default)
+        try:
+            return float(raw)
+        except ValueError:
+            self._errors.append(f"{name}={raw!r} is not a number")
+            return default
+
+    def _bool(self, name: str, default: bool) -> bool:
+        raw = self._env.get(name)
+        if raw is None:
+            return default
+        return raw.strip().lower() in ("1", "true", "yes")
+
+    def _int_list(self, name: str) -> list[int]:
+        raw = (self._env.get(name) or "").strip()
+        values = []
+        for part in filter(None, (p.strip() for p in raw.split(","))):
+            if not part.isdigit():
+                self._errors.append(f"{name}={raw!r} is not a comma-separated list of integers")
+                return []
+            values.append(int(part))
+        return values
+
+    def _snowflake(self, name: str) -> int:
+        raw = (self._env.get(name) or "0").strip()
+        if not raw.isdigit():
+            self._errors.append(f"{name}={raw!r} is not a Discord id")
+            return 0
+        return int(raw)
+
+    # --------- Localized defaults (built on first use) ---------
+
+    @cached_property
+    def WELCOME_MESSAGE_ENG(self) -> str:
+        """Welcome/onboarding text used in DM greeting."""
+        from dms.localization import t
+        return self._env.get("WELCOME_MESSAGE") or t("en", "welcome_message_default")
+
+    @cached_property
+    def WELCOME_MESSAGE_RUS(self) -> str:
+        from dms.localization import t
+        return self._env.get("WELCOME_MESSAGE_RUS") or t("ru", "welcome_message_default")
+
+    def _localized_roles(self, specs, prefix: str) -> list[dict]:
+        from dms.localization import t
+        return [
+            {
+                "id": self._ids[env],
+                "label_en": t("en", f"{prefix}_{stem}_label"),
+                "label_ru": t("ru", f"{prefix}_{stem}_label"),
+                "description_en": t("en", f"{prefix}_{stem}_description"),
+                "description_ru": t("ru", f"{prefix}_{stem}_description"),
+                "emoji": emoji,
+            }
+            for env, stem, emoji in specs
+        ]
+
+    @cached_property
+    def GAME_ROLE_DEFINITIONS(self) -> list[dict]:
+        """Game roles shown in role selection panels: id, label_en/label_ru, description, emoji."""
+        return self._localized_roles(_GAME_ROLES, "config_game_role")
+
+    @cached_property
+    def ARMA_ROLE_DEFINITIONS(self) -> list[dict]:
+        return self._localized_roles(_ARMA_ROLES, "config_arma_role")
+
+    def _legacy_roles(self, lang: str) -> list[dict]:
+        from dms.localization import t
+        return [
+            {
+                "label": t(lang, f"role_def_{stem}_label"),
+                "description": t(lang, f"role_def_{stem}_description"),
+                "id": self._ids[env],
+            }
+            for env, stem in _LEGACY_ROLES
+        ]
+
+    @cached_property
+    def ROLE_DEFINITIONS_ENG(self) -> list[dict]:
+        """Static list of roles that can be self-assigned via onboarding DM."""
+        return self._legacy_roles("en")
+
+    @cached_property
+    def ROLE_DEFINITIONS_RUS(self) -> list[dict]:
+        return self._legacy_roles("ru")
+
+    def validate(self) -> bool:
         """Validate that required configuration is present."""
-        lang = getattr(Config, "DEFAULT_LANG", "en")
-        if not Config.TOKEN:
-            raise ValueError(t(lang, "missing_discord_token_env"))
+        if not self.TOKEN:
+            from dms.localization import t
+            raise ValueError(t(self.DEFAULT_LANG, "missing_discord_token_env"))
         return True
+
+
+_settings: Settings | None = None
+
+
+def get_settings() -> Settings:
+    """Parse the environment on first call and return the shared Settings."""
+    global _settings
+    if _settings is None:
+        load_dotenv()
+        _settings = Settings(dict(os.environ))
+    return _settings
+
+
+class _LazyConfig:
+    """Module-level Config: attribute access builds the Settings on first use."""
+
+    __slots__ = ()
+
+    def __getattr__(self, name: str):
+        return getattr(get_settings(), name)
+
+
+Config = _LazyConfig()
@@ -0,0 +1,132 @@
+# database/cache.py
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from config import Config
+from .models import User
+
+
+class UserCache:
+    """
+    In-process LRU cache of User rows keyed by discord_id.
+    Entries expire after ttl seconds; the least recently used entry is evicted
+    once max_size is reached. Cached rows are detached; only the service layer
+    may modify them.
+    """
+
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[int, tuple[float, User]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, discord_id: int) -> Optional[User]:
+        """Return a cached user or None, counting the lookup as a hit or miss."""
+        entry = self._entries.get(discord_id)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, user = entry
+        if expires_at < time.monotonic():
+            del self._entries[discord_id]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(discord_id)
+        self.hits += 1
+        return user
+
+    def put(self, user: User) -> None:
+        """Store or replace the cached row for user.discord_id."""
+        if self.max_size <= 0:
+            return
+
+        self._entries[user.discord_id] = (time.monotonic() + self.ttl, user)
+        self._entries.move_to_end(user.discord_id)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def put_if_missing(self, user: User) -> bool:
+        """Store user unless a live entry already exists (which may be fresher)."""
+        entry = self._entries.get(user.discord_id)
+        if entry is not None and entry[0] >= time.monotonic():
+            return False
+        self.put(user)
+        return True
+
+    def invalidate(self, discord_id: int) -> None:
+        """Drop the cached row for discord_id if present."""
+        self._entries.pop(discord_id, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        """Return counters for diagnostics."""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": (self.hits / lookups) if lookups else 0.0,
+        }
+
+
+class LanguageCache:
+    """
+    Memoized discord_id -> language map used for read-only language lookups.
+    A missing entry is unknown, never "no language set": rows may be inserted
+    after warm() by another process or a script, so callers read the database.
+    Entries expire after ttl seconds, so a language changed by another bot
+    process is picked up within ttl; ttl=0 disables caching.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._languages: dict[int, tuple[float, Optional[str]]] = {}
+
+    def lookup(self, discord_id: int) -> tuple[bool, Optional[str]]:
+        """Return (known, language) for discord_id."""
+        entry = self._languages.get(discord_id)
+        if entry is None:
+            return False, None
+        expires_at, language = entry
+        if expires_at < time.monotonic():
+            del self._languages[discord_id]
+            return False, None
+        return True, language
+
+    def set(self, discord_id: int, language: Optional[str]) -> None:
+        if self.ttl <= 0:
+            return
+        self._languages[discord_id] = (time.monotonic() + self.ttl, language)
+
+    def warm(self, languages: dict[int, Optional[str]]) -> None:
+        """
+        Preload a snapshot of the users table. Entries set while the snapshot
+        was being read are at least as fresh, so they take precedence.
+        """
+        if self.ttl <= 0:
+            return
+        expires_at = time.monotonic() + self.ttl
+        merged = {discord_id: (expires_at, lang) for discord_id, lang in languages.items()}
+        merged.update(self._languages)
+        self._languages = merged
+
+    def __len__(self) -> int:
+        return len(self._languages)
+
+
+user_cache = UserCache(
+    max_size=Config.USER_CACHE_SIZE,
+    ttl=Config.USER_CACHE_TTL,
+)
+
+language_cache = LanguageCache(ttl=Config.LANGUAGE_CACHE_TTL)
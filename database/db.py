@@ -1,13 +1,117 @@
 # database/db.py
-from sqlalchemy import create_engine
-from sqlalchemy.orm import declarative_base, sessionmaker
+import time
+
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from config import Config
 
-engine = create_engine(Config.DATABASE_URL, echo=False, future=True)
-SessionLocal = sessionmaker(
+# Async drivers used by the bot at runtime. Alembic keeps using the sync URL from Config.
+_ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+
+def _to_async_url(raw_url: str) -> str:
+    """Swap the sync driver in a database URL for its asyncio counterpart."""
+    url = make_url(raw_url)
+    backend = url.get_backend_name()
+    driver = _ASYNC_DRIVERS.get(backend)
+    if driver is None:
+        return raw_url
+    return url.set(drivername=driver).render_as_string(hide_password=False)
+
+
+class PoolMetrics:
+    """Checkout wait statistics collected by MeteredQueuePool."""
+
+    def __init__(self):
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def record(self, wait: float, timed_out: bool) -> None:
+        self.checkouts += 1
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+        if timed_out:
+            self.timeouts += 1
+
+    def stats(self) -> dict:
+        return {
+            "count": self.checkouts,
+            "timeouts": self.timeouts,
+            "avg_ms": (self.total_wait / self.checkouts * 1000) if self.checkouts else 0.0,
+            "max_ms": self.max_wait * 1000,
+        }
+
+
+pool_metrics = PoolMetrics()
+
+
+class MeteredQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long each checkout waited for a connection."""
+
+    def _do_get(self):
+        started = time.perf_counter()
+        timed_out = False
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            timed_out = True
+            raise
+        finally:
+            pool_metrics.record(time.perf_counter() - started, timed_out)
+
+
+def get_pool_stats() -> dict:
+    """Return current pool gauges (connections in use, idle, overflow) plus wait metrics."""
+    pool = engine.pool
+    stats = {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        "overflow": max(pool.overflow(), 0),
+        "max_overflow": Config.DB_MAX_OVERFLOW,
+    }
+    stats.update(pool_metrics.stats())
+    return stats
+
+
+def _engine_options(url: str) -> dict:
+    """Build pool and timeout options for the async engine from Config."""
+    options = {
+        "poolclass": MeteredQueuePool,
+        "pool_size": Config.DB_POOL_SIZE,
+        "max_overflow": Config.DB_MAX_OVERFLOW,
+        "pool_timeout": Config.DB_POOL_TIMEOUT,
+        "pool_recycle": Config.DB_POOL_RECYCLE,
+        # Test connections on checkout so idle-dropped Postgres connections are replaced
+        "pool_pre_ping": True,
+    }
+
+    timeout_ms = Config.DB_STATEMENT_TIMEOUT_MS
+    if timeout_ms and make_url(url).get_backend_name() == "postgresql":
+        options["connect_args"] = {
+            "server_settings": {"statement_timeout": str(timeout_ms)},
+        }
+    return options
+
+
+ASYNC_DATABASE_URL = _to_async_url(Config.DATABASE_URL)
+
+engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    echo=False,
+    **_engine_options(ASYNC_DATABASE_URL),
+)
+SessionLocal = async_sessionmaker(
     bind=engine,
     autoflush=False,
-    autocommit=False,
     expire_on_commit=False,
 )
 Base = declarative_base()
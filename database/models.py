@@ -1,5 +1,5 @@
 # database/models.py
-from sqlalchemy import Boolean, Column, Integer, BigInteger, String
+from sqlalchemy import Boolean, Column, Index, Integer, BigInteger, String
 from .db import Base
 
 class User(Base):
@@ -21,3 +21,11 @@ class User(Base):
     recruit_text_channel_id = Column(BigInteger, nullable=True)
     recruit_voice_channel_id = Column(BigInteger, nullable=True)
 
+    __table_args__ = (
+        # Serves the per-status recruit listings, which filter by status and order by id
+        Index("ix_users_recruit_status_id", "recruit_status", "id"),
+    )
+
+    # Async sessions cannot lazy-load expired columns, so fetch server defaults on INSERT.
+    __mapper_args__ = {"eager_defaults": True}
+
@@ -0,0 +1,129 @@
+# database/profile_sync.py
+import asyncio
+import sys
+
+from discord import Member
+from sqlalchemy import update
+
+from config import Config
+from .models import User
+
+
+class ProfileRefresher:
+    """
+    Write-behind buffer for username / display_name / is_admin.
+    Changes are compared against the cached row, queued by primary key and
+    written in one batched UPDATE every interval seconds (and on shutdown).
+    """
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._pending: dict[int, dict] = {}
+        self._task: asyncio.Task | None = None
+        self.queued = 0
+        self.skipped = 0
+        self.flushed = 0
+
+    @staticmethod
+    def profile_of(member: Member) -> dict:
+        """Return the profile columns for a member."""
+        return {
+            "username": member.name,
+            "display_name": member.display_name,
+            "is_admin": bool(member.guild_permissions.administrator),
+        }
+
+    def queue(self, user: User, member: Member) -> bool:
+        """
+        Queue a profile update if the member differs from the stored row.
+        The row is updated in memory right away so cached reads stay current.
+        Returns True if a change was queued.
+        """
+        profile = self.profile_of(member)
+        changed = {
+            key: value
+            for key, value in profile.items()
+            if getattr(user, key) != value
+        }
+        if not changed:
+            self.skipped += 1
+            return False
+
+        for key, value in changed.items():
+            setattr(user, key, value)
+
+        self._pending.setdefault(user.id, {"id": user.id}).update(changed)
+        self.queued += 1
+        return True
+
+    def discard(self, user: User) -> None:
+        """
+        Drop queued changes for user, e.g. when a unit of work writes the current
+        profile itself; a later flush must not overwrite it with older values.
+        """
+        self._pending.pop(user.id, None)
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    async def flush(self) -> int:
+        """Write all queued changes in one batched UPDATE. Returns the number of rows written."""
+        if not self._pending:
+            return 0
+
+        from .service import get_session  # Local import: service imports this module
+
+        batch = list(self._pending.values())
+        self._pending = {}
+        try:
+            async with get_session() as db:
+                await db.execute(update(User), batch)
+        except Exception:
+            # Put the batch back without overwriting anything queued meanwhile
+            for row in batch:
+                newer = self._pending.get(row["id"])
+                if newer is not None:
+                    row.update(newer)
+                self._pending[row["id"]] = row
+            raise
+
+        self.flushed += len(batch)
+        return len(batch)
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                print(f"[ProfileRefresher ERROR] {type(e).__name__}: {e}", file=sys.stderr)
+
+    def start(self) -> None:
+        """Start the periodic flush task."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the periodic task and write anything still queued."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+    def stats(self) -> dict:
+        return {
+            "pending": self.pending,
+            "queued": self.queued,
+            "skipped": self.skipped,
+            "flushed": self.flushed,
+        }
+
+
+profile_refresher = ProfileRefresher(
+    interval=Config.PROFILE_FLUSH_INTERVAL,
+)
@@ -1,79 +1,273 @@
 ﻿# database/service.py
-from contextlib import contextmanager
+import time
+from contextlib import asynccontextmanager
 
-from typing import List, Optional
+from typing import Awaitable, Callable, Iterable, List, Optional
 from discord import Member
+from sqlalchemy import func, or_, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from .db import SessionLocal
+from .cache import language_cache, user_cache
+from .db import SessionLocal, engine
 from .models import User
+from .profile_sync import profile_refresher
+from .uow import UnitOfWork
 
 
-@contextmanager
-def get_session():
-    db = SessionLocal()
-    try:
-        yield db
-        db.commit()
-    except Exception:
-        db.rollback()
-        raise
-    finally:
-        db.close()
-
-
-def get_or_create_user(discord_id: int) -> User:
+@asynccontextmanager
+async def get_session(uow: UnitOfWork | None = None):
+    """
+    Yield a session that commits on success and rolls back on error.
+    Inside a unit of work its shared session is yielded instead and committed by the unit of work.
+    """
+    if uow is not None:
+        yield uow.session
+        return
+
+    async with SessionLocal() as db:
+        try:
+            yield db
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            raise
+
+
+async def _get_user(
+    db: AsyncSession,
+    discord_id: int,
+    uow: UnitOfWork | None = None,
+) -> Optional[User]:
+    """Return the user row for discord_id within the given session."""
+    if uow is not None:
+        return await uow.get_user(discord_id)
+    result = await db.execute(select(User).filter_by(discord_id=discord_id))
+    return result.scalar_one_or_none()
+
+
+def _add_user(db: AsyncSession, user: User, uow: UnitOfWork | None = None) -> None:
+    """Add a new user to the session (and to the unit of work, if any)."""
+    if uow is not None:
+        uow.add_user(user)
+    else:
+        db.add(user)
+
+
+def _cache_user(user: User, uow: UnitOfWork | None = None) -> None:
+    """Publish a written row to the user cache; a unit of work does this on commit."""
+    if uow is None:
+        user_cache.put(user)
+
+
+async def get_or_create_user(discord_id: int) -> User:
     """Retrieve an existing user or create a new one by discord_id."""
-    with get_session() as db:
-        user = db.query(User).filter_by(discord_id=discord_id).first()
+    user = user_cache.get(discord_id)
+    if user is not None:
+        return user
+
+    async with get_session() as db:
+        user = await _get_user(db, discord_id)
         if user is None:
             user = User(discord_id=discord_id)
             db.add(user)
-            db.flush()
-        return user
+            await db.flush()
 
+    user_cache.put(user)
+    return user
 
-def get_or_create_user_from_member(member: Member) -> User:
+
+async def get_or_create_user_from_member(
+    member: Member,
+    uow: UnitOfWork | None = None,
+) -> User:
     """
     Ensure a Member has a user record and refresh username / display_name / is_admin.
     recruit_status is not touched so existing application progress is preserved.
+    Profile changes on existing rows are written behind by profile_refresher,
+    or applied to the unit of work's row when one is given.
     """
-    with get_session() as db:
-        user = db.query(User).filter_by(discord_id=member.id).first()
+    if uow is not None:
+        profile = profile_refresher.profile_of(member)
+        user = await uow.get_user(member.id)
         if user is None:
-            user = User(discord_id=member.id)
-            db.add(user)
-
-        user.username = member.name
-        user.display_name = member.display_name
-        user.is_admin = bool(member.guild_permissions.administrator)
-
-        db.flush()
+            user = User(discord_id=member.id, **profile)
+            uow.add_user(user)
+            await uow.session.flush()
+        else:
+            for key, value in profile.items():
+                if getattr(user, key) != value:
+                    setattr(user, key, value)
+            # The row now carries the current profile; queued values are older
+            profile_refresher.discard(user)
         return user
 
-
-def user_is_admin(member: Member) -> bool:
+    user = user_cache.get(member.id)
+    if user is None:
+        async with get_session() as db:
+            user = await _get_user(db, member.id)
+            if user is None:
+                user = User(discord_id=member.id, **profile_refresher.profile_of(member))
+                db.add(user)
+                await db.flush()
+        user_cache.put(user)
+
+    profile_refresher.queue(user, member)
+    return user
+
+
+async def bulk_sync_members(
+    members: Iterable[Member],
+    chunk_size: int = 500,
+    progress: Callable[[int, int], Awaitable[None]] | None = None,
+) -> dict:
+    """
+    Upsert username / display_name / is_admin for many members at once.
+    Rows are written in chunks with INSERT ... ON CONFLICT DO UPDATE, and only
+    rows whose profile actually differs are updated. progress(done, total) is
+    awaited after every chunk. Returns {"total", "changed", "elapsed"}, where
+    elapsed is the time spent in the database, not in progress callbacks.
+    """
+    elapsed = 0.0
+    rows = [
+        {"discord_id": m.id, **profile_refresher.profile_of(m)}
+        for m in members
+        if not m.bot
+    ]
+    total = len(rows)
+
+    if engine.dialect.name == "postgresql":
+        insert = pg_insert
+    else:
+        insert = sqlite_insert
+
+    changed = 0
+    for start in range(0, total, chunk_size):
+        chunk = rows[start:start + chunk_size]
+        stmt = insert(User).values(chunk)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[User.discord_id],
+            set_={
+                "username": stmt.excluded.username,
+                "display_name": stmt.excluded.display_name,
+                "is_admin": stmt.excluded.is_admin,
+            },
+            where=or_(
+                User.username.is_distinct_from(stmt.excluded.username),
+                User.display_name.is_distinct_from(stmt.excluded.display_name),
+                User.is_admin.is_distinct_from(stmt.excluded.is_admin),
+            ),
+        ).returning(User.discord_id)
+
+        started = time.perf_counter()
+        async with get_session() as db:
+            result = await db.execute(stmt)
+            touched = result.scalars().all()
+        elapsed += time.perf_counter() - started
+
+        for discord_id in touched:
+            user_cache.invalidate(discord_id)
+        changed += len(touched)
+
+        if progress is not None:
+            await progress(start + len(chunk), total)
+
+    return {
+        "total": total,
+        "changed": changed,
+        "elapsed": elapsed,
+    }
+
+
+async def user_is_admin(member: Member) -> bool:
     """Return whether the linked user is marked as admin."""
-    user = get_or_create_user_from_member(member)
+    user = await get_or_create_user_from_member(member)
     return bool(user.is_admin)
 
 
-def set_language(discord_id: int, lang: str) -> None:
-    with get_session() as db:
-        user = db.query(User).filter_by(discord_id=discord_id).first()
+async def set_language(discord_id: int, lang: str) -> None:
+    async with get_session() as db:
+        user = await _get_user(db, discord_id)
         if user is None:
             user = User(discord_id=discord_id, language=lang)
             db.add(user)
         else:
             user.language = lang
 
+    user_cache.put(user)
+    language_cache.set(discord_id, lang)
+
+
+async def get_user_language(discord_id: int) -> Optional[str]:
+    """
+    Return the stored language for discord_id without creating or updating the row.
+    Served from the memoized language map when possible.
+    """
+    known, lang = language_cache.lookup(discord_id)
+    if known:
+        return lang
+
+    user = user_cache.get(discord_id)
+    if user is not None:
+        language_cache.set(discord_id, user.language)
+        return user.language
+
+    async with SessionLocal() as session:
+        result = await session.execute(
+            select(User.language).filter(User.discord_id == discord_id)
+        )
+        lang = result.scalar_one_or_none()
+
+    language_cache.set(discord_id, lang)
+    return lang
+
+
+async def warm_language_cache() -> int:
+    """Load every stored language into the memoized map. Returns the number of rows read."""
+    async with SessionLocal() as session:
+        result = await session.execute(select(User.discord_id, User.language))
+        languages = {discord_id: lang for discord_id, lang in result.all()}
+
+    language_cache.warm(languages)
+    return len(languages)
+
+
+async def warm_user_caches(member_ids: set[int], batch_size: int = 1000) -> dict:
+    """
+    Stream the users table once: every row fills the language map, rows of
+    current guild members also go into the user cache. Returns row counts and
+    elapsed seconds.
+    """
+    started = time.perf_counter()
+    languages: dict[int, Optional[str]] = {}
+    cached = 0
+
+    async with SessionLocal() as session:
+        result = await session.stream_scalars(
+            select(User).execution_options(yield_per=batch_size)
+        )
+        async for user in result:
+            languages[user.discord_id] = user.language
+            if user.discord_id in member_ids and user_cache.put_if_missing(user):
+                cached += 1
+
+    language_cache.warm(languages)
+    return {
+        "rows": len(languages),
+        "cached": cached,
+        "members": len(member_ids),
+        "elapsed": time.perf_counter() - started,
+    }
+
 
 def build_steam_url(steam_id: str) -> str:
     return f"https://steamcommunity.com/profiles/{steam_id}"
 
 
-def link_steam(discord_id: int, steam_id: str) -> None:
-    with get_session() as db:
-        user = db.query(User).filter_by(discord_id=discord_id).first()
+async def link_steam(discord_id: int, steam_id: str) -> None:
+    async with get_session() as db:
+        user = await _get_user(db, discord_id)
         if user is None:
             user = User(discord_id=discord_id)
             db.add(user)
@@ -81,43 +275,49 @@ def link_steam(discord_id: int, steam_id: str) -> None:
         user.steam_id = steam_id
         user.steam_url = build_steam_url(steam_id)
 
+    user_cache.put(user)
 
 
-def update_discord_profile(member: Member) -> None:
+async def update_discord_profile(member: Member, uow: UnitOfWork | None = None) -> None:
     """Refresh username / display_name / is_admin from the member profile."""
-    with get_session() as db:
-        user = db.query(User).filter_by(discord_id=member.id).first()
-        if user is None:
-            user = User(discord_id=member.id)
-            db.add(user)
-
-        user.username = member.name
-        user.display_name = member.display_name
-        user.is_admin = bool(member.guild_permissions.administrator)
-        db.flush()
+    await get_or_create_user_from_member(member, uow=uow)
 
 
-def set_recruit_status(discord_id: int, status: str) -> None:
+async def set_recruit_status(
+    discord_id: int,
+    status: str,
+    uow: UnitOfWork | None = None,
+) -> None:
     """Set recruit status: pending / ready / done."""
-    with get_session() as db:
-        user = db.query(User).filter_by(discord_id=discord_id).first()
+    async with get_session(uow) as db:
+        user = await _get_user(db, discord_id, uow)
         if user is None:
             user = User(discord_id=discord_id, recruit_status=status)
-            db.add(user)
+            _add_user(db, user, uow)
         else:
             user.recruit_status = status
 
-def set_recruit_channels(discord_id: int, text_id: int | None, voice_id: int | None) -> None:
+    _cache_user(user, uow)
+
+
+async def set_recruit_channels(
+    discord_id: int,
+    text_id: int | None,
+    voice_id: int | None,
+    uow: UnitOfWork | None = None,
+) -> None:
     """Store text and voice channel IDs for the recruit interview channels."""
-    with get_session() as db:
-        user = db.query(User).filter_by(discord_id=discord_id).first()
+    async with get_session(uow) as db:
+        user = await _get_user(db, discord_id, uow)
         if user is None:
             user = User(discord_id=discord_id)
-            db.add(user)
+            _add_user(db, user, uow)
 
         user.recruit_text_channel_id = text_id
         user.recruit_voice_channel_id = voice_id
-        db.flush()
+        await db.flush()
+
+    _cache_user(user, uow)
 
 
 def get_recruit_code(user: User) -> str:
@@ -125,41 +325,83 @@ def get_recruit_code(user: User) -> str:
     return f"R-{user.id:04d}"
 
 
-def get_recruits_all() -> list[User]:
-    """Return all recruits where recruit_status is not NULL."""
-    with SessionLocal() as session:
-        return (
-            session.query(User)
-            .filter(User.recruit_status.isnot(None))
-            .order_by(User.id)
-            .all()
-        )
-
-def get_recruits_by_status(status: str) -> list[User]:
-    """Return recruits filtered by status: pending / ready / done / rejected."""
-    status = (status or "").lower()
-    with SessionLocal() as session:
-        return (
-            session.query(User)
-            .filter(User.recruit_status == status)
-            .order_by(User.id)
-            .all()
+async def get_recruits_page(
+    status: str | None = None,
+    after_id: int = 0,
+    limit: int = 20,
+) -> list[User]:
+    """
+    Return up to limit recruits ordered by users.id, starting after after_id (keyset pagination).
+    With a status, only recruits in that status are returned.
+    """
+    stmt = select(User).filter(User.id > after_id)
+    if status:
+        stmt = stmt.filter(User.recruit_status == status.lower())
+    else:
+        stmt = stmt.filter(User.recruit_status.isnot(None))
+
+    async with SessionLocal() as session:
+        result = await session.execute(stmt.order_by(User.id).limit(limit))
+        return list(result.scalars().all())
+
+async def get_recruit_overview(
+    statuses: Iterable[str],
+    ids_per_status: int = 40,
+) -> dict[str, dict]:
+    """
+    Return every status bucket from one grouped query:
+    {status: {"count": total rows, "discord_ids": first ids_per_status ids by user id}}.
+    """
+    statuses = [s.lower() for s in statuses]
+    ranked = (
+        select(
+            User.recruit_status,
+            User.discord_id,
+            func.count().over(partition_by=User.recruit_status).label("total"),
+            func.row_number()
+            .over(partition_by=User.recruit_status, order_by=User.id)
+            .label("position"),
         )
-
-def get_user_by_discord_id(discord_id: int) -> Optional[User]:
+        .filter(User.recruit_status.in_(statuses))
+        .subquery()
+    )
+    stmt = (
+        select(ranked.c.recruit_status, ranked.c.discord_id, ranked.c.total)
+        .filter(ranked.c.position <= ids_per_status)
+        .order_by(ranked.c.recruit_status, ranked.c.position)
+    )
+
+    overview = {status: {"count": 0, "discord_ids": []} for status in statuses}
+    async with SessionLocal() as session:
+        result = await session.execute(stmt)
+        for status, discord_id, total in result.all():
+            bucket = overview[status]
+            bucket["count"] = total
+            bucket["discord_ids"].append(discord_id)
+    return overview
+
+async def get_user_by_discord_id(discord_id: int) -> Optional[User]:
     """Return a user by discord_id if present."""
-    with SessionLocal() as session:
-        return (
-            session.query(User)
+    user = user_cache.get(discord_id)
+    if user is not None:
+        return user
+
+    async with SessionLocal() as session:
+        result = await session.execute(
+            select(User)
             .filter(User.discord_id == discord_id)
-            .one_or_none()
         )
+        user = result.scalar_one_or_none()
+
+    if user is not None:
+        user_cache.put(user)
+    return user
 
-def get_user_by_username(username: str) -> Optional[User]:
+async def get_user_by_username(username: str) -> Optional[User]:
     """Return a user by Discord username (e.g., sillygilly3544)."""
-    with SessionLocal() as session:
-        return (
-            session.query(User)
+    async with SessionLocal() as session:
+        result = await session.execute(
+            select(User)
             .filter(User.username == username)
-            .one_or_none()
         )
+        return result.scalar_one_or_none()
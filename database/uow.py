@@ -0,0 +1,133 @@
+# database/uow.py
+import sys
+import time
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Optional
+
+from sqlalchemy import event, select
+
+from .cache import user_cache
+from .db import SessionLocal, engine
+from .models import User
+
+
+class InteractionTrace:
+    """Query / commit counters of one interaction, shared by all of its units of work."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.queries = 0
+        self.commits = 0
+        self.units = 0
+        self._started = time.perf_counter()
+
+    def log(self) -> None:
+        elapsed_ms = (time.perf_counter() - self._started) * 1000
+        print(
+            f"[uow] {self.name}: {self.queries} queries, {self.commits} commit(s) "
+            f"in {self.units} unit(s) of work, {elapsed_ms:.0f} ms",
+            file=sys.stderr,
+        )
+
+
+_current_trace: ContextVar[Optional[InteractionTrace]] = ContextVar("current_trace", default=None)
+
+
+@event.listens_for(engine.sync_engine, "before_cursor_execute")
+def _count_query(conn, cursor, statement, parameters, context, executemany):
+    trace = _current_trace.get()
+    if trace is not None:
+        trace.queries += 1
+
+
+@asynccontextmanager
+async def interaction_scope(name: str):
+    """
+    Count every query and commit made while handling one interaction, across
+    its units of work, and log the totals once at the end.
+    """
+    trace = InteractionTrace(name)
+    token = _current_trace.set(trace)
+    try:
+        yield trace
+    finally:
+        _current_trace.reset(token)
+        trace.log()
+
+
+class UnitOfWork:
+    """
+    One session and one set of loaded User rows shared by the service calls of
+    one step, committed once at exit.
+
+    The session holds a pooled connection inside an open transaction, so keep
+    Discord REST calls out of the block. Interaction handlers use one unit of
+    work to read before their REST calls and one to write after them, inside
+    an interaction_scope:
+
+        async with interaction_scope("recruit_approve"):
+            async with UnitOfWork("read") as uow:
+                user = await get_or_create_user_from_member(member, uow=uow)
+            ...  # Discord calls
+            async with UnitOfWork("write") as uow:
+                await set_recruit_status(member.id, "done", uow=uow)
+
+    Outside an interaction_scope the unit of work logs its own totals.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.session = None
+        self.users: dict[int, User] = {}
+        self.commits = 0
+        self.trace: Optional[InteractionTrace] = None
+        self._token = None
+
+    async def __aenter__(self) -> "UnitOfWork":
+        self.trace = _current_trace.get()
+        if self.trace is None:
+            self.trace = InteractionTrace(self.name)
+            self._token = _current_trace.set(self.trace)
+        self.trace.units += 1
+        self.session = SessionLocal()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        try:
+            if exc_type is None:
+                await self.commit()
+            else:
+                await self.session.rollback()
+        finally:
+            await self.session.close()
+            if self._token is not None:
+                _current_trace.reset(self._token)
+                self._token = None
+                self.trace.log()
+
+    async def commit(self) -> None:
+        """
+        Commit pending changes and publish loaded users to the user cache.
+        Normally called once on exit.
+        """
+        await self.session.commit()
+        self.commits += 1
+        self.trace.commits += 1
+        for user in self.users.values():
+            user_cache.put(user)
+
+    async def get_user(self, discord_id: int) -> Optional[User]:
+        """Return the user for discord_id, loading it into the session only once."""
+        user = self.users.get(discord_id)
+        if user is None:
+            result = await self.session.execute(select(User).filter_by(discord_id=discord_id))
+            user = result.scalar_one_or_none()
+            if user is not None:
+                self.users[discord_id] = user
+        return user
+
+    def add_user(self, user: User) -> None:
+        """Add a new user to the session and remember it for later lookups."""
+        self.session.add(user)
+        self.users[user.discord_id] = user
@@ -0,0 +1,198 @@
+# dms/dm_dispatch.py
+import asyncio
+import random
+import sys
+import time
+
+import discord
+from discord.ext import commands
+
+from config import Config
+from dms.onboarding_flow import deliver_onboarding_dm, notify_dm_disabled
+
+
+class TokenBucket:
+    """Async token bucket: rate tokens per second, up to capacity tokens banked."""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class _DmJob:
+    __slots__ = ("guild_id", "member_id", "enqueued_at", "attempts")
+
+    def __init__(self, guild_id: int, member_id: int):
+        self.guild_id = guild_id
+        self.member_id = member_id
+        self.enqueued_at = time.monotonic()
+        self.attempts = 0
+
+    @property
+    def key(self) -> tuple[int, int]:
+        return self.guild_id, self.member_id
+
+
+class OnboardingDmDispatcher:
+    """
+    Long-lived queue for onboarding DMs served by a fixed pool of workers.
+    Sends are paced by a token bucket, transient failures (429 / 5xx) are retried
+    with exponential backoff, and members whose DMs cannot be delivered are
+    announced in the fallback channel via notify_dm_disabled.
+    """
+
+    def __init__(
+        self,
+        bot: commands.Bot,
+        workers: int,
+        rate: float,
+        burst: int,
+        max_attempts: int,
+    ):
+        self.bot = bot
+        self.worker_count = max(workers, 1)
+        self.max_attempts = max(max_attempts, 1)
+        self._bucket = TokenBucket(rate=rate, capacity=burst)
+        self._queue: asyncio.Queue[_DmJob] = asyncio.Queue()
+        self._workers: list[asyncio.Task] = []
+
+        # Jobs queued or waiting for a retry, keyed by (guild_id, member_id) -> enqueued_at
+        self._waiting: dict[tuple[int, int], float] = {}
+        # Scheduled requeues of failed jobs, cancelled on stop()
+        self._retries: set[asyncio.TimerHandle] = set()
+
+        self.sent = 0
+        self.retried = 0
+        self.fallbacks = 0
+        self.failed = 0
+
+    def submit(self, member: discord.Member) -> bool:
+        """Queue an onboarding DM for member. Returns False if one is already queued."""
+        job = _DmJob(member.guild.id, member.id)
+        if job.key in self._waiting:
+            return False
+        self._waiting[job.key] = job.enqueued_at
+        self._queue.put_nowait(job)
+        return True
+
+    def start(self) -> None:
+        if self._workers:
+            return
+        self._workers = [
+            asyncio.create_task(self._worker(), name=f"onboarding-dm-{i}")
+            for i in range(self.worker_count)
+        ]
+
+    async def stop(self) -> None:
+        """Stop the workers and pending retries. Jobs still queued are dropped and logged."""
+        for handle in self._retries:
+            handle.cancel()
+        self._retries.clear()
+        for task in self._workers:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        if self._waiting:
+            print(
+                f"[OnboardingDmDispatcher] Dropping {len(self._waiting)} queued onboarding DM(s) on shutdown",
+                file=sys.stderr,
+            )
+
+    async def _worker(self) -> None:
+        while True:
+            job = await self._queue.get()
+            try:
+                await self._bucket.acquire()
+                await self._process(job)
+            except Exception as e:
+                self.failed += 1
+                self._waiting.pop(job.key, None)
+                print(f"[OnboardingDmDispatcher ERROR] {type(e).__name__}: {e}", file=sys.stderr)
+            finally:
+                self._queue.task_done()
+
+    async def _process(self, job: _DmJob) -> None:
+        guild = self.bot.get_guild(job.guild_id)
+        member = guild.get_member(job.member_id) if guild else None
+        if member is None:
+            # Left the guild before we got to them
+            self._waiting.pop(job.key, None)
+            return
+
+        job.attempts += 1
+        try:
+            await deliver_onboarding_dm(self.bot, member)
+        except discord.Forbidden:
+            await self._fallback(job, member)
+            return
+        except discord.HTTPException as e:
+            transient = e.status == 429 or e.status >= 500
+            if transient and job.attempts < self.max_attempts:
+                self._retry_later(job)
+                return
+            print(f"Failed to send DM: {e}", file=sys.stderr)
+            await self._fallback(job, member)
+            return
+
+        self.sent += 1
+        self._waiting.pop(job.key, None)
+
+    def _retry_later(self, job: _DmJob) -> None:
+        delay = min(2 ** job.attempts, 60) + random.uniform(0, 1)
+        self.retried += 1
+
+        def requeue():
+            self._retries.discard(handle)
+            self._queue.put_nowait(job)
+
+        handle = asyncio.get_running_loop().call_later(delay, requeue)
+        self._retries.add(handle)
+
+    async def _fallback(self, job: _DmJob, member: discord.Member) -> None:
+        self._waiting.pop(job.key, None)
+        self.fallbacks += 1
+        try:
+            await notify_dm_disabled(self.bot, member)
+        except Exception as e:
+            print(f"[notify_dm_disabled ERROR] {type(e).__name__}: {e}", file=sys.stderr)
+
+    def stats(self) -> dict:
+        """Return queue depth / age gauges and delivery counters."""
+        now = time.monotonic()
+        oldest = min(self._waiting.values(), default=None)
+        return {
+            "depth": self._queue.qsize(),
+            "retrying": len(self._retries),
+            "oldest_age": (now - oldest) if oldest is not None else 0.0,
+            "workers": len(self._workers),
+            "sent": self.sent,
+            "retried": self.retried,
+            "fallbacks": self.fallbacks,
+            "failed": self.failed,
+        }
+
+
+def create_dispatcher(bot: commands.Bot) -> OnboardingDmDispatcher:
+    """Build a dispatcher using the ONBOARDING_DM_* settings from Config."""
+    return OnboardingDmDispatcher(
+        bot,
+        workers=Config.ONBOARDING_DM_WORKERS,
+        rate=Config.ONBOARDING_DM_RATE,
+        burst=Config.ONBOARDING_DM_BURST,
+        max_attempts=Config.ONBOARDING_DM_MAX_ATTEMPTS,
+    )
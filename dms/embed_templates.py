@@ -0,0 +1,77 @@
+# dms/embed_templates.py
+
+"""
+Per-language embed templates. The static, localized parts of an embed are built
+once per language and copied on each use; callers only fill in per-member values.
+The cache is cleared whenever the locale files are reloaded.
+"""
+
+import copy
+from typing import Callable
+
+import discord
+
+from dms.localization import on_locales_reload
+
+
+class EmbedTemplateCache:
+    def __init__(self):
+        self._builders: dict[str, Callable[[str], discord.Embed]] = {}
+        # (name, lang) -> embed produced by the builder, never handed out itself
+        self._templates: dict[tuple[str, str], discord.Embed] = {}
+        self.hits = 0
+        self.builds = 0
+
+    def template(self, name: str):
+        """Register the decorated function (lang -> Embed) as the builder for name."""
+        def decorator(builder: Callable[[str], discord.Embed]):
+            self._builders[name] = builder
+            return builder
+        return decorator
+
+    def get(self, name: str, lang: str) -> discord.Embed:
+        """Return a fresh copy of the template for name in lang."""
+        key = (name, lang)
+        embed = self._templates.get(key)
+        if embed is None:
+            embed = self._templates[key] = self._builders[name](lang)
+            self.builds += 1
+        else:
+            self.hits += 1
+        # Shallow copy; only the field dicts are edited in place (set_field_at),
+        # the setters for footer, author and images replace their dicts
+        clone = copy.copy(embed)
+        if hasattr(embed, "_fields"):
+            clone._fields = [dict(field) for field in embed._fields]
+        return clone
+
+    def clear(self) -> None:
+        self._templates.clear()
+
+
+embed_templates = EmbedTemplateCache()
+on_locales_reload(embed_templates.clear)
+
+
+def fill_field(embed: discord.Embed, index: int, value: str) -> None:
+    """Replace the value of a template field, keeping its name and layout."""
+    field = embed.fields[index]
+    embed.set_field_at(index, name=field.name, value=value, inline=field.inline)
+
+
+def member_profile_value(member: discord.Member) -> str:
+    """Discord identity block shown on recruit embeds."""
+    return (
+        f"{member.mention}\n"
+        f"Display name: **{member.display_name}**\n"
+        f"Username: `{member.name}`\n"
+        f"ID: `{member.id}`"
+    )
+
+
+def steam_profile_url(user) -> str | None:
+    if getattr(user, "steam_url", None):
+        return user.steam_url
+    if user.steam_id:
+        return f"https://steamcommunity.com/profiles/{user.steam_id}"
+    return None
@@ -5,18 +5,22 @@ import discord
 from discord.ext import commands
 
 from config import Config
-from dms.localization import t
+from dms.embed_templates import embed_templates
+from dms.localization import on_locales_reload, t
 from dms.steam_link import LinkSteamButton, SteamLinkView
 from dms.recruit_channels import ensure_recruit_channels
-from dms.recruit_moderation import RecruitModerationView
+from dms.recruit_moderation import RecruitModerationView, build_recruit_card
 from database.service import (
     get_or_create_user,
     get_or_create_user_from_member,
     set_language,
     update_discord_profile,
-    set_recruit_status,
-    get_recruit_code,
 )
+from database.uow import UnitOfWork, interaction_scope
+from utils.lang import get_lang_for_user
+from utils.channels import channel_index
+from utils.members import resolve_member
+from utils.single_flight import single_flight
 
 RECRUIT_ROLE_ID = Config.RECRUIT_ROLE_ID
 
@@ -34,7 +38,8 @@ def _get_arma_role_definitions():
     return getattr(Config, "ARMA_ROLE_DEFINITIONS", []) or []
 
 
-def _build_arma_roles_embed(lang: str) -> discord.Embed:
+@embed_templates.template("arma_roles")
+def _arma_roles_template(lang: str) -> discord.Embed:
     return discord.Embed(
         title=t(lang, "arma_roles_title"),
         description=t(lang, "arma_roles_body"),
@@ -42,24 +47,32 @@ def _build_arma_roles_embed(lang: str) -> discord.Embed:
     )
 
 
+def _build_arma_roles_embed(lang: str) -> discord.Embed:
+    return embed_templates.get("arma_roles", lang)
 
-def _build_onboarding_embed(member: discord.Member, lang: str) -> discord.Embed:
-    """Build the onboarding embed that greets a user and links to setup actions."""
-    greeting = t(lang, "greeting").format(name=member.display_name)
-    body = t(lang, "onboarding_body")
-    intro = t(lang, "welcome_message_default")
-
-    desc = f"{greeting}\n\n{intro}\n\n{body}"
 
-    embed = discord.Embed(
+@embed_templates.template("onboarding")
+def _onboarding_template(lang: str) -> discord.Embed:
+    # The per-member greeting is prepended in _build_onboarding_embed
+    intro = t(lang, "welcome_message_default")
+    body = t(lang, "onboarding_body")
+    return discord.Embed(
         title=t(lang, "onboarding_title"),
-        description=desc,
+        description=f"{intro}\n\n{body}",
         color=discord.Color.gold(),
     )
+
+
+def _build_onboarding_embed(member: discord.Member, lang: str) -> discord.Embed:
+    """Build the onboarding embed that greets a user and links to setup actions."""
+    embed = embed_templates.get("onboarding", lang)
+    greeting = t(lang, "greeting").format(name=member.display_name)
+    embed.description = f"{greeting}\n\n{embed.description}"
     return embed
 
 
-def _build_game_roles_embed(lang: str) -> discord.Embed:
+@embed_templates.template("game_roles")
+def _game_roles_template(lang: str) -> discord.Embed:
     return discord.Embed(
         title=t(lang, "game_roles_title"),
         description=t(lang, "game_roles_body"),
@@ -67,6 +80,10 @@ def _build_game_roles_embed(lang: str) -> discord.Embed:
     )
 
 
+def _build_game_roles_embed(lang: str) -> discord.Embed:
+    return embed_templates.get("game_roles", lang)
+
+
 # --------- Views for interactive onboarding in DMs ---------
 
 
@@ -79,30 +96,51 @@ class OnboardingMainView(discord.ui.View):
     """
 
     def __init__(self, bot: commands.Bot, guild_id: int, lang: str):
-        # Persistent during bot uptime; safe because this view holds only simple state.
+        # Every button is a dynamic item carrying the guild id in its custom_id,
+        # so the view is not kept in memory and survives restarts.
         super().__init__(timeout=None)
         self.bot = bot
         self.guild_id = guild_id
         self.lang = lang
 
-        self.add_item(ChooseGamesButton(lang))
-        self.add_item(RegisterRecruitButton(lang))
+        self.add_item(ChooseGamesButton(lang, guild_id))
+        self.add_item(RegisterRecruitButton(lang, guild_id))
         self.add_item(LinkSteamButton(lang))
 
 
-class ChooseGamesButton(discord.ui.Button):
-    def __init__(self, lang: str):
+def _guild_custom_id(prefix: str, guild_id: int | None) -> str:
+    """Build a custom_id, appending the guild id when known."""
+    return f"{prefix}:{guild_id}" if guild_id else prefix
+
+
+def _match_guild_id(match) -> int | None:
+    guild = match["guild"]
+    return int(guild) if guild else None
+
+
+class ChooseGamesButton(
+    discord.ui.DynamicItem[discord.ui.Button],
+    template=r"choose_games(?::(?P<guild>[0-9]+))?",
+):
+    def __init__(self, lang: str = "en", guild_id: int | None = None):
         super().__init__(
-            label=t(lang, "btn_games"),
-            style=discord.ButtonStyle.secondary,
-            custom_id="choose_games",
+            discord.ui.Button(
+                label=t(lang, "btn_games"),
+                style=discord.ButtonStyle.secondary,
+                custom_id=_guild_custom_id("choose_games", guild_id),
+            )
         )
+        self.guild_id = guild_id
+
+    @classmethod
+    async def from_custom_id(cls, interaction: discord.Interaction, item: discord.ui.Button, match):
+        return cls(guild_id=_match_guild_id(match))
 
     async def callback(self, interaction: discord.Interaction):
-        view: OnboardingMainView = self.view  # type: ignore
-        lang = view.lang
+        lang = await get_lang_for_user(interaction.user)
 
-        guild = interaction.client.get_guild(view.guild_id)
+        guild_id = self.guild_id or getattr(interaction.guild, "id", None)
+        guild = interaction.client.get_guild(guild_id) if guild_id else None
         if guild is None:
             await interaction.response.send_message(
                 t(lang, "guild_not_found"),
@@ -111,18 +149,15 @@ class ChooseGamesButton(discord.ui.Button):
             return
 
         # Make sure the member exists and can be fetched
-        member = guild.get_member(interaction.user.id)
+        member = await resolve_member(guild, interaction.user.id)
         if member is None:
-            try:
-                member = await guild.fetch_member(interaction.user.id)
-            except discord.DiscordException:
-                await interaction.response.send_message(
-                    t(lang, "not_in_guild"),
-                    ephemeral=True,
-                )
-                return
+            await interaction.response.send_message(
+                t(lang, "not_in_guild"),
+                ephemeral=True,
+            )
+            return
 
-        if not _get_game_role_definitions():
+        if not has_role_options("game", lang):
             await interaction.response.send_message(
                 t(lang, "no_game_roles"),
                 ephemeral=True,
@@ -130,7 +165,7 @@ class ChooseGamesButton(discord.ui.Button):
             return
 
         embed = _build_game_roles_embed(lang)
-        roles_view = GameRolesView(bot=view.bot, guild_id=view.guild_id, lang=lang)
+        roles_view = GameRolesView(bot=interaction.client, guild_id=guild.id, lang=lang, member=member)
 
         await interaction.response.send_message(
             embed=embed,
@@ -139,124 +174,107 @@ class ChooseGamesButton(discord.ui.Button):
         )
 
 
-class GameRolesView(discord.ui.View):
-    """View that lists configured game roles and lets the user toggle them."""
-
-    def __init__(self, bot: commands.Bot, guild_id: int, lang: str):
-        super().__init__(timeout=300)
-        self.bot = bot
-        self.guild_id = guild_id
-        self.lang = lang
-
-        for role_cfg in _get_game_role_definitions():
-            self.add_item(GameRoleToggleButton(role_cfg, lang))
-
+def _role_label(role_cfg: dict, lang: str) -> str:
+    return (
+        role_cfg.get("label_ru")
+        if lang == "ru"
+        else role_cfg.get("label_en")
+    ) or role_cfg.get("label") or t(lang, "role_default_label")
 
-class GameRoleToggleButton(discord.ui.Button):
-    def __init__(self, role_cfg: dict, lang: str):
-        self.role_id: int = int(role_cfg.get("id", 0))
 
-        label = (
-            role_cfg.get("label_ru")
-            if lang == "ru"
-            else role_cfg.get("label_en")
-        ) or role_cfg.get("label") or t(lang, "role_default_label")
-
-        emoji = role_cfg.get("emoji")
+class RoleMenuLayout:
+    """
+    Select options for one role kind in one language, computed once from the
+    role definitions (labels, descriptions, parsed emojis) and shared by every
+    picker; only the pre-selected defaults differ per member.
+    """
 
-        super().__init__(
-            label=label,
-            emoji=emoji,
-            style=discord.ButtonStyle.primary,
-            custom_id=f"game_role_{self.role_id}",
+    __slots__ = ("placeholder", "entries", "role_ids")
+
+    def __init__(self, kind: str, role_defs: list[dict], lang: str):
+        self.placeholder = t(lang, f"role_picker_placeholder_{kind}")
+        desc_key = "description_ru" if lang == "ru" else "description_en"
+        # Select menus hold at most 25 options
+        defs = [cfg for cfg in role_defs if int(cfg.get("id", 0))][:25]
+        self.entries = tuple(
+            (
+                int(cfg["id"]),
+                _role_label(cfg, lang)[:100],
+                (cfg.get(desc_key) or "")[:100] or None,
+                discord.PartialEmoji.from_str(cfg["emoji"]) if cfg.get("emoji") else None,
+            )
+            for cfg in defs
         )
-
-    async def callback(self, interaction: discord.Interaction):
-        view: GameRolesView = self.view  # type: ignore
-        lang = view.lang
-
-        guild = interaction.client.get_guild(view.guild_id)
-        if guild is None:
-            await interaction.response.send_message(
-                t(lang, "guild_not_found"),
-                ephemeral=True,
+        self.role_ids = frozenset(entry[0] for entry in self.entries)
+
+    def build_options(self, current_role_ids: set[int]) -> list[discord.SelectOption]:
+        return [
+            discord.SelectOption(
+                label=label,
+                value=str(role_id),
+                description=description,
+                emoji=emoji,
+                default=role_id in current_role_ids,
             )
-            return
+            for role_id, label, description, emoji in self.entries
+        ]
 
-        member = guild.get_member(interaction.user.id)
-        if member is None:
-            try:
-                member = await guild.fetch_member(interaction.user.id)
-            except discord.DiscordException:
-                await interaction.response.send_message(
-                    t(lang, "not_in_guild"),
-                    ephemeral=True,
-                )
-                return
-
-        role = guild.get_role(self.role_id)
-        if role is None:
-            await interaction.response.send_message(
-                t(lang, "game_role_not_found"),
-                ephemeral=True,
-            )
-            return
 
-        try:
-            if role in member.roles:
-                await member.remove_roles(
-                    role, reason="Game role toggle via onboarding DM"
-                )
-                text = t(lang, "game_role_removed").format(role=role.name)
-            else:
-                await member.add_roles(
-                    role, reason="Game role toggle via onboarding DM"
-                )
-                text = t(lang, "game_role_added").format(role=role.name)
+_ROLE_DEFINITIONS = {
+    "game": _get_game_role_definitions,
+    "arma": _get_arma_role_definitions,
+}
 
-            await interaction.response.send_message(text, ephemeral=True)
-        except discord.Forbidden:
-            await interaction.response.send_message(
-                t(lang, "no_permission_manage_roles"),
-                ephemeral=True,
-            )
+# (kind, lang) -> layout; role definitions are fixed at startup, labels follow locale reloads
+_role_layouts: dict[tuple[str, str], RoleMenuLayout] = {}
+on_locales_reload(_role_layouts.clear)
 
 
-class ArmaRolesView(discord.ui.View):
-    """View for ARMA operation roles available only to recruits with status 'done'."""
+def _role_layout(kind: str, lang: str) -> RoleMenuLayout:
+    layout = _role_layouts.get((kind, lang))
+    if layout is None:
+        layout = _role_layouts[(kind, lang)] = RoleMenuLayout(kind, _ROLE_DEFINITIONS[kind](), lang)
+    return layout
 
-    def __init__(self, bot: commands.Bot, guild_id: int, lang: str):
-        super().__init__(timeout=300)
-        self.bot = bot
-        self.guild_id = guild_id
-        self.lang = lang
 
-        for role_cfg in _get_arma_role_definitions():
-            self.add_item(ArmaRoleToggleButton(role_cfg, lang))
+def has_role_options(kind: str, lang: str) -> bool:
+    """
+    Whether the role picker of kind has anything to offer. Definitions without
+    a role id are left out of the menu, and Discord rejects a select with no
+    options.
+    """
+    return bool(_role_layout(kind, lang).entries)
 
 
-class ArmaRoleToggleButton(discord.ui.Button):
-    def __init__(self, role_cfg: dict, lang: str):
-        self.role_id: int = int(role_cfg.get("id", 0))
+class RolePickerSelect(discord.ui.Select):
+    """
+    Multi-select over the configured roles of one kind ("game" or "arma").
+    Submitting applies the whole selection as one member.edit(roles=...) call,
+    computed from a freshly resolved member so no other role is dropped (a
+    member missing from the gateway cache costs one extra fetch first).
+    """
 
-        label = (
-            role_cfg.get("label_ru")
-            if lang == "ru"
-            else role_cfg.get("label_en")
-        ) or role_cfg.get("label") or t(lang, "role_default_label")
+    def __init__(self, kind: str, lang: str, member: discord.Member | None):
+        self.kind = kind
+        self.lang = lang
+        layout = _role_layout(kind, lang)
+        self.managed_ids = layout.role_ids
 
-        emoji = role_cfg.get("emoji")
+        current = {r.id for r in member.roles} if member is not None else set()
+        options = layout.build_options(current)
 
         super().__init__(
-            label=label,
-            emoji=emoji,
-            style=discord.ButtonStyle.primary,
-            custom_id=f"arma_role_{self.role_id}",
+            placeholder=layout.placeholder,
+            min_values=0,
+            max_values=max(len(options), 1),
+            options=options,
+            custom_id=f"{kind}_role_picker",
         )
 
+    @single_flight(lambda item: f"role_picker:{item.kind}")
     async def callback(self, interaction: discord.Interaction):
-        view: ArmaRolesView = self.view  # type: ignore
-        lang = view.lang
+        view = self.view
+        lang = self.lang
 
         guild = interaction.client.get_guild(view.guild_id)
         if guild is None:
@@ -266,74 +284,127 @@ class ArmaRoleToggleButton(discord.ui.Button):
             )
             return
 
-        member = guild.get_member(interaction.user.id)
+        # The edit replaces the whole role list, so it must start from current roles
+        member = await resolve_member(guild, interaction.user.id, fresh=True)
         if member is None:
-            try:
-                member = await guild.fetch_member(interaction.user.id)
-            except discord.DiscordException:
+            await interaction.response.send_message(
+                t(lang, "not_in_guild"),
+                ephemeral=True,
+            )
+            return
+
+        if self.kind == "arma":
+            # One status check per submission instead of one per toggled role
+            user = await get_or_create_user_from_member(member)
+            if (user.recruit_status or "pending").lower() != "done":
                 await interaction.response.send_message(
-                    t(lang, "not_in_guild"),
+                    t(lang, "arma_roles_not_done"),
                     ephemeral=True,
                 )
                 return
 
-        from database.service import get_or_create_user_from_member  # Local import to keep context fresh
-        user = get_or_create_user_from_member(member)
-        status = (user.recruit_status or "pending").lower()
+        selected = {
+            role
+            for role in (guild.get_role(int(value)) for value in self.values)
+            if role is not None
+        }
+        kept = [r for r in member.roles if not r.is_default() and r.id not in self.managed_ids]
+        added = sorted(selected - set(member.roles), key=lambda r: r.position, reverse=True)
+        removed = [r for r in member.roles if r.id in self.managed_ids and r not in selected]
 
-        if status != "done":
+        if not added and not removed:
             await interaction.response.send_message(
-                t(lang, "arma_roles_not_done"),
+                t(lang, "role_picker_no_changes"),
                 ephemeral=True,
             )
             return
 
-        role = guild.get_role(self.role_id)
-        if role is None:
+        try:
+            await member.edit(
+                roles=kept + list(selected),
+                reason=f"{self.kind} role picker",
+            )
+        except discord.Forbidden:
             await interaction.response.send_message(
-                t(lang, "arma_role_not_found"),
+                t(lang, "no_permission_manage_roles"),
                 ephemeral=True,
             )
             return
-
-        try:
-            if role in member.roles:
-                await member.remove_roles(
-                    role,
-                    reason="ARMA role toggle via roles panel",
-                )
-                text = t(lang, "arma_role_removed").format(role=role.name)
-            else:
-                await member.add_roles(
-                    role,
-                    reason="ARMA role toggle via roles panel",
-                )
-                text = t(lang, "arma_role_added").format(role=role.name)
-
-            await interaction.response.send_message(text, ephemeral=True)
-        except discord.Forbidden:
+        except discord.HTTPException as e:
+            print(f"[role picker ERROR] {type(e).__name__}: {e}", file=sys.stderr)
             await interaction.response.send_message(
-                t(lang, "no_permission_manage_roles"),
+                t(lang, "role_picker_error"),
                 ephemeral=True,
             )
+            return
+
+        none = t(lang, "role_picker_none")
+        await interaction.response.send_message(
+            t(lang, "role_picker_updated").format(
+                added=", ".join(f"**{r.name}**" for r in added) or none,
+                removed=", ".join(f"**{r.name}**" for r in removed) or none,
+            ),
+            ephemeral=True,
+        )
+
+
+class GameRolesView(discord.ui.View):
+    """View with a multi-select of the configured game roles."""
+
+    def __init__(self, bot: commands.Bot, guild_id: int, lang: str, member: discord.Member | None = None):
+        super().__init__(timeout=300)
+        self.bot = bot
+        self.guild_id = guild_id
+        self.lang = lang
+
+        self.add_item(RolePickerSelect("game", lang, member))
+
+
+class ArmaRolesView(discord.ui.View):
+    """View with a multi-select of ARMA operation roles, available only to recruits with status 'done'."""
+
+    def __init__(self, bot: commands.Bot, guild_id: int, lang: str, member: discord.Member | None = None):
+        super().__init__(timeout=300)
+        self.bot = bot
+        self.guild_id = guild_id
+        self.lang = lang
+
+        self.add_item(RolePickerSelect("arma", lang, member))
 
 
 # ------------ REGISTER RECRUIT BUTTON (DM) ------------
 
 
-class RegisterRecruitButton(discord.ui.Button):
-    def __init__(self, lang: str | None = None):
+class RegisterRecruitButton(
+    discord.ui.DynamicItem[discord.ui.Button],
+    template=r"register_recruit(?::(?P<guild>[0-9]+))?",
+):
+    """
+    Recruit registration button used in onboarding DMs (guild id in custom_id)
+    and in the server roles panel (plain "register_recruit", guild taken from
+    the interaction).
+    """
+
+    def __init__(self, lang: str | None = None, guild_id: int | None = None):
         super().__init__(
-            label=t(lang or "en", "btn_recruit"),
-            style=discord.ButtonStyle.success,
-            custom_id="register_recruit",
+            discord.ui.Button(
+                label=t(lang or "en", "btn_recruit"),
+                style=discord.ButtonStyle.success,
+                custom_id=_guild_custom_id("register_recruit", guild_id),
+            )
         )
         self.lang = lang or "en"
+        self.guild_id = guild_id
+
+    @classmethod
+    async def from_custom_id(cls, interaction: discord.Interaction, item: discord.ui.Button, match):
+        return cls(guild_id=_match_guild_id(match))
 
+    @single_flight("register_recruit")
     async def callback(self, interaction: discord.Interaction):
-        view: OnboardingMainView = self.view  # type: ignore
+        view_lang = await get_lang_for_user(interaction.user)
 
-        guild_id = getattr(view, "guild_id", None) or getattr(interaction.guild, "id", None)
+        guild_id = self.guild_id or getattr(interaction.guild, "id", None)
         guild = None
         if guild_id:
             guild = interaction.client.get_guild(guild_id) or (
@@ -347,22 +418,33 @@ class RegisterRecruitButton(discord.ui.Button):
 
         if guild is None:
             await interaction.response.send_message(
-                t(view.lang, "guild_not_found"),
+                t(view_lang, "guild_not_found"),
                 ephemeral=True,
             )
             return
 
-        member = guild.get_member(interaction.user.id)
+        member = await resolve_member(guild, interaction.user.id)
         if member is None:
             await interaction.response.send_message(
-                t(view.lang, "not_in_guild"),
+                t(view_lang, "not_in_guild"),
                 ephemeral=True,
             )
             return
 
-        # Refresh user data to get language preference
-        user = get_or_create_user_from_member(member)
-        lang = user.language or view.lang or self.lang
+        async with interaction_scope("register_recruit"):
+            await self._register(interaction, guild, member, view_lang)
+
+    async def _register(
+        self,
+        interaction: discord.Interaction,
+        guild: discord.Guild,
+        member: discord.Member,
+        view_lang: str,
+    ) -> None:
+        """Read the recruit row, grant the role, then store status and channels in one write."""
+        async with UnitOfWork("register_recruit_read") as uow:
+            user = await get_or_create_user_from_member(member, uow=uow)
+        lang = user.language or view_lang
 
         # Prevent duplicate applications when status already set
         status = (user.recruit_status or "pending").lower()
@@ -423,12 +505,12 @@ class RegisterRecruitButton(discord.ui.Button):
             )
             return
 
-        # Mark recruit as ready
-        set_recruit_status(member.id, "ready")
-
-        # Ensure recruit channels exist
+        # Mark recruit as ready together with the channel ids; the status is
+        # stored even when channel creation fails, so it matches the granted role
         try:
-            text_ch, voice_ch, is_new = await ensure_recruit_channels(guild, member)
+            text_ch, voice_ch, is_new = await ensure_recruit_channels(
+                guild, member, status="ready"
+            )
         except Exception as e:
             print(f"[recruit channels ERROR] {type(e).__name__}: {e}", file=sys.stderr)
             await interaction.response.send_message(
@@ -448,73 +530,7 @@ class RegisterRecruitButton(discord.ui.Button):
             )
             return
 
-        # Reload user to ensure fresh language preference
-        user = get_or_create_user_from_member(member)
-        lang = user.language or lang
-
-        # Build Steam URL if available
-        if getattr(user, "steam_url", None):
-            steam_url = user.steam_url
-        elif user.steam_id:
-            steam_url = f"https://steamcommunity.com/profiles/{user.steam_id}"
-        else:
-            steam_url = None
-
-        recruit_code = get_recruit_code(user)
-
-        embed = discord.Embed(
-            title=t(lang, "recruit_embed_title").format(name=member.display_name),
-            color=discord.Color.gold(),
-        )
-
-        embed.add_field(
-            name=t(lang, "recruit_embed_field_code"),
-            value=recruit_code,
-            inline=False,
-        )
-
-        embed.add_field(
-            name=t(lang, "recruit_embed_field_discord"),
-            value=(
-                f"{member.mention}\n"
-                f"Display name: **{member.display_name}**\n"
-                f"Username: `{member.name}`\n"
-                f"ID: `{member.id}`"
-            ),
-            inline=False,
-        )
-
-        if steam_url:
-            embed.add_field(
-                name=t(lang, "recruit_embed_field_steam"),
-                value=f"ID: `{user.steam_id}`\n[Open profile]({steam_url})",
-                inline=False,
-            )
-        else:
-            embed.add_field(
-                name=t(lang, "recruit_embed_field_steam"),
-                value=t(lang, "recruit_embed_steam_not_linked"),
-                inline=False,
-            )
-
-        lang_name = {
-            "ru": t(lang, "language_name_ru"),
-            "en": t(lang, "language_name_en"),
-        }.get(user.language, t(lang, "language_name_en"))
-
-        embed.add_field(
-            name=t(lang, "recruit_embed_field_language"),
-            value=lang_name,
-            inline=True,
-        )
-
-        embed.add_field(
-            name=t(lang, "recruit_embed_field_status"),
-            value=t(lang, "recruit_embed_status_ready"),
-            inline=True,
-        )
-
-        embed.set_footer(text=t(lang, "recruit_embed_footer_interview"))
+        embed = build_recruit_card(member, user, lang)
 
         ping_role = member.guild.get_role(getattr(Config, "RECRUITER_ROLE_ID", 0))
         content = f"{member.mention} {ping_role.mention}" if ping_role else member.mention
@@ -527,16 +543,14 @@ class RegisterRecruitButton(discord.ui.Button):
             recruit_lang=lang,
         )
 
-        msg = await text_ch.send(
+        # The moderation buttons carry every id they need, so the view is not kept around
+        await text_ch.send(
             content=content,
             embed=embed,
             view=mod_view,
             allowed_mentions=discord.AllowedMentions(users=True, roles=True),
         )
 
-        # Store message ID to enable moderation callbacks later
-        mod_view.message_id = msg.id
-
         # Confirm to the recruit via DM interaction
         await interaction.response.send_message(
             t(lang, "recruit_channels_created").format(
@@ -555,43 +569,54 @@ class LanguageSelectView(discord.ui.View):
     """Language selector view shown in onboarding DMs."""
 
     def __init__(self, bot_client: commands.Bot, guild_id: int):
-        # Keep active while the bot is running; state is per-user DM.
+        # Buttons carry the guild id in their custom_id; nothing is kept in memory.
         super().__init__(timeout=None)
         self.bot = bot_client
         self.guild_id = guild_id
-        self.add_item(LanguageButton("en", t("en", "language_name_en"), "lang_en"))
-        self.add_item(LanguageButton("ru", t("ru", "language_name_ru"), "lang_ru"))
-        self.add_item(LanguageButton("uk", t("uk", "language_name_uk"), "lang_uk"))
+        self.add_item(LanguageButton("en", guild_id))
+        self.add_item(LanguageButton("ru", guild_id))
+        self.add_item(LanguageButton("uk", guild_id))
 
 
-class LanguageButton(discord.ui.Button):
-    def __init__(self, code: str, label: str, custom_id: str):
-        super().__init__(label=label, style=discord.ButtonStyle.primary, custom_id=custom_id)
+class LanguageButton(
+    discord.ui.DynamicItem[discord.ui.Button],
+    template=r"lang_(?P<code>[a-z]{2})(?::(?P<guild>[0-9]+))?",
+):
+    def __init__(self, code: str, guild_id: int | None = None):
+        super().__init__(
+            discord.ui.Button(
+                label=t(code, f"language_name_{code}"),
+                style=discord.ButtonStyle.primary,
+                custom_id=_guild_custom_id(f"lang_{code}", guild_id),
+            )
+        )
         self.code = code
+        self.guild_id = guild_id
+
+    @classmethod
+    async def from_custom_id(cls, interaction: discord.Interaction, item: discord.ui.Button, match):
+        return cls(match["code"], guild_id=_match_guild_id(match))
 
     async def callback(self, interaction: discord.Interaction):
-        view: LanguageSelectView = self.view  # type: ignore
+        bot = interaction.client
 
-        set_language(interaction.user.id, self.code)
+        await set_language(interaction.user.id, self.code)
 
         await interaction.response.send_message(
             t(self.code, "language_set"),
             ephemeral=True,
         )
 
-        guild = view.bot.get_guild(view.guild_id)
+        guild = bot.get_guild(self.guild_id) if self.guild_id else None
         if guild is None:
             return
 
-        member = guild.get_member(interaction.user.id)
+        member = await resolve_member(guild, interaction.user.id)
         if member is None:
-            try:
-                member = await guild.fetch_member(interaction.user.id)
-            except discord.DiscordException:
-                return
+            return
 
         try:
-            await send_main_menu_dm(bot=view.bot, member=member, lang=self.code)
+            await send_main_menu_dm(bot=bot, member=member, lang=self.code)
         except discord.Forbidden:
             try:
                 await interaction.followup.send(
@@ -604,6 +629,15 @@ class LanguageButton(discord.ui.Button):
             print(f"[LanguageSelect ERROR] {type(e).__name__}: {e}", file=sys.stderr)
 
 
+# Stateless buttons registered once at startup with bot.add_dynamic_items
+PERSISTENT_ITEMS = (
+    ChooseGamesButton,
+    RegisterRecruitButton,
+    LanguageButton,
+    LinkSteamButton,
+)
+
+
 # ------------ DM HELPERS ------------
 
 
@@ -614,21 +648,29 @@ async def send_main_menu_dm(bot: commands.Bot, member: discord.Member, lang: str
     await member.send(embed=embed, view=view)
 
 
-async def send_onboarding_dm(bot: commands.Bot, member: discord.Member) -> bool:
-    """Send the onboarding language selection DM to a member."""
+async def deliver_onboarding_dm(bot: commands.Bot, member: discord.Member) -> None:
+    """
+    Send the onboarding language selection DM to a member.
+    The user row is not touched: callers have already synced the member profile.
+    Raises discord.Forbidden / discord.HTTPException so callers can decide how to retry.
+    """
     if member.bot or member.guild is None:
-        return True
+        return
 
-    try:
-        get_or_create_user(member.id)
-        update_discord_profile(member)
+    text = f"{t('en', 'choose_language')} / {t('ru', 'choose_language')} / {t('uk', 'choose_language')}"
 
-        text = f"{t('en', 'choose_language')} / {t('ru', 'choose_language')} / {t('uk', 'choose_language')}"
+    await member.send(
+        text,
+        view=LanguageSelectView(bot_client=bot, guild_id=member.guild.id),
+    )
 
-        await member.send(
-            text,
-            view=LanguageSelectView(bot_client=bot, guild_id=member.guild.id),
-        )
+
+async def send_onboarding_dm(bot: commands.Bot, member: discord.Member) -> bool:
+    """Send the onboarding language selection DM to a member."""
+    try:
+        if not member.bot:
+            await update_discord_profile(member)
+        await deliver_onboarding_dm(bot, member)
         return True
     except discord.Forbidden:
         return False
@@ -643,10 +685,10 @@ async def notify_dm_disabled(bot: commands.Bot, member: discord.Member):
     if not chan_id:
         return
 
-    user = get_or_create_user(member.id)
+    user = await get_or_create_user(member.id)
     lang = user.language or getattr(Config, "DEFAULT_LANG", "en")
 
-    channel = bot.get_channel(chan_id)
+    channel = channel_index.get(member.guild, "fallback") or bot.get_channel(chan_id)
     if channel is None:
         try:
             channel = await bot.fetch_channel(chan_id)
@@ -8,26 +8,37 @@ from database.service import (
     get_or_create_user_from_member,
     get_recruit_code,
     set_recruit_channels,
+    set_recruit_status,
 )
+from database.uow import UnitOfWork
 from dms.localization import t
+from utils.channels import channel_index
+from utils.locks import KeyedLockManager
 
-_active_locks: dict[int, asyncio.Lock] = {}
+# Per-recruit locks around channel creation; idle locks are reclaimed
+recruit_channel_locks = KeyedLockManager(
+    "recruit_channels",
+    advisory=Config.RECRUIT_ADVISORY_LOCKS,
+)
 
 
 async def ensure_recruit_channels(
     guild: discord.Guild,
     member: discord.Member,
+    status: str | None = None,
 ) -> tuple[discord.TextChannel, discord.VoiceChannel, bool]:
     """
     Ensure interview channels (text and voice) exist for a recruit.
     Returns the channels and a flag indicating whether they were newly created.
-    """
-    user = get_or_create_user_from_member(member)
-    lock = _active_locks.setdefault(user.discord_id, asyncio.Lock())
 
-    async with lock:
-        # Re-read user under lock to avoid races
-        user = get_or_create_user_from_member(member)
+    Runs as one read unit of work, the channel REST calls, then one write unit
+    of work that stores the new channel ids and, if given, the recruit status.
+    """
+    async with recruit_channel_locks.hold(member.id):
+        # Re-read the row under the lock (not from the cache: another process may
+        # have stored channels); committed before any channel is created
+        async with UnitOfWork("recruit_channels_read") as uow:
+            user = await get_or_create_user_from_member(member, uow=uow)
 
         text_ch = None
         voice_ch = None
@@ -43,36 +54,49 @@ async def ensure_recruit_channels(
             if isinstance(ch, discord.VoiceChannel):
                 voice_ch = ch
 
-        # Return existing channels if both are present
-        if text_ch and voice_ch:
-            return text_ch, voice_ch, False
-
-        # Otherwise create new channels
+        created = not (text_ch and voice_ch)
+        new_channels = None
         try:
-            text_ch, voice_ch = await create_recruit_channels(guild, member)
+            if created:
+                new_channels = await create_recruit_channels(guild, member, user)
+                text_ch, voice_ch = new_channels
         except Exception as e:
             print(
                 f"[ensure_recruit_channels ERROR] {type(e).__name__}: {e}",
                 file=sys.stderr,
             )
             raise
-
-        return text_ch, voice_ch, True
+        finally:
+            # The status is written even if channel creation failed; channel ids
+            # are stored before the lock is released, so the next holder sees them
+            if status is not None or new_channels is not None:
+                async with UnitOfWork("recruit_channels_write") as uow:
+                    if status is not None:
+                        await set_recruit_status(member.id, status, uow=uow)
+                    if new_channels is not None:
+                        await set_recruit_channels(
+                            discord_id=member.id,
+                            text_id=text_ch.id,
+                            voice_id=voice_ch.id,
+                            uow=uow,
+                        )
+
+        return text_ch, voice_ch, created
 
 
 async def create_recruit_channels(
     guild: discord.Guild,
     member: discord.Member,
+    user,
 ) -> tuple[discord.TextChannel, discord.VoiceChannel]:
     """
     Create dedicated text and voice channels for recruit interviews.
-    Returns (text_channel, voice_channel).
+    Returns (text_channel, voice_channel); the caller stores their ids.
     """
-    user = get_or_create_user_from_member(member)
     lang = user.language or getattr(Config, "DEFAULT_LANG", "en")
 
-    category = guild.get_channel(Config.RECRUIT_CATEGORY_ID)
-    if category is None or not isinstance(category, discord.CategoryChannel):
+    category = channel_index.get(guild, "recruit_category")
+    if category is None:
         raise RuntimeError(t(lang, "recruit_category_not_configured"))
 
     overwrites: dict[discord.abc.Snowflake, discord.PermissionOverwrite] = {
@@ -101,24 +125,41 @@ async def create_recruit_channels(
 
     base_name = f"recruit-{member.name.lower()}-{code}"
 
-    text_channel = await guild.create_text_channel(
-        name=base_name,
-        category=category,
-        overwrites=overwrites,
-        reason=f"Recruit interview channel for {member}",
-    )
-
-    voice_channel = await guild.create_voice_channel(
-        name=base_name,
-        category=category,
-        overwrites=overwrites,
-        reason=f"Recruit interview voice for {member}",
-    )
-
-    set_recruit_channels(
-        discord_id=member.id,
-        text_id=text_channel.id,
-        voice_id=voice_channel.id,
+    # Both channels are independent, so create them concurrently
+    results = await asyncio.gather(
+        guild.create_text_channel(
+            name=base_name,
+            category=category,
+            overwrites=overwrites,
+            reason=f"Recruit interview channel for {member}",
+        ),
+        guild.create_voice_channel(
+            name=base_name,
+            category=category,
+            overwrites=overwrites,
+            reason=f"Recruit interview voice for {member}",
+        ),
+        return_exceptions=True,
     )
 
+    failures = [r for r in results if isinstance(r, BaseException)]
+    if failures:
+        # Roll back the sibling that was created so no orphan channel is left behind
+        created = [r for r in results if isinstance(r, discord.abc.GuildChannel)]
+        rollback = await asyncio.gather(
+            *(
+                ch.delete(reason=f"Rollback of failed recruit channel setup for {member}")
+                for ch in created
+            ),
+            return_exceptions=True,
+        )
+        for ch, outcome in zip(created, rollback):
+            if isinstance(outcome, BaseException):
+                print(
+                    f"[create_recruit_channels ROLLBACK ERROR] {ch}: {type(outcome).__name__}: {outcome}",
+                    file=sys.stderr,
+                )
+        raise failures[0]
+
+    text_channel, voice_channel = results
     return text_channel, voice_channel
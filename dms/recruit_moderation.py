@@ -1,4 +1,5 @@
 # dms/recruit_moderation.py
+import asyncio
 import sys
 import discord
 
@@ -8,9 +9,21 @@ from database.service import (
     get_recruit_code,
     set_recruit_status,
 )
+from database.uow import UnitOfWork, interaction_scope
+from dms.embed_templates import embed_templates, fill_field, member_profile_value, steam_profile_url
 from dms.localization import t
 from dms.steam_link import SteamLinkView
+from utils.channels import channel_index
 from utils.lang import get_lang_for_member, get_lang_for_user
+from utils.locks import KeyedLockManager
+from utils.members import resolve_member
+from utils.single_flight import single_flight
+
+# Per-recruit locks around approve / deny; idle locks are reclaimed
+recruit_decision_locks = KeyedLockManager(
+    "recruit_decisions",
+    advisory=Config.RECRUIT_ADVISORY_LOCKS,
+)
 
 
 class RecruitModerationView(discord.ui.View):
@@ -18,6 +31,10 @@ class RecruitModerationView(discord.ui.View):
     Moderation view for approving or rejecting recruit applications:
     - Approve: grants member role, sets status to done, archives channels
     - Deny: sets status to rejected and archives channels
+
+    The buttons are dynamic items that encode guild, recruit and channel ids in
+    their custom_id. The view is not stored after sending; a fresh one is built
+    from the ids on every click, so buttons survive restarts.
     """
 
     def __init__(
@@ -28,7 +45,7 @@ class RecruitModerationView(discord.ui.View):
         voice_channel_id: int,
         recruit_lang: str,
     ):
-        super().__init__(timeout=30 * 24 * 3600)
+        super().__init__(timeout=None)
         self.guild_id = guild_id
         self.recruit_id = recruit_id
         self.text_channel_id = text_channel_id
@@ -37,8 +54,23 @@ class RecruitModerationView(discord.ui.View):
 
         self.message_id: int | None = None
 
-        self.add_item(ApproveRecruitButton(self.recruit_lang))
-        self.add_item(DenyRecruitButton(self.recruit_lang))
+        ids = (guild_id, recruit_id, text_channel_id, voice_channel_id)
+        self.add_item(ApproveRecruitButton(*ids, recruit_lang=self.recruit_lang))
+        self.add_item(DenyRecruitButton(*ids, recruit_lang=self.recruit_lang))
+
+    @classmethod
+    def from_item(cls, item: "ApproveRecruitButton | DenyRecruitButton", interaction: discord.Interaction):
+        """Rebuild the view for a clicked moderation button."""
+        view = cls(
+            guild_id=item.guild_id,
+            recruit_id=item.recruit_id,
+            text_channel_id=item.text_channel_id,
+            voice_channel_id=item.voice_channel_id,
+            recruit_lang=getattr(Config, "DEFAULT_LANG", "en"),
+        )
+        if interaction.message is not None:
+            view.message_id = interaction.message.id
+        return view
 
     async def check_moderator(self, interaction: discord.Interaction) -> bool:
         guild = interaction.guild
@@ -47,7 +79,7 @@ class RecruitModerationView(discord.ui.View):
         if guild is None:
             return False
 
-        member = guild.get_member(interaction.user.id)
+        member = await resolve_member(guild, interaction.user.id)
         if member is None:
             return False
 
@@ -61,18 +93,18 @@ class RecruitModerationView(discord.ui.View):
         if any(r.id in recruiter_ids for r in member.roles):
             return True
 
-        db_user = get_or_create_user_from_member(member)
+        db_user = await get_or_create_user_from_member(member)
         if getattr(db_user, "is_admin", False):
             return True
 
         return False
 
-    def _get_user_lang(self, interaction: discord.Interaction) -> str:
+    async def _get_user_lang(self, interaction: discord.Interaction) -> str:
         """Return the moderator's preferred language or default."""
         if isinstance(interaction.user, discord.Member):
-            return get_lang_for_member(interaction.user)
+            return await get_lang_for_member(interaction.user)
         if isinstance(interaction.user, discord.abc.User):
-            return get_lang_for_user(interaction.user)
+            return await get_lang_for_user(interaction.user)
         return getattr(Config, "DEFAULT_LANG", "en")
 
     async def _archive_or_lock_channels(
@@ -85,45 +117,55 @@ class RecruitModerationView(discord.ui.View):
         text_ch = guild.get_channel(self.text_channel_id)
         voice_ch = guild.get_channel(self.voice_channel_id)
 
-        archive_cat = None
-        archive_cat_id = int(getattr(Config, "RECRUIT_ARCHIVE_CATEGORY_ID", 0) or 0)
-        if archive_cat_id:
-            ch = guild.get_channel(archive_cat_id)
-            if isinstance(ch, discord.CategoryChannel):
-                archive_cat = ch
+        archive_cat = channel_index.get(guild, "archive_category")
 
-        if isinstance(text_ch, discord.TextChannel):
-            new_name = f"{text_ch.name}-archived"
-            await text_ch.edit(
-                name=new_name[:100],
-                category=archive_cat or text_ch.category,
-                reason=reason,
-            )
+        def archive(channel: discord.abc.GuildChannel):
+            # Rename, move and lock in a single edit call per channel
+            options = {
+                "name": f"{channel.name}-archived"[:100],
+                "category": archive_cat or channel.category,
+                "reason": reason,
+            }
             if deny_access:
-                await text_ch.set_permissions(
-                    recruit,
-                    overwrite=discord.PermissionOverwrite(view_channel=False),
-                )
+                overwrites = dict(channel.overwrites)
+                overwrites[recruit] = discord.PermissionOverwrite(view_channel=False)
+                options["overwrites"] = overwrites
+            return channel.edit(**options)
 
+        edits = []
+        if isinstance(text_ch, discord.TextChannel):
+            edits.append(archive(text_ch))
         if isinstance(voice_ch, discord.VoiceChannel):
-            new_name = f"{voice_ch.name}-archived"
-            await voice_ch.edit(
-                name=new_name[:100],
-                category=archive_cat or voice_ch.category,
-                reason=reason,
+            edits.append(archive(voice_ch))
+
+        # Text and voice channels are independent, so edit them concurrently
+        results = await asyncio.gather(*edits, return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+    async def _load_undecided(self, interaction: discord.Interaction, recruit: discord.Member):
+        """
+        Read the recruit's row from the database (callers hold the recruit lock,
+        so a decision made meanwhile is visible). Returns None, after telling the
+        moderator, when the application is already approved or rejected.
+        """
+        async with UnitOfWork("recruit_decision_read") as uow:
+            db_user = await get_or_create_user_from_member(recruit, uow=uow)
+
+        status = (db_user.recruit_status or "").lower()
+        if status in ("done", "rejected"):
+            mod_lang = await self._get_user_lang(interaction)
+            await interaction.followup.send(
+                t(mod_lang, "recruit_moderation_already_decided").format(status=status.upper()),
+                ephemeral=True,
             )
-            if deny_access:
-                await voice_ch.set_permissions(
-                    recruit,
-                    overwrite=discord.PermissionOverwrite(view_channel=False),
-                )
+            await self.disable_buttons(interaction)
+            return None
+        return db_user
 
     async def disable_buttons(self, interaction: discord.Interaction):
         """Disable buttons after an action so no further input is possible."""
-        for child in self.children:
-            if isinstance(child, discord.ui.Button):
-                child.disabled = True
-
         try:
             guild = interaction.guild or interaction.client.get_guild(self.guild_id)
             if guild is None:
@@ -139,7 +181,12 @@ class RecruitModerationView(discord.ui.View):
                 msg = interaction.message
 
             if msg:
-                await msg.edit(view=self)
+                # Rebuild from the message so the original button labels are kept
+                disabled = discord.ui.View.from_message(msg, timeout=None)
+                for child in disabled.children:
+                    if isinstance(child, discord.ui.Button):
+                        child.disabled = True
+                await msg.edit(view=disabled)
         except Exception as e:
             print(
                 f"[RecruitModerationView.disable_buttons ERROR] {type(e).__name__}: {e}",
@@ -149,24 +196,26 @@ class RecruitModerationView(discord.ui.View):
     async def process_approve(self, interaction: discord.Interaction):
         guild = interaction.guild or interaction.client.get_guild(self.guild_id)
         if guild is None:
-            mod_lang = self._get_user_lang(interaction)
+            mod_lang = await self._get_user_lang(interaction)
             await interaction.followup.send(
                 t(mod_lang, "guild_not_found"), ephemeral=True
             )
             return
 
-        recruit = guild.get_member(self.recruit_id)
+        recruit = await resolve_member(guild, self.recruit_id)
         if recruit is None:
-            mod_lang = self._get_user_lang(interaction)
+            mod_lang = await self._get_user_lang(interaction)
             await interaction.followup.send(
                 t(mod_lang, "recruit_not_found_server"),
                 ephemeral=True,
             )
             return
 
-        db_user = get_or_create_user_from_member(recruit)
-        recruit_lang = (db_user.language or "en") if db_user else "en"
-        mod_lang = self._get_user_lang(interaction)
+        db_user = await self._load_undecided(interaction, recruit)
+        if db_user is None:
+            return
+        recruit_lang = db_user.language or "en"
+        mod_lang = await self._get_user_lang(interaction)
 
         if not getattr(db_user, "steam_id", None):
             try:
@@ -188,8 +237,6 @@ class RecruitModerationView(discord.ui.View):
             )
             return
 
-        set_recruit_status(self.recruit_id, "done")
-
         recruit_role = guild.get_role(Config.RECRUIT_ROLE_ID)
         if recruit_role and recruit_role in recruit.roles:
             await recruit.remove_roles(
@@ -204,6 +251,11 @@ class RecruitModerationView(discord.ui.View):
                     member_role, reason=f"Recruit approved by {interaction.user}"
                 )
 
+        # Stored once the roles are swapped and committed before the remaining
+        # Discord calls, so a failed archive cannot roll it back
+        async with UnitOfWork("recruit_decision_write") as uow:
+            await set_recruit_status(self.recruit_id, "done", uow=uow)
+
         await self._archive_or_lock_channels(
             guild,
             recruit,
@@ -238,22 +290,26 @@ class RecruitModerationView(discord.ui.View):
     async def process_deny(self, interaction: discord.Interaction):
         guild = interaction.guild or interaction.client.get_guild(self.guild_id)
         if guild is None:
-            mod_lang = self._get_user_lang(interaction)
+            mod_lang = await self._get_user_lang(interaction)
             await interaction.followup.send(
                 t(mod_lang, "guild_not_found"), ephemeral=True
             )
             return
 
-        recruit = guild.get_member(self.recruit_id)
+        recruit = await resolve_member(guild, self.recruit_id)
         if recruit is None:
-            mod_lang = self._get_user_lang(interaction)
+            mod_lang = await self._get_user_lang(interaction)
             await interaction.followup.send(
                 t(mod_lang, "recruit_not_found_server"),
                 ephemeral=True,
             )
             return
 
-        set_recruit_status(self.recruit_id, "rejected")
+        db_user = await self._load_undecided(interaction, recruit)
+        if db_user is None:
+            return
+        recruit_lang = db_user.language or "en"
+        mod_lang = await self._get_user_lang(interaction)
 
         recruit_role = guild.get_role(Config.RECRUIT_ROLE_ID)
         if recruit_role and recruit_role in recruit.roles:
@@ -261,6 +317,10 @@ class RecruitModerationView(discord.ui.View):
                 recruit_role, reason=f"Recruit rejected by {interaction.user}"
             )
 
+        # Committed before the remaining Discord calls, see process_approve
+        async with UnitOfWork("recruit_decision_write") as uow:
+            await set_recruit_status(self.recruit_id, "rejected", uow=uow)
+
         await self._archive_or_lock_channels(
             guild,
             recruit,
@@ -268,10 +328,6 @@ class RecruitModerationView(discord.ui.View):
             deny_access=True,
         )
 
-        db_user = get_or_create_user_from_member(recruit)
-        recruit_lang = (db_user.language or "en") if db_user else "en"
-        mod_lang = self._get_user_lang(interaction)
-
         msg = t(recruit_lang, "recruit_moderation_dm_rejected")
 
         try:
@@ -310,9 +366,13 @@ class ConfirmApproveView(discord.ui.View):
                     child.label = t(lang, "btn_no")
 
     @discord.ui.button(label="Yes", style=discord.ButtonStyle.success)
+    @single_flight(lambda view: f"recruit_decision:{view.parent.recruit_id}", per_user=False)
     async def yes(self, interaction: discord.Interaction, button: discord.ui.Button):
         await interaction.response.defer(ephemeral=True)
-        await self.parent.process_approve(interaction)
+        # Serializes with a deny for the same recruit, also across processes
+        async with interaction_scope("recruit_approve"):
+            async with recruit_decision_locks.hold(self.parent.recruit_id):
+                await self.parent.process_approve(interaction)
         try:
             text = t(self.lang, "recruit_moderation_confirm_yes")
             await interaction.message.edit(content=text, view=None)
@@ -340,9 +400,12 @@ class ConfirmDenyView(discord.ui.View):
                     child.label = t(lang, "btn_no")
 
     @discord.ui.button(label="Yes", style=discord.ButtonStyle.danger)
+    @single_flight(lambda view: f"recruit_decision:{view.parent.recruit_id}", per_user=False)
     async def yes(self, interaction: discord.Interaction, button: discord.ui.Button):
         await interaction.response.defer(ephemeral=True)
-        await self.parent.process_deny(interaction)
+        async with interaction_scope("recruit_deny"):
+            async with recruit_decision_locks.hold(self.parent.recruit_id):
+                await self.parent.process_deny(interaction)
         try:
             text = t(self.lang, "recruit_moderation_denied_label")
             await interaction.message.edit(content=text, view=None)
@@ -357,20 +420,51 @@ class ConfirmDenyView(discord.ui.View):
         self.stop()
 
 
-class ApproveRecruitButton(discord.ui.Button):
-    def __init__(self, recruit_lang: str):
+def _match_ids(match) -> tuple[int, int, int, int]:
+    """Parse guild, recruit, text and voice channel ids from a moderation custom_id."""
+    return (
+        int(match["guild"]),
+        int(match["recruit"]),
+        int(match["text"]),
+        int(match["voice"]),
+    )
+
+
+class ApproveRecruitButton(
+    discord.ui.DynamicItem[discord.ui.Button],
+    template=r"recruit_approve:(?P<guild>[0-9]+):(?P<recruit>[0-9]+):(?P<text>[0-9]+):(?P<voice>[0-9]+)",
+):
+    def __init__(
+        self,
+        guild_id: int,
+        recruit_id: int,
+        text_channel_id: int,
+        voice_channel_id: int,
+        recruit_lang: str = "en",
+    ):
         super().__init__(
-            label=t(recruit_lang, "btn_approve"),
-            style=discord.ButtonStyle.success,
-            custom_id="recruit_approve",
+            discord.ui.Button(
+                label=t(recruit_lang, "btn_approve"),
+                style=discord.ButtonStyle.success,
+                custom_id=f"recruit_approve:{guild_id}:{recruit_id}:{text_channel_id}:{voice_channel_id}",
+            )
         )
+        self.guild_id = guild_id
+        self.recruit_id = recruit_id
+        self.text_channel_id = text_channel_id
+        self.voice_channel_id = voice_channel_id
+
+    @classmethod
+    async def from_custom_id(cls, interaction: discord.Interaction, item: discord.ui.Button, match):
+        return cls(*_match_ids(match))
 
+    @single_flight(lambda item: f"recruit_moderation:{item.recruit_id}")
     async def callback(self, interaction: discord.Interaction):
-        view: RecruitModerationView = self.view  # type: ignore
+        view = RecruitModerationView.from_item(self, interaction)
 
         if not await view.check_moderator(interaction):
             await interaction.response.send_message(
-                t(view._get_user_lang(interaction), "recruit_moderation_not_allowed_approve"),
+                t(await view._get_user_lang(interaction), "recruit_moderation_not_allowed_approve"),
                 ephemeral=True,
             )
             return
@@ -378,21 +472,21 @@ class ApproveRecruitButton(discord.ui.Button):
         guild = interaction.guild or interaction.client.get_guild(view.guild_id)
         if guild is None:
             await interaction.response.send_message(
-                t(view._get_user_lang(interaction), "guild_not_found"), ephemeral=True
+                t(await view._get_user_lang(interaction), "guild_not_found"), ephemeral=True
             )
             return
 
-        recruit = guild.get_member(view.recruit_id)
+        recruit = await resolve_member(guild, view.recruit_id)
         if recruit is None:
             await interaction.response.send_message(
-                t(view._get_user_lang(interaction), "recruit_not_found_server"),
+                t(await view._get_user_lang(interaction), "recruit_not_found_server"),
                 ephemeral=True,
             )
             return
 
-        db_user = get_or_create_user_from_member(recruit)
+        db_user = await get_or_create_user_from_member(recruit)
         recruit_lang = (db_user.language or "en") if db_user else "en"
-        mod_lang = view._get_user_lang(interaction)
+        mod_lang = await view._get_user_lang(interaction)
 
         question = t(mod_lang, "recruit_moderation_confirm_approve").format(
             recruit=recruit.mention
@@ -407,20 +501,41 @@ class ApproveRecruitButton(discord.ui.Button):
         )
 
 
-class DenyRecruitButton(discord.ui.Button):
-    def __init__(self, recruit_lang: str):
+class DenyRecruitButton(
+    discord.ui.DynamicItem[discord.ui.Button],
+    template=r"recruit_deny:(?P<guild>[0-9]+):(?P<recruit>[0-9]+):(?P<text>[0-9]+):(?P<voice>[0-9]+)",
+):
+    def __init__(
+        self,
+        guild_id: int,
+        recruit_id: int,
+        text_channel_id: int,
+        voice_channel_id: int,
+        recruit_lang: str = "en",
+    ):
         super().__init__(
-            label=t(recruit_lang, "btn_deny"),
-            style=discord.ButtonStyle.danger,
-            custom_id="recruit_deny",
+            discord.ui.Button(
+                label=t(recruit_lang, "btn_deny"),
+                style=discord.ButtonStyle.danger,
+                custom_id=f"recruit_deny:{guild_id}:{recruit_id}:{text_channel_id}:{voice_channel_id}",
+            )
         )
+        self.guild_id = guild_id
+        self.recruit_id = recruit_id
+        self.text_channel_id = text_channel_id
+        self.voice_channel_id = voice_channel_id
+
+    @classmethod
+    async def from_custom_id(cls, interaction: discord.Interaction, item: discord.ui.Button, match):
+        return cls(*_match_ids(match))
 
+    @single_flight(lambda item: f"recruit_moderation:{item.recruit_id}")
     async def callback(self, interaction: discord.Interaction):
-        view: RecruitModerationView = self.view  # type: ignore
+        view = RecruitModerationView.from_item(self, interaction)
 
         if not await view.check_moderator(interaction):
             await interaction.response.send_message(
-                t(view._get_user_lang(interaction), "recruit_moderation_not_allowed_deny"),
+                t(await view._get_user_lang(interaction), "recruit_moderation_not_allowed_deny"),
                 ephemeral=True,
             )
             return
@@ -428,21 +543,21 @@ class DenyRecruitButton(discord.ui.Button):
         guild = interaction.guild or interaction.client.get_guild(view.guild_id)
         if guild is None:
             await interaction.response.send_message(
-                t(view._get_user_lang(interaction), "guild_not_found"), ephemeral=True
+                t(await view._get_user_lang(interaction), "guild_not_found"), ephemeral=True
             )
             return
 
-        recruit = guild.get_member(view.recruit_id)
+        recruit = await resolve_member(guild, view.recruit_id)
         if recruit is None:
             await interaction.response.send_message(
-                t(view._get_user_lang(interaction), "recruit_not_found_server"),
+                t(await view._get_user_lang(interaction), "recruit_not_found_server"),
                 ephemeral=True,
             )
             return
 
-        db_user = get_or_create_user_from_member(recruit)
+        db_user = await get_or_create_user_from_member(recruit)
         recruit_lang = (db_user.language or "en") if db_user else "en"
-        mod_lang = view._get_user_lang(interaction)
+        mod_lang = await view._get_user_lang(interaction)
 
         question = t(mod_lang, "recruit_moderation_confirm_deny").format(
             recruit=recruit.mention
@@ -457,82 +572,70 @@ class DenyRecruitButton(discord.ui.Button):
         )
 
 
-async def send_recruit_moderation_embed(
-    guild: discord.Guild,
-    member: discord.Member,
-    text_ch: discord.TextChannel,
-    voice_ch: discord.VoiceChannel,
-):
-    """
-    Send the recruit moderation embed:
-    - embed with recruit info
-    - view with Approve / Deny buttons
-    """
-    user = get_or_create_user_from_member(member)
-    lang = user.language or "en"
-
-    if getattr(user, "steam_url", None):
-        steam_url = user.steam_url
-    elif user.steam_id:
-        steam_url = f"https://steamcommunity.com/profiles/{user.steam_id}"
-    else:
-        steam_url = None
+# Field positions in the recruit card template
+_CARD_CODE, _CARD_DISCORD, _CARD_STEAM, _CARD_LANGUAGE = range(4)
 
-    recruit_code = get_recruit_code(user)
 
+@embed_templates.template("recruit_card")
+def _recruit_card_template(lang: str) -> discord.Embed:
     embed = discord.Embed(
-        title=t(lang, "recruit_embed_title").format(name=member.display_name),
+        title=t(lang, "recruit_embed_title"),
         color=discord.Color.gold(),
     )
-
+    embed.add_field(name=t(lang, "recruit_embed_field_code"), value="-", inline=False)
+    embed.add_field(name=t(lang, "recruit_embed_field_discord"), value="-", inline=False)
     embed.add_field(
-        name=t(lang, "recruit_embed_field_code"),
-        value=recruit_code,
+        name=t(lang, "recruit_embed_field_steam"),
+        value=t(lang, "recruit_embed_steam_not_linked"),
         inline=False,
     )
-
+    embed.add_field(name=t(lang, "recruit_embed_field_language"), value="-", inline=True)
     embed.add_field(
-        name=t(lang, "recruit_embed_field_discord"),
-        value=(
-            f"{member.mention}\n"
-            f"Display name: **{member.display_name}**\n"
-            f"Username: `{member.name}`\n"
-            f"ID: `{member.id}`"
-        ),
-        inline=False,
+        name=t(lang, "recruit_embed_field_status"),
+        value=t(lang, "recruit_embed_status_ready"),
+        inline=True,
     )
+    embed.set_footer(text=t(lang, "recruit_embed_footer_interview"))
+    return embed
 
-    if steam_url:
-        embed.add_field(
-            name=t(lang, "recruit_embed_field_steam"),
-            value=f"ID: `{user.steam_id}`\n[Open profile]({steam_url})",
-            inline=False,
-        )
-    else:
-        embed.add_field(
-            name=t(lang, "recruit_embed_field_steam"),
-            value=t(lang, "recruit_embed_steam_not_linked"),
-            inline=False,
-        )
 
-    lang_name = {
-        "ru": t(lang, "language_name_ru"),
-        "en": t(lang, "language_name_en"),
-    }.get(user.language, t(lang, "language_name_en"))
+def build_recruit_card(member: discord.Member, user, lang: str) -> discord.Embed:
+    """Recruit card posted to moderators: the cached template plus this recruit's details."""
+    embed = embed_templates.get("recruit_card", lang)
+    embed.title = embed.title.format(name=member.display_name)
 
-    embed.add_field(
-        name=t(lang, "recruit_embed_field_language"),
-        value=lang_name,
-        inline=True,
-    )
+    fill_field(embed, _CARD_CODE, get_recruit_code(user))
+    fill_field(embed, _CARD_DISCORD, member_profile_value(member))
 
-    embed.add_field(
-        name=t(lang, "recruit_embed_field_status"),
-        value=t(lang, "recruit_embed_status_ready"),
-        inline=True,
+    steam_url = steam_profile_url(user)
+    if steam_url:
+        fill_field(embed, _CARD_STEAM, f"ID: `{user.steam_id}`\n[Open profile]({steam_url})")
+
+    fill_field(
+        embed,
+        _CARD_LANGUAGE,
+        t(lang, "language_name_ru" if user.language == "ru" else "language_name_en"),
     )
+    return embed
 
-    embed.set_footer(text=t(lang, "recruit_embed_footer_interview"))
+
+async def send_recruit_moderation_embed(
+    guild: discord.Guild,
+    member: discord.Member,
+    text_ch: discord.TextChannel,
+    voice_ch: discord.VoiceChannel,
+    user=None,
+):
+    """
+    Send the recruit moderation embed:
+    - embed with recruit info
+    - view with Approve / Deny buttons
+    Pass the already loaded user row to skip the lookup.
+    """
+    if user is None:
+        user = await get_or_create_user_from_member(member)
+    lang = user.language or "en"
+    embed = build_recruit_card(member, user, lang)
 
     role = guild.get_role(Config.RECRUITER_ROLE_ID)
     content = f"{member.mention} {role.mention}" if role else member.mention
@@ -546,12 +649,18 @@ async def send_recruit_moderation_embed(
     )
 
     try:
-        msg = await text_ch.send(
+        await text_ch.send(
             content=content,
             embed=embed,
             view=mod_view,
             allowed_mentions=discord.AllowedMentions(users=True, roles=True),
         )
-        mod_view.message_id = msg.id
     except Exception as e:
         print(f"[RecruitEmbed ERROR] {type(e).__name__}: {e}", file=sys.stderr)
+
+
+# Stateless moderation buttons registered once at startup with bot.add_dynamic_items
+PERSISTENT_ITEMS = (
+    ApproveRecruitButton,
+    DenyRecruitButton,
+)
@@ -11,9 +11,7 @@ from utils.lang import get_lang_for_member, get_lang_for_user
 class SteamLinkModal(discord.ui.Modal):
     """Modal window to collect Steam ID from the user."""
 
-    def __init__(self, member: discord.abc.User):
-        user = get_or_create_user(member.id)
-        lang = (user.language or "en") if user else "en"
+    def __init__(self, member: discord.abc.User, lang: str):
         super().__init__(title=t(lang, "steam_modal_title"))
         self.member = member
         self.lang = lang
@@ -37,7 +35,7 @@ class SteamLinkModal(discord.ui.Modal):
 
             steam_id = self.steam_id_input.value.strip()
 
-            user = get_or_create_user(self.member.id)
+            user = await get_or_create_user(self.member.id)
             lang = (user.language or "en") if user else "en"
 
             # Validate SteamID64 pattern
@@ -52,7 +50,7 @@ class SteamLinkModal(discord.ui.Modal):
                 )
                 return
 
-            link_steam(discord_id=self.member.id, steam_id=steam_id)
+            await link_steam(discord_id=self.member.id, steam_id=steam_id)
 
             await interaction.response.send_message(
                 t(lang, "steam_saved").format(steam_id=steam_id),
@@ -69,18 +67,29 @@ class SteamLinkModal(discord.ui.Modal):
                 pass
 
 
-class LinkSteamButton(discord.ui.Button):
-    """Button to open the SteamLinkModal."""
-    def __init__(self, lang: str):
+class LinkSteamButton(discord.ui.DynamicItem[discord.ui.Button], template=r"link_steam_modal"):
+    """
+    Button to open the SteamLinkModal.
+    Stateless dynamic item: the modal is resolved from the clicking user, so the
+    button keeps working after a restart without a view held in memory.
+    """
+
+    def __init__(self, lang: str = "en"):
         super().__init__(
-            label=t(lang, "btn_steam"),
-            style=discord.ButtonStyle.primary,
-            custom_id="link_steam_modal",
+            discord.ui.Button(
+                label=t(lang, "btn_steam"),
+                style=discord.ButtonStyle.primary,
+                custom_id="link_steam_modal",
+            )
         )
-        self.lang = lang
+
+    @classmethod
+    async def from_custom_id(cls, interaction: discord.Interaction, item: discord.ui.Button, match):
+        return cls()
 
     async def callback(self, interaction: discord.Interaction):
-        modal = SteamLinkModal(member=interaction.user)
+        lang = await get_lang_for_user(interaction.user)
+        modal = SteamLinkModal(member=interaction.user, lang=lang)
         await interaction.response.send_modal(modal)
 
 
@@ -88,5 +97,5 @@ class SteamLinkView(discord.ui.View):
     """View with a button to start the Steam ID linking modal in DM or onboarding flow."""
 
     def __init__(self, lang: str):
-        super().__init__(timeout=900)
+        super().__init__(timeout=None)
         self.add_item(LinkSteamButton(lang))
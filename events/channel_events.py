@@ -0,0 +1,37 @@
+# events/channel_events.py
+
+import discord
+from discord.ext import commands
+
+from utils.channels import channel_index
+
+
+class ChannelEvents(commands.Cog):
+    """Keep the channel index in sync with channel changes."""
+
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+
+    @commands.Cog.listener()
+    async def on_guild_channel_create(self, channel: discord.abc.GuildChannel):
+        channel_index.channel_created(channel)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_update(
+        self,
+        before: discord.abc.GuildChannel,
+        after: discord.abc.GuildChannel,
+    ):
+        channel_index.channel_updated(before, after)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel):
+        channel_index.channel_deleted(channel)
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild: discord.Guild):
+        channel_index.forget_guild(guild.id)
+
+
+async def setup(bot: commands.Bot):
+    await bot.add_cog(ChannelEvents(bot))
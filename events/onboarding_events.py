@@ -4,14 +4,9 @@ import sys
 import discord
 from discord.ext import commands
 
-from dms.onboarding_flow import (
-    send_onboarding_dm,
-    notify_dm_disabled,
-)
-from database.service import (
-    get_or_create_user_from_member,
-    update_discord_profile,
-)
+from dms.dm_dispatch import create_dispatcher
+from utils.members import member_resolver
+from database.service import get_or_create_user_from_member
 
 
 class OnboardingEvents(commands.Cog):
@@ -19,12 +14,23 @@ class OnboardingEvents(commands.Cog):
 
     def __init__(self, bot: commands.Bot):
         self.bot = bot
+        # Onboarding DMs are sent by a paced worker pool instead of inline in the join handler
+        self.dispatcher = create_dispatcher(bot)
+
+    async def cog_load(self):
+        self.dispatcher.start()
+
+    async def cog_unload(self):
+        await self.dispatcher.stop()
 
     # --------- Event listeners ---------
 
     @commands.Cog.listener()
     async def on_member_join(self, member: discord.Member):
         """Handle member joins and initiate onboarding."""
+        # A cached "not in guild" answer is stale now
+        member_resolver.forget(member.guild.id, member.id)
+
         if member.bot:
             return
 
@@ -33,19 +39,12 @@ class OnboardingEvents(commands.Cog):
 
         # Create or update the user record in the database
         try:
-            get_or_create_user_from_member(member)
-            update_discord_profile(member)
+            await get_or_create_user_from_member(member)
         except Exception as e:
             print(f"[on_member_join DB ERROR] {type(e).__name__}: {e}", file=sys.stderr)
 
-        # Send onboarding DM to the member
-        ok = await send_onboarding_dm(self.bot, member)
-        if not ok:
-            # If DMs are closed, notify in the fallback channel
-            try:
-                await notify_dm_disabled(self.bot, member)
-            except Exception as e:
-                print(f"[notify_dm_disabled ERROR] {type(e).__name__}: {e}", file=sys.stderr)
+        # Queue the onboarding DM; the dispatcher falls back to notify_dm_disabled if DMs are closed
+        self.dispatcher.submit(member)
 
 
 async def setup(bot: commands.Bot):
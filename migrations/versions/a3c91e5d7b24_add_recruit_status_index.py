@@ -0,0 +1,32 @@
+"""add recruit_status index to users
+
+Revision ID: a3c91e5d7b24
+Revises: 4fbc3fb5cde0
+Create Date: 2026-10-18 12:04:31.518204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3c91e5d7b24'
+down_revision: Union[str, Sequence[str], None] = '4fbc3fb5cde0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_users_recruit_status_id',
+        'users',
+        ['recruit_status', 'id'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_users_recruit_status_id', table_name='users')
@@ -0,0 +1,35 @@
+# tests/conftest.py
+import asyncio
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Point the bot at a throwaway SQLite file before config / database are imported
+_db_dir = tempfile.mkdtemp(prefix="bot-tests-")
+os.environ["DATABASE_URL"] = f"sqlite:///{Path(_db_dir) / 'test.db'}"
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pytest
+
+from database.cache import language_cache, user_cache
+from database.db import Base, engine
+from database.profile_sync import profile_refresher
+from database import models  # noqa: F401  (registers the tables)
+
+
+async def _reset_schema():
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    await engine.dispose()
+
+
+@pytest.fixture(autouse=True)
+def fresh_database():
+    """Empty tables and caches for every test."""
+    asyncio.run(_reset_schema())
+    user_cache.clear()
+    language_cache._languages.clear()
+    profile_refresher._pending.clear()
+    yield
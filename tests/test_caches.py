@@ -0,0 +1,127 @@
+# tests/test_caches.py
+from types import SimpleNamespace
+
+import discord
+
+import database.cache as cache_module
+from database.cache import LanguageCache, UserCache
+from database.models import User
+from dms.embed_templates import EmbedTemplateCache, fill_field
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+def _clock(monkeypatch) -> _Clock:
+    clock = _Clock()
+    monkeypatch.setattr(cache_module, "time", SimpleNamespace(monotonic=clock.monotonic))
+    return clock
+
+
+def test_user_cache_expires_entries_after_ttl(monkeypatch):
+    clock = _clock(monkeypatch)
+    cache = UserCache(max_size=10, ttl=60)
+    cache.put(User(discord_id=1))
+
+    clock.now += 59
+    assert cache.get(1).discord_id == 1
+
+    clock.now += 2
+    assert cache.get(1) is None
+    assert cache.stats()["size"] == 0
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_user_cache_evicts_least_recently_used(monkeypatch):
+    _clock(monkeypatch)
+    cache = UserCache(max_size=2, ttl=60)
+    cache.put(User(discord_id=1))
+    cache.put(User(discord_id=2))
+
+    # Touching 1 makes 2 the least recently used entry
+    assert cache.get(1) is not None
+    cache.put(User(discord_id=3))
+
+    assert cache.get(2) is None
+    assert cache.get(1) is not None
+    assert cache.get(3) is not None
+    assert cache.evictions == 1
+
+
+def test_user_cache_put_if_missing_keeps_live_entry(monkeypatch):
+    clock = _clock(monkeypatch)
+    cache = UserCache(max_size=10, ttl=60)
+    fresh = User(discord_id=1, language="ru")
+    cache.put(fresh)
+
+    assert not cache.put_if_missing(User(discord_id=1, language="en"))
+    assert cache.get(1) is fresh
+
+    clock.now += 61
+    assert cache.put_if_missing(User(discord_id=1, language="en"))
+    assert cache.get(1).language == "en"
+
+
+def test_user_cache_disabled_with_zero_size():
+    cache = UserCache(max_size=0, ttl=60)
+    cache.put(User(discord_id=1))
+    assert cache.get(1) is None
+
+
+def test_language_cache_miss_is_unknown(monkeypatch):
+    _clock(monkeypatch)
+    cache = LanguageCache(ttl=60)
+    cache.warm({1: "ru", 2: None})
+
+    assert cache.lookup(1) == (True, "ru")
+    # No language set is a known answer, a missing row is not
+    assert cache.lookup(2) == (True, None)
+    assert cache.lookup(3) == (False, None)
+
+
+def test_language_cache_entries_expire(monkeypatch):
+    clock = _clock(monkeypatch)
+    cache = LanguageCache(ttl=60)
+    cache.set(1, "uk")
+
+    clock.now += 61
+    assert cache.lookup(1) == (False, None)
+    assert len(cache) == 0
+
+
+def test_language_cache_warm_keeps_newer_entries(monkeypatch):
+    _clock(monkeypatch)
+    cache = LanguageCache(ttl=60)
+    cache.set(1, "uk")
+    cache.warm({1: "en", 2: "ru"})
+
+    assert cache.lookup(1) == (True, "uk")
+    assert cache.lookup(2) == (True, "ru")
+
+
+def test_embed_template_copies_are_independent():
+    templates = EmbedTemplateCache()
+
+    @templates.template("card")
+    def build(lang: str) -> discord.Embed:
+        embed = discord.Embed(title=f"card-{lang}")
+        embed.add_field(name="code", value="-")
+        return embed
+
+    first = templates.get("card", "en")
+    fill_field(first, 0, "R-0001")
+    first.add_field(name="extra", value="x")
+
+    second = templates.get("card", "en")
+    assert second.title == "card-en"
+    assert [(f.name, f.value) for f in second.fields] == [("code", "-")]
+    assert (templates.builds, templates.hits) == (1, 1)
+
+    templates.clear()
+    templates.get("card", "en")
+    assert templates.builds == 2
@@ -0,0 +1,144 @@
+# tests/test_concurrency.py
+import asyncio
+import time
+from types import SimpleNamespace
+
+from database.db import engine
+from dms.dm_dispatch import TokenBucket
+from utils.locks import KeyedLockManager
+from utils.single_flight import interaction_flights, single_flight
+
+
+def test_keyed_locks_serialize_and_reclaim_idle_keys():
+    locks = KeyedLockManager("test")
+    order = []
+
+    async def worker(name: str, entered: asyncio.Event | None = None):
+        async with locks.hold(7):
+            order.append(f"{name} in")
+            if entered is not None:
+                entered.set()
+            await asyncio.sleep(0.01)
+            order.append(f"{name} out")
+
+    async def scenario():
+        entered = asyncio.Event()
+        first = asyncio.create_task(worker("a", entered))
+        await entered.wait()
+        second = asyncio.create_task(worker("b"))
+        await asyncio.sleep(0)
+
+        during = locks.stats()
+        await asyncio.gather(first, second)
+        return during
+
+    during = asyncio.run(scenario())
+    assert order == ["a in", "a out", "b in", "b out"]
+    assert (during["live"], during["waiting"]) == (1, 1)
+
+    after = locks.stats()
+    assert (after["live"], after["waiting"]) == (0, 0)
+    assert (after["acquisitions"], after["contended"]) == (2, 1)
+    assert after["advisory"] is False
+
+
+def test_keyed_locks_release_entry_when_body_raises():
+    locks = KeyedLockManager("test")
+
+    async def scenario():
+        try:
+            async with locks.hold(1):
+                raise RuntimeError("boom")
+        except RuntimeError:
+            pass
+
+    asyncio.run(scenario())
+    assert locks.stats()["live"] == 0
+
+
+class _Response:
+    def __init__(self):
+        self.messages = []
+
+    async def send_message(self, content, ephemeral=False):
+        self.messages.append(content)
+
+
+class _Button:
+    def __init__(self, release: asyncio.Event):
+        self.release = release
+        self.calls = 0
+
+    @single_flight("test_action")
+    async def callback(self, interaction):
+        self.calls += 1
+        await self.release.wait()
+
+    @single_flight(lambda item: "test_shared", per_user=False)
+    async def shared(self, interaction):
+        self.calls += 1
+        await self.release.wait()
+
+
+def _interaction(user_id: int):
+    return SimpleNamespace(user=SimpleNamespace(id=user_id), response=_Response())
+
+
+def test_single_flight_collapses_duplicate_clicks_per_user():
+    async def scenario():
+        release = asyncio.Event()
+        button = _Button(release)
+        first, duplicate, other_user = _interaction(1), _interaction(1), _interaction(2)
+
+        running = asyncio.create_task(button.callback(first))
+        await asyncio.sleep(0)
+        await button.callback(duplicate)
+        other = asyncio.create_task(button.callback(other_user))
+        await asyncio.sleep(0)
+
+        release.set()
+        await asyncio.gather(running, other)
+        await engine.dispose()
+        return button, duplicate
+
+    button, duplicate = asyncio.run(scenario())
+    assert button.calls == 2
+    assert len(duplicate.response.messages) == 1
+    assert interaction_flights.stats()["active"] == 0
+
+
+def test_single_flight_shared_action_blocks_other_users():
+    async def scenario():
+        release = asyncio.Event()
+        button = _Button(release)
+        other_user = _interaction(2)
+
+        running = asyncio.create_task(button.shared(_interaction(1)))
+        await asyncio.sleep(0)
+        await button.shared(other_user)
+
+        release.set()
+        await running
+        await engine.dispose()
+        return button, other_user
+
+    button, other_user = asyncio.run(scenario())
+    assert button.calls == 1
+    assert len(other_user.response.messages) == 1
+
+
+def test_token_bucket_allows_burst_then_paces():
+    async def scenario():
+        bucket = TokenBucket(rate=50, capacity=3)
+        started = time.monotonic()
+        for _ in range(3):
+            await bucket.acquire()
+        burst = time.monotonic() - started
+        for _ in range(2):
+            await bucket.acquire()
+        return burst, time.monotonic() - started
+
+    burst, total = asyncio.run(scenario())
+    assert burst < 0.02
+    # Two tokens beyond the burst at 50 per second take about 40 ms
+    assert total >= 0.035
@@ -0,0 +1,84 @@
+# tests/test_localization.py
+import json
+
+import pytest
+
+import dms.localization as localization
+from dms.localization import check_locale, reload_locales, t
+
+
+@pytest.fixture
+def locales_dir(tmp_path, monkeypatch):
+    """Point the catalog at a temporary locales directory and restore it afterwards."""
+    saved = dict(localization._CATALOG)
+    monkeypatch.setattr(localization, "LOCALES_DIR", tmp_path)
+    localization._CATALOG.clear()
+    yield tmp_path
+    localization._CATALOG.clear()
+    localization._CATALOG.update(saved)
+
+
+def _write(directory, code: str, table: dict) -> None:
+    (directory / f"{code}.json").write_text(json.dumps(table, ensure_ascii=False), encoding="utf-8")
+
+
+def test_shipped_locales_match_english():
+    base = localization._read_locale("en")
+    for code in localization.available_languages():
+        assert check_locale(code, localization._read_locale(code), base) == []
+
+
+def test_check_locale_reports_missing_extra_and_placeholders():
+    base = {"greet": "Hi {name}", "bye": "Bye"}
+    table = {"greet": "Привет {user}", "extra": "x"}
+
+    problems = check_locale("ru", table, base)
+
+    assert problems == [
+        "ru: missing 1 key(s): bye",
+        "ru: 1 key(s) not in en: extra",
+        "ru: greet placeholders ['user'] != en ['name']",
+    ]
+
+
+def test_check_locale_flags_broken_template():
+    problems = check_locale("ru", {"greet": "Привет {name"}, {"greet": "Hi {name}"})
+    assert problems == ["ru: greet is not a valid format template"]
+
+
+def test_t_falls_back_to_english(locales_dir):
+    _write(locales_dir, "en", {"greet": "Hi", "bye": "Bye"})
+    _write(locales_dir, "ru", {"greet": "Привет", "bye": ""})
+
+    assert t("ru", "greet") == "Привет"
+    assert t("ru", "bye") == "Bye"
+    assert t("de", "greet") == "Hi"
+    assert t("ru", "unknown") == "unknown"
+
+
+def test_reload_locales_swaps_tables_and_notifies(locales_dir, monkeypatch):
+    _write(locales_dir, "en", {"greet": "Hi {name}"})
+    _write(locales_dir, "ru", {"greet": "Привет {name}"})
+    assert t("ru", "greet") == "Привет {name}"
+
+    calls = []
+    monkeypatch.setattr(localization, "_reload_listeners", [lambda: calls.append(1)])
+    _write(locales_dir, "ru", {"greet": "Здравствуйте {user}"})
+
+    codes, problems = reload_locales()
+
+    assert codes == ["en", "ru"]
+    assert problems == ["ru: greet placeholders ['user'] != en ['name']"]
+    assert t("ru", "greet") == "Здравствуйте {user}"
+    assert calls == [1]
+
+
+def test_reload_locales_keeps_old_strings_on_broken_file(locales_dir):
+    _write(locales_dir, "en", {"greet": "Hi"})
+    assert t("en", "greet") == "Hi"
+
+    (locales_dir / "en.json").write_text("{broken", encoding="utf-8")
+    with pytest.raises(json.JSONDecodeError):
+        reload_locales()
+
+    assert t("en", "greet") == "Hi"
@@ -0,0 +1,112 @@
+# tests/test_recruit_queries.py
+import asyncio
+from types import SimpleNamespace
+
+from sqlalchemy import select
+
+from database.cache import user_cache
+from database.db import SessionLocal, engine
+from database.models import User
+from database.service import (
+    bulk_sync_members,
+    get_recruit_overview,
+    get_recruits_page,
+)
+
+
+async def _add_users(*rows: dict) -> None:
+    async with SessionLocal() as session:
+        session.add_all(User(**row) for row in rows)
+        await session.commit()
+
+
+def _member(discord_id: int, name: str, admin: bool = False, bot: bool = False):
+    return SimpleNamespace(
+        id=discord_id,
+        name=name,
+        display_name=name.title(),
+        bot=bot,
+        guild_permissions=SimpleNamespace(administrator=admin),
+    )
+
+
+def test_recruits_page_walks_keyset_by_status():
+    async def scenario():
+        await _add_users(*(
+            {"discord_id": 100 + i, "recruit_status": "ready" if i % 2 else "pending"}
+            for i in range(7)
+        ))
+        pages = []
+        after_id = 0
+        while True:
+            page = await get_recruits_page(status="READY", after_id=after_id, limit=2)
+            if not page:
+                break
+            pages.append([user.discord_id for user in page])
+            after_id = page[-1].id
+        everyone = await get_recruits_page(limit=50)
+        await engine.dispose()
+        return pages, everyone
+
+    pages, everyone = asyncio.run(scenario())
+    assert pages == [[101, 103], [105]]
+    assert [user.discord_id for user in everyone] == list(range(100, 107))
+
+
+def test_recruit_overview_counts_every_status_in_one_query():
+    async def scenario():
+        await _add_users(
+            *({"discord_id": 200 + i, "recruit_status": "ready"} for i in range(5)),
+            {"discord_id": 300, "recruit_status": "done"},
+            {"discord_id": 400, "recruit_status": "pending"},
+        )
+        overview = await get_recruit_overview(["Ready", "done", "rejected"], ids_per_status=3)
+        await engine.dispose()
+        return overview
+
+    overview = asyncio.run(scenario())
+    assert overview["ready"] == {"count": 5, "discord_ids": [200, 201, 202]}
+    assert overview["done"] == {"count": 1, "discord_ids": [300]}
+    assert overview["rejected"] == {"count": 0, "discord_ids": []}
+    assert "pending" not in overview
+
+
+def test_bulk_sync_members_upserts_only_changed_rows():
+    async def scenario():
+        await _add_users(
+            {"discord_id": 1, "username": "alpha", "display_name": "Alpha", "is_admin": False},
+            {"discord_id": 2, "username": "old", "display_name": "Old", "is_admin": False},
+        )
+        user_cache.put(User(discord_id=1))
+        user_cache.put(User(discord_id=2))
+
+        progress = []
+
+        async def report(done, total):
+            progress.append((done, total))
+
+        members = [
+            _member(1, "alpha"),
+            _member(2, "beta", admin=True),
+            _member(3, "gamma"),
+            _member(4, "robot", bot=True),
+        ]
+        summary = await bulk_sync_members(members, chunk_size=2, progress=report)
+
+        async with SessionLocal() as session:
+            result = await session.execute(select(User).order_by(User.discord_id))
+            rows = [(u.discord_id, u.username, u.display_name, u.is_admin) for u in result.scalars()]
+        await engine.dispose()
+        return summary, progress, rows
+
+    summary, progress, rows = asyncio.run(scenario())
+    assert (summary["total"], summary["changed"]) == (3, 2)
+    assert progress == [(2, 3), (3, 3)]
+    assert rows == [
+        (1, "alpha", "Alpha", False),
+        (2, "beta", "Beta", True),
+        (3, "gamma", "Gamma", False),
+    ]
+    # Only rows that were written are dropped from the cache
+    assert user_cache.get(1) is not None
+    assert user_cache.get(2) is None
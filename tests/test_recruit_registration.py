@@ -0,0 +1,110 @@
+# tests/test_recruit_registration.py
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import select
+
+import dms.recruit_channels as recruit_channels
+from database.db import SessionLocal, engine
+from database.models import User
+from database.service import (
+    get_or_create_user_from_member,
+    link_steam,
+    set_recruit_status,
+)
+from database.uow import UnitOfWork, interaction_scope
+
+
+def _member(discord_id: int = 1001):
+    return SimpleNamespace(
+        id=discord_id,
+        name="recruit",
+        display_name="Recruit",
+        guild_permissions=SimpleNamespace(administrator=False),
+    )
+
+
+def _guild():
+    return SimpleNamespace(id=1, get_channel=lambda channel_id: None)
+
+
+async def _stored_user(discord_id: int) -> User:
+    async with SessionLocal() as session:
+        result = await session.execute(select(User).filter_by(discord_id=discord_id))
+        return result.scalar_one()
+
+
+def test_register_keeps_ready_status_after_channel_setup(monkeypatch):
+    member = _member()
+    guild = _guild()
+
+    async def fake_create(guild, member, user):
+        return SimpleNamespace(id=11), SimpleNamespace(id=12)
+
+    monkeypatch.setattr(recruit_channels, "create_recruit_channels", fake_create)
+
+    async def scenario():
+        await link_steam(member.id, "76561198000000000")
+
+        # Same order of calls as RegisterRecruitButton._register
+        async with interaction_scope("register_recruit") as trace:
+            async with UnitOfWork("register_recruit_read") as uow:
+                user = await get_or_create_user_from_member(member, uow=uow)
+            assert user.recruit_status == "pending"
+            _, _, is_new = await recruit_channels.ensure_recruit_channels(
+                guild, member, status="ready"
+            )
+            assert is_new
+
+        stored = await _stored_user(member.id)
+        await engine.dispose()
+        return stored, trace
+
+    stored, trace = asyncio.run(scenario())
+    assert stored.recruit_status == "ready"
+    assert stored.recruit_text_channel_id == 11
+    assert stored.recruit_voice_channel_id == 12
+    assert stored.display_name == "Recruit"
+    # Handler read, read under the channel lock, one write for status and channels
+    assert (trace.units, trace.commits) == (3, 3)
+    assert trace.queries > 0
+
+
+def test_register_stores_status_when_channel_setup_fails(monkeypatch):
+    member = _member(1003)
+    guild = _guild()
+
+    async def failing_create(guild, member, user):
+        raise RuntimeError("no category")
+
+    monkeypatch.setattr(recruit_channels, "create_recruit_channels", failing_create)
+
+    async def scenario():
+        with pytest.raises(RuntimeError):
+            await recruit_channels.ensure_recruit_channels(guild, member, status="ready")
+        stored = await _stored_user(member.id)
+        await engine.dispose()
+        return stored
+
+    stored = asyncio.run(scenario())
+    assert stored.recruit_status == "ready"
+    assert stored.recruit_text_channel_id is None
+
+
+def test_unit_of_work_commits_profile_and_status_together():
+    member = _member(1002)
+
+    async def scenario():
+        async with UnitOfWork("recruit_status") as uow:
+            await get_or_create_user_from_member(member, uow=uow)
+            await set_recruit_status(member.id, "ready", uow=uow)
+            assert uow.commits == 0
+
+        stored = await _stored_user(member.id)
+        await engine.dispose()
+        return stored
+
+    stored = asyncio.run(scenario())
+    assert stored.recruit_status == "ready"
+    assert stored.username == "recruit"
@@ -0,0 +1,87 @@
+# utils/channels.py
+
+"""Per-guild index of channels the bot uses for a fixed purpose."""
+
+from typing import Callable, Optional
+
+import discord
+
+from config import Config
+
+# Text channel used for leave notices
+GENERAL_CHANNEL_NAME = "general"
+
+
+def _configured(attr: str, kind: type) -> Callable[[discord.abc.GuildChannel], bool]:
+    def matches(channel: discord.abc.GuildChannel) -> bool:
+        channel_id = int(getattr(Config, attr, 0) or 0)
+        return bool(channel_id) and channel.id == channel_id and isinstance(channel, kind)
+    return matches
+
+
+def _named(name: str, kind: type) -> Callable[[discord.abc.GuildChannel], bool]:
+    def matches(channel: discord.abc.GuildChannel) -> bool:
+        return channel.name == name and isinstance(channel, kind)
+    return matches
+
+
+PURPOSES: dict[str, Callable[[discord.abc.GuildChannel], bool]] = {
+    "general": _named(GENERAL_CHANNEL_NAME, discord.TextChannel),
+    "fallback": _configured("FALLBACK_CHANNEL_ID", discord.abc.Messageable),
+    "recruit_category": _configured("RECRUIT_CATEGORY_ID", discord.CategoryChannel),
+    "archive_category": _configured("RECRUIT_ARCHIVE_CATEGORY_ID", discord.CategoryChannel),
+}
+
+
+class ChannelIndex:
+    """
+    Maps (guild, purpose) to a channel id, resolved on first use with one scan.
+    Channel create / update / delete events drop the affected entries so the next
+    lookup rescans; every other lookup is a dict hit plus guild.get_channel.
+    """
+
+    def __init__(self):
+        # guild_id -> purpose -> channel id (None when no channel matches)
+        self._guilds: dict[int, dict[str, Optional[int]]] = {}
+
+    def get(self, guild: discord.Guild, purpose: str) -> Optional[discord.abc.GuildChannel]:
+        """Return the channel serving purpose in guild, or None."""
+        entry = self._guilds.setdefault(guild.id, {})
+        if purpose not in entry:
+            entry[purpose] = self._resolve(guild, purpose)
+
+        channel_id = entry[purpose]
+        return guild.get_channel(channel_id) if channel_id else None
+
+    @staticmethod
+    def _resolve(guild: discord.Guild, purpose: str) -> Optional[int]:
+        matches = PURPOSES[purpose]
+        # Sorted by position, so a name match picks the same channel as discord.utils.get
+        channels = guild.text_channels if purpose == "general" else guild.channels
+        for channel in channels:
+            if matches(channel):
+                return channel.id
+        return None
+
+    def _invalidate(self, channel: discord.abc.GuildChannel, *candidates: discord.abc.GuildChannel) -> None:
+        entry = self._guilds.get(channel.guild.id)
+        if not entry:
+            return
+        for purpose, matches in PURPOSES.items():
+            if entry.get(purpose) == channel.id or any(matches(c) for c in candidates):
+                entry.pop(purpose, None)
+
+    def channel_created(self, channel: discord.abc.GuildChannel) -> None:
+        self._invalidate(channel, channel)
+
+    def channel_updated(self, before: discord.abc.GuildChannel, after: discord.abc.GuildChannel) -> None:
+        self._invalidate(after, before, after)
+
+    def channel_deleted(self, channel: discord.abc.GuildChannel) -> None:
+        self._invalidate(channel)
+
+    def forget_guild(self, guild_id: int) -> None:
+        self._guilds.pop(guild_id, None)
+
+
+channel_index = ChannelIndex()
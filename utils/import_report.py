@@ -0,0 +1,62 @@
+# utils/import_report.py
+
+"""
+Import-time report for `python bot.py --import-report`.
+
+Runs the imports in a child interpreter with -X importtime and prints the
+slowest modules, plus whether the database / migration import path pulls in
+the localization catalog.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+# Repository root, so "import bot" resolves regardless of the working directory
+_ROOT = Path(__file__).resolve().parent.parent
+
+# Import targets profiled by the report: (label, statement)
+_TARGETS = (
+    ("bot", "import bot"),
+    ("database / migrations", "import database.models"),
+)
+
+
+def _importtime(statement: str) -> list[tuple[int, int, str]]:
+    """Return (self_us, cumulative_us, module) rows from -X importtime."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        cwd=_ROOT,
+    )
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue
+        rows.append((int(parts[0]), int(parts[1]), parts[2].strip()))
+    if proc.returncode != 0:
+        print(proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else "import failed", file=sys.stderr)
+    return rows
+
+
+def run_import_report(top: int = 25) -> int:
+    for label, statement in _TARGETS:
+        rows = _importtime(statement)
+        if not rows:
+            print(f"[{label}] no import data")
+            continue
+
+        total_ms = max(cumulative for _, cumulative, _ in rows) / 1000
+        print(f"[{label}] {statement}: {len(rows)} modules, {total_ms:.1f} ms")
+        for self_us, cumulative_us, module in sorted(rows, key=lambda r: r[0], reverse=True)[:top]:
+            print(f"  {self_us / 1000:8.1f} ms self {cumulative_us / 1000:8.1f} ms cumulative  {module}")
+
+        modules = {module for _, _, module in rows}
+        loaded = "yes" if "dms.localization" in modules else "no"
+        print(f"  dms.localization imported: {loaded}")
+        print()
+    return 0
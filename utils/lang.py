@@ -4,20 +4,20 @@
 
 import discord
 
-from database.service import get_or_create_user, get_or_create_user_from_member
+from database.service import get_user_language
 
 
-def get_lang_for_member(member: discord.Member) -> str:
+async def get_lang_for_member(member: discord.Member) -> str:
     """
     Return the stored language for a guild member, or "en" if none is set.
+    Read-only: never creates or updates the user record.
     """
-    user = get_or_create_user_from_member(member)
-    return user.language or "en"
+    return await get_user_language(member.id) or "en"
 
 
-def get_lang_for_user(user: discord.abc.User) -> str:
+async def get_lang_for_user(user: discord.abc.User) -> str:
     """
     Return the stored language for a Discord user by ID, or "en" if none is set.
+    Read-only: never creates or updates the user record.
     """
-    db_user = get_or_create_user(user.id)
-    return db_user.language or "en"
+    return await get_user_language(user.id) or "en"
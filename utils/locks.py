@@ -0,0 +1,88 @@
+# utils/locks.py
+
+"""Keyed asyncio locks that are released from memory once idle."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Hashable
+
+from sqlalchemy import text
+
+from database.db import engine
+
+
+class _LockEntry:
+    __slots__ = ("lock", "refs")
+
+    def __init__(self):
+        self.lock = asyncio.Lock()
+        # Holders plus waiters; the entry is dropped when this reaches zero
+        self.refs = 0
+
+
+class KeyedLockManager:
+    """
+    One asyncio.Lock per key, created on demand and reclaimed as soon as no task
+    holds or waits for it, so memory is bounded by the number of active keys.
+
+    With advisory=True (PostgreSQL only) the key is also locked with
+    pg_advisory_lock so separate bot processes exclude each other. Advisory keys
+    are hashed together with the manager name, so two managers never block each
+    other. Each held advisory lock pins one pool connection for the whole block,
+    so concurrent holders count against the pool size.
+    """
+
+    def __init__(self, name: str, advisory: bool = False):
+        self.name = name
+        self.advisory = advisory and engine.dialect.name == "postgresql"
+        self._entries: dict[Hashable, _LockEntry] = {}
+        self.acquisitions = 0
+        self.contended = 0
+
+    @asynccontextmanager
+    async def hold(self, key: int):
+        """Hold the lock for key for the duration of the block."""
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._entries[key] = _LockEntry()
+        entry.refs += 1
+        if entry.lock.locked():
+            self.contended += 1
+
+        try:
+            async with entry.lock:
+                self.acquisitions += 1
+                if self.advisory:
+                    async with self._advisory(key):
+                        yield
+                else:
+                    yield
+        finally:
+            entry.refs -= 1
+            if entry.refs == 0:
+                self._entries.pop(key, None)
+
+    @asynccontextmanager
+    async def _advisory(self, key: int):
+        """Hold a PostgreSQL session-level advisory lock on a dedicated connection."""
+        async with engine.connect() as conn:
+            # Waiting for the lock may outlast the pool's statement_timeout; lift
+            # it for this transaction only so the wait is not cancelled
+            await conn.execute(text("SET LOCAL statement_timeout = 0"))
+            params = {"key": f"{self.name}:{key}"}
+            await conn.execute(text("SELECT pg_advisory_lock(hashtextextended(:key, 0))"), params)
+            try:
+                yield
+            finally:
+                await conn.execute(text("SELECT pg_advisory_unlock(hashtextextended(:key, 0))"), params)
+                await conn.commit()
+
+    def stats(self) -> dict:
+        """Return live / waiting lock counts and lifetime counters."""
+        return {
+            "live": len(self._entries),
+            "waiting": sum(max(entry.refs - 1, 0) for entry in self._entries.values()),
+            "acquisitions": self.acquisitions,
+            "contended": self.contended,
+            "advisory": self.advisory,
+        }
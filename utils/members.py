@@ -0,0 +1,126 @@
+# utils/members.py
+
+"""Guild member lookup shared by buttons and commands."""
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Optional
+
+import discord
+
+from config import Config
+
+
+class MemberResolver:
+    """
+    Resolve guild members from the gateway cache, falling back to one REST fetch.
+
+    - concurrent fetches for the same (guild, user) share a single request
+    - fetched members are kept for cache_ttl seconds (fetch_member does not fill
+      the guild cache), so repeated clicks by an uncached member stay local
+    - "not in guild" answers are remembered for missing_ttl seconds
+    """
+
+    def __init__(self, max_size: int, cache_ttl: float, missing_ttl: float):
+        self.max_size = max_size
+        self.cache_ttl = cache_ttl
+        self.missing_ttl = missing_ttl
+        # (guild_id, user_id) -> (member or None for "not in guild", expires_at)
+        self._entries: OrderedDict[tuple[int, int], tuple[Optional[discord.Member], float]] = OrderedDict()
+        self._inflight: dict[tuple[int, int], asyncio.Task] = {}
+
+        self.gateway_hits = 0
+        self.cache_hits = 0
+        self.missing_hits = 0
+        self.coalesced = 0
+        self.rest_fetches = 0
+
+    async def resolve(
+        self,
+        guild: discord.Guild,
+        user_id: int,
+        fresh: bool = False,
+    ) -> Optional[discord.Member]:
+        """
+        Return the member for user_id in guild, or None if they are not in it.
+        fresh=True skips members kept from earlier REST fetches (their roles may
+        be outdated), e.g. before rewriting a member's role list.
+        """
+        member = guild.get_member(user_id)
+        if member is not None:
+            self.gateway_hits += 1
+            return member
+
+        key = (guild.id, user_id)
+        entry = None if fresh else self._entries.get(key)
+        if entry is not None:
+            cached, expires_at = entry
+            if expires_at > time.monotonic():
+                if cached is None:
+                    self.missing_hits += 1
+                else:
+                    self.cache_hits += 1
+                return cached
+            self._entries.pop(key, None)
+
+        task = self._inflight.get(key)
+        if task is not None:
+            self.coalesced += 1
+        else:
+            task = asyncio.create_task(self._fetch(guild, user_id))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+        # Shield so one cancelled caller does not cancel the fetch for the others
+        return await asyncio.shield(task)
+
+    async def _fetch(self, guild: discord.Guild, user_id: int) -> Optional[discord.Member]:
+        self.rest_fetches += 1
+        try:
+            member = await guild.fetch_member(user_id)
+        except discord.NotFound:
+            self._remember((guild.id, user_id), None, self.missing_ttl)
+            return None
+        except discord.DiscordException:
+            # Transient failures are not cached
+            return None
+        self._remember((guild.id, user_id), member, self.cache_ttl)
+        return member
+
+    def _remember(self, key: tuple[int, int], member: Optional[discord.Member], ttl: float) -> None:
+        self._entries[key] = (member, time.monotonic() + ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def forget(self, guild_id: int, user_id: int) -> None:
+        """Drop any cached answer for a member, e.g. after they join or leave."""
+        self._entries.pop((guild_id, user_id), None)
+
+    def stats(self) -> dict:
+        """Return resolution counters split by source."""
+        return {
+            "size": len(self._entries),
+            "gateway_hits": self.gateway_hits,
+            "cache_hits": self.cache_hits,
+            "missing_hits": self.missing_hits,
+            "coalesced": self.coalesced,
+            "rest_fetches": self.rest_fetches,
+        }
+
+
+member_resolver = MemberResolver(
+    max_size=Config.MEMBER_CACHE_SIZE,
+    cache_ttl=Config.MEMBER_CACHE_TTL,
+    missing_ttl=Config.MEMBER_MISSING_TTL,
+)
+
+
+async def resolve_member(
+    guild: discord.Guild,
+    user_id: int,
+    fresh: bool = False,
+) -> Optional[discord.Member]:
+    """Shortcut for member_resolver.resolve."""
+    return await member_resolver.resolve(guild, user_id, fresh=fresh)
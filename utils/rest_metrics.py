@@ -0,0 +1,154 @@
+# utils/rest_metrics.py
+
+"""Per-route accounting of the Discord REST calls made through discord.py's HTTP client."""
+
+import bisect
+import time
+from contextvars import ContextVar
+from typing import Optional
+
+import aiohttp
+import discord
+
+# Upper bounds (ms) of the latency histogram buckets; the last bucket is open-ended
+LATENCY_BUCKETS_MS = (50, 100, 250, 500, 1000, 2500, 5000)
+
+
+class _CallState:
+    """HTTP attempts made while serving one HTTPClient.request call."""
+
+    __slots__ = ("attempt_seconds", "ratelimited")
+
+    def __init__(self):
+        self.attempt_seconds = 0.0
+        self.ratelimited = 0
+
+
+_current_call: ContextVar[Optional[_CallState]] = ContextVar("rest_call", default=None)
+
+
+class RouteStats:
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.ratelimited = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.wait_ms = 0.0
+        self.histogram = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+
+    def record(self, elapsed_ms: float, wait_ms: float, ratelimited: int, failed: bool) -> None:
+        self.calls += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        self.wait_ms += wait_ms
+        self.ratelimited += ratelimited
+        if failed:
+            self.errors += 1
+        self.histogram[bisect.bisect_left(LATENCY_BUCKETS_MS, elapsed_ms)] += 1
+
+    def percentile(self, fraction: float) -> float:
+        """Upper bound of the bucket holding the given fraction of calls (max_ms for the open bucket)."""
+        target = self.calls * fraction
+        seen = 0
+        for index, count in enumerate(self.histogram):
+            seen += count
+            if seen >= target and count:
+                return LATENCY_BUCKETS_MS[index] if index < len(LATENCY_BUCKETS_MS) else self.max_ms
+        return 0.0
+
+    def summary(self) -> dict:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "ratelimited": self.ratelimited,
+            "avg_ms": self.total_ms / self.calls if self.calls else 0.0,
+            "p95_ms": self.percentile(0.95),
+            "max_ms": self.max_ms,
+            "wait_ms": self.wait_ms,
+        }
+
+
+class RestMetrics:
+    """
+    Wraps HTTPClient.request to count calls and latency per route template
+    (e.g. "POST /channels/{channel_id}/messages"). An aiohttp trace measures
+    the individual HTTP attempts, so 429 responses and the time discord.py
+    spent waiting on rate limits (total minus attempt time) are attributed to
+    the route that caused them.
+    """
+
+    def __init__(self):
+        self.routes: dict[str, RouteStats] = {}
+        self.started_at = time.monotonic()
+
+    def trace_config(self) -> aiohttp.TraceConfig:
+        """TraceConfig to pass to the bot as http_trace."""
+        trace = aiohttp.TraceConfig()
+
+        async def on_request_start(session, ctx, params):
+            ctx.started = time.perf_counter()
+
+        async def on_request_end(session, ctx, params):
+            call = _current_call.get()
+            if call is None:
+                return
+            call.attempt_seconds += time.perf_counter() - getattr(ctx, "started", time.perf_counter())
+            if params.response.status == 429:
+                call.ratelimited += 1
+
+        trace.on_request_start.append(on_request_start)
+        trace.on_request_end.append(on_request_end)
+        return trace
+
+    def install(self, http) -> None:
+        """Instrument an HTTPClient instance (bot.http)."""
+        original = http.request
+
+        async def request(route, **kwargs):
+            key = f"{route.method} {route.path}"
+            call = _CallState()
+            token = _current_call.set(call)
+            started = time.perf_counter()
+            failed = False
+            try:
+                return await original(route, **kwargs)
+            except discord.HTTPException:
+                failed = True
+                raise
+            finally:
+                _current_call.reset(token)
+                elapsed = time.perf_counter() - started
+                stats = self.routes.get(key)
+                if stats is None:
+                    stats = self.routes[key] = RouteStats()
+                stats.record(
+                    elapsed_ms=elapsed * 1000,
+                    wait_ms=max(elapsed - call.attempt_seconds, 0.0) * 1000,
+                    ratelimited=call.ratelimited,
+                    failed=failed,
+                )
+
+        http.request = request
+
+    def top_routes(self, limit: int = 15) -> list[tuple[str, dict]]:
+        """Routes ordered by call count, then by 429s."""
+        ordered = sorted(
+            self.routes.items(),
+            key=lambda item: (item[1].calls, item[1].ratelimited),
+            reverse=True,
+        )
+        return [(route, stats.summary()) for route, stats in ordered[:limit]]
+
+    def totals(self) -> dict:
+        routes = self.routes.values()
+        return {
+            "routes": len(self.routes),
+            "calls": sum(s.calls for s in routes),
+            "ratelimited": sum(s.ratelimited for s in routes),
+            "wait_s": sum(s.wait_ms for s in routes) / 1000,
+            "uptime_min": (time.monotonic() - self.started_at) / 60,
+        }
+
+
+rest_metrics = RestMetrics()
@@ -0,0 +1,127 @@
+# utils/shard_metrics.py
+
+"""Per-shard gateway gauges: event rate, connection history and latency."""
+
+import time
+from typing import Optional
+
+from discord.ext import commands
+
+# Seconds covered by the sliding event-rate window
+RATE_WINDOW = 60
+
+
+class ShardStats:
+    def __init__(self):
+        self.events = 0
+        self.connects = 0
+        self.disconnects = 0
+        self.resumes = 0
+        self.ready_at: Optional[float] = None
+        # One counter per second of the window, tagged with the second it counts
+        self._buckets = [0] * RATE_WINDOW
+        self._stamps = [0] * RATE_WINDOW
+
+    def hit(self, now: int) -> None:
+        self.events += 1
+        index = now % RATE_WINDOW
+        if self._stamps[index] != now:
+            self._stamps[index] = now
+            self._buckets[index] = 0
+        self._buckets[index] += 1
+
+    def rate(self, now: int) -> float:
+        """Events per second over the last RATE_WINDOW seconds."""
+        recent = sum(
+            count for count, stamp in zip(self._buckets, self._stamps)
+            if now - stamp < RATE_WINDOW
+        )
+        return recent / RATE_WINDOW
+
+
+class ShardMetrics:
+    """
+    Counts gateway events per shard by wrapping the connection state's parsers
+    (the same table every shard's websocket dispatches through). Guild events
+    are attributed with Discord's sharding formula, everything else (DMs,
+    READY, user updates) to shard 0, which is where Discord delivers them.
+    Connection events are recorded by the on_shard_* handlers in bot.py.
+    """
+
+    def __init__(self):
+        self.shards: dict[int, ShardStats] = {}
+
+    def shard(self, shard_id: Optional[int]) -> ShardStats:
+        shard_id = shard_id or 0
+        stats = self.shards.get(shard_id)
+        if stats is None:
+            stats = self.shards[shard_id] = ShardStats()
+        return stats
+
+    def install(self, bot: commands.Bot) -> None:
+        """Instrument the gateway parsers of bot (call before bot.start)."""
+        parsers = bot._connection.parsers
+
+        def wrap(event: str, parse):
+            # GUILD_CREATE / UPDATE / DELETE carry the guild as "id"
+            guild_key = "id" if event.startswith("GUILD_") else None
+
+            def counted(data):
+                guild_id = None
+                if isinstance(data, dict):
+                    guild_id = data.get("guild_id") or (data.get(guild_key) if guild_key else None)
+                # shard_count is only known once AutoShardedBot has asked Discord for it
+                shard_count = bot.shard_count or 1
+                shard_id = (int(guild_id) >> 22) % shard_count if guild_id else 0
+                self.shard(shard_id).hit(int(time.monotonic()))
+                return parse(data)
+
+            return counted
+
+        for event, parse in list(parsers.items()):
+            parsers[event] = wrap(event, parse)
+
+    def connected(self, shard_id: Optional[int]) -> None:
+        self.shard(shard_id).connects += 1
+
+    def disconnected(self, shard_id: Optional[int]) -> None:
+        self.shard(shard_id).disconnects += 1
+
+    def resumed(self, shard_id: Optional[int]) -> None:
+        self.shard(shard_id).resumes += 1
+
+    def ready(self, shard_id: Optional[int]) -> None:
+        self.shard(shard_id).ready_at = time.monotonic()
+
+    def snapshot(self, bot: commands.Bot) -> list[dict]:
+        """One row per shard run by this process: latency, guilds, event rate and reconnects."""
+        if isinstance(bot, commands.AutoShardedBot):
+            latencies = dict(bot.latencies)
+        else:
+            latencies = {bot.shard_id or 0: bot.latency}
+
+        guilds: dict[int, int] = {}
+        for guild in bot.guilds:
+            guilds[guild.shard_id] = guilds.get(guild.shard_id, 0) + 1
+
+        now = time.monotonic()
+        rows = []
+        for shard_id in sorted(set(latencies) | set(self.shards)):
+            stats = self.shard(shard_id)
+            latency = latencies.get(shard_id)
+            rows.append({
+                "shard_id": shard_id,
+                # latency is inf until the first heartbeat is acknowledged
+                "latency_ms": latency * 1000 if latency is not None and latency != float("inf") else -1,
+                "guilds": guilds.get(shard_id, 0),
+                "events": stats.events,
+                "rate": stats.rate(int(now)),
+                "connects": stats.connects,
+                "disconnects": stats.disconnects,
+                "resumes": stats.resumes,
+                "ready_min": (now - stats.ready_at) / 60 if stats.ready_at else 0.0,
+            })
+        return rows
+
+
+shard_metrics = ShardMetrics()
@@ -0,0 +1,85 @@
+# utils/single_flight.py
+
+"""Collapse duplicate clicks of the same button by the same user."""
+
+import functools
+from typing import Callable, Optional, Union
+
+import discord
+
+from dms.localization import t
+from utils.lang import get_lang_for_user
+
+
+class InteractionSingleFlight:
+    """
+    Tracks (user_id, action) pairs whose interaction handler is still running.
+    A second interaction for a pair that is in flight is answered with a short
+    ephemeral notice instead of running the handler again. user_id is None for
+    actions shared by all users.
+    """
+
+    def __init__(self):
+        self._active: set[tuple[Optional[int], str]] = set()
+        self.started = 0
+        self.collapsed = 0
+
+    def try_begin(self, user_id: Optional[int], action: str) -> bool:
+        key = (user_id, action)
+        if key in self._active:
+            self.collapsed += 1
+            return False
+        self._active.add(key)
+        self.started += 1
+        return True
+
+    def end(self, user_id: Optional[int], action: str) -> None:
+        self._active.discard((user_id, action))
+
+    def stats(self) -> dict:
+        return {
+            "active": len(self._active),
+            "started": self.started,
+            "collapsed": self.collapsed,
+        }
+
+
+interaction_flights = InteractionSingleFlight()
+
+
+async def _answer_duplicate(interaction: discord.Interaction) -> None:
+    lang = await get_lang_for_user(interaction.user)
+    try:
+        await interaction.response.send_message(
+            t(lang, "interaction_in_progress"),
+            ephemeral=True,
+        )
+    except discord.HTTPException:
+        pass
+
+
+def single_flight(action: Union[str, Callable[[object], str]], per_user: bool = True):
+    """
+    Decorate an item callback (self, interaction) so only one invocation per
+    user and action runs at a time. action is a fixed name or a function of
+    the item, e.g. lambda item: f"game_role:{item.role_id}". With
+    per_user=False only one invocation of the action runs at a time, whoever
+    clicked.
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(self, interaction: discord.Interaction, *args, **kwargs):
+            name = action(self) if callable(action) else action
+            user_id = interaction.user.id if per_user else None
+            if not interaction_flights.try_begin(user_id, name):
+                await _answer_duplicate(interaction)
+                return
+            try:
+                return await func(self, interaction, *args, **kwargs)
+            finally:
+                interaction_flights.end(user_id, name)
+
+        return wrapper
+
+    return decorator